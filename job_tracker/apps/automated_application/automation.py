@@ -1,29 +1,49 @@
 """
 Automated application system core functionality.
 """
+import time
+import uuid
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import statistics
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import time
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, connection, transaction
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import F, Q
 
-from ..linkedin_integration.api.client import LinkedInClient
 from ..linkedin_integration.models import LinkedInJob, JobApplication
 from ..resume_analysis.utils import calculate_job_fit_score, extract_text_from_resume
+from ..resume_analysis.memo import analysis_scope
 from ..cover_letter.generator import generate_cover_letter
 from ..job_matching.algorithm import find_matching_jobs, auto_apply_to_jobs
+from ..job_matching.models import JobMatch
 from .models import AutomatedApplicationSchedule, AutomatedApplicationRun, AutomatedApplicationRunJob
+from .pipeline import Stage, run_pipeline
+from ..instrumentation import RunMetrics, percentile
+from .run_log import RunLog
+from .submission_queue import get_submission_queue
+from ..linkedin_integration.api.ratelimit import track_waits
 
 logger = logging.getLogger(__name__)
 
-def run_automated_application_schedule(schedule_id: int) -> Dict[str, Any]:
+@analysis_scope('automated application run')
+def run_automated_application_schedule(schedule_id: int, submitter: Optional[Any] = None) -> Dict[str, Any]:
     """
     Run an automated application schedule.
     
     Args:
         schedule_id: ID of the schedule to run
+        submitter: Optional stand-in for the LinkedIn client submitting
+            applications, for dry runs; see simulation.dry_run_schedule().
+            Interrupted runs are not resumed, rows shared with other runs are
+            left alone and the result has throughput statistics.
         
     Returns:
         Dictionary with results of the automated application run
@@ -49,194 +69,292 @@ def run_automated_application_schedule(schedule_id: int) -> Dict[str, Any]:
                 'run_id': None
             }
         
-        # Create run record
-        run = AutomatedApplicationRun.objects.create(
-            schedule=schedule,
-            status='running',
-            start_time=timezone.now()
-        )
-        
-        # Initialize log
-        log = [f"Started automated application run for schedule '{schedule.name}' at {run.start_time}"]
+        # Resume an interrupted run of this schedule instead of searching and submitting again
+        run = None if submitter is not None else schedule.runs.filter(status='running').order_by('-start_time').first()
+        if run is not None and not is_interrupted(run):
+            return {
+                'success': False,
+                'message': f"A run of schedule '{schedule.name}' is already in progress",
+                'run_id': run.id
+            }
         
-        try:
-            # Find matching jobs
-            log.append(f"Searching for jobs with keywords: {schedule.keywords or 'Not specified'}, "
-                      f"location: {schedule.location or 'Not specified'}, "
-                      f"company: {schedule.company or 'Not specified'}, "
-                      f"job type: {schedule.job_type or 'Not specified'}")
-            
-            matching_jobs = find_matching_jobs(
-                user=user,
-                keywords=schedule.keywords,
-                location=schedule.location,
-                company=schedule.company,
-                job_type=schedule.job_type,
-                min_score=schedule.min_match_score
+        if run is not None:
+            log = RunLog.resume(run)
+            log.append(f"Resumed interrupted run at {timezone.now()}")
+        else:
+            # Create run record
+            run = AutomatedApplicationRun.objects.create(
+                schedule=schedule,
+                status='running',
+                start_time=timezone.now(),
+                checkpoint_at=timezone.now()
             )
             
-            run.jobs_found = len(matching_jobs)
-            log.append(f"Found {run.jobs_found} matching jobs with score >= {schedule.min_match_score}")
-            
-            # Limit to max applications per run
-            matching_jobs = matching_jobs[:schedule.max_applications_per_run]
-            log.append(f"Processing up to {len(matching_jobs)} jobs (max per run: {schedule.max_applications_per_run})")
-            
-            # Process matching jobs
-            for match_data in matching_jobs:
-                job = match_data['job']
-                job_match = match_data['job_match']
-                match_score = match_data['match_score']
-                
-                # Create run job record
-                run_job = AutomatedApplicationRunJob.objects.create(
-                    run=run,
-                    job=job,
-                    job_match=job_match,
-                    status='pending',
-                    match_score=match_score
-                )
-                
-                # Skip if already applied
-                if JobApplication.objects.filter(user=user, job=job).exists():
-                    run_job.status = 'skipped'
-                    run_job.error_message = "Already applied to this job"
-                    run_job.processed_at = timezone.now()
-                    run_job.save()
-                    log.append(f"Skipped job '{job.title}' at '{job.company}' - Already applied")
-                    continue
+            # Initialize log; lines are stored as run events while the run is in progress
+            log = RunLog(run)
+            log.append(f"Started automated application run for schedule '{schedule.name}' at {run.start_time}")
+        metrics = RunMetrics().start()
+        
+        # Dry runs don't write job details, matches, applications or schedule statistics,
+        # which other runs would have to wait for until the dry run is rolled back
+        persist = submitter is None
+        
+        # Keep the run marked alive between checkpoints, e.g. during a long search;
+        # dry runs are never resumed, so they go without
+        heartbeat = RunHeartbeat(run).start() if persist else None
+        recorded = []
+        
+        try:
+            if run.checkpoint != 'matched':
+                # Find matching jobs
+                log.append(f"Searching for jobs with keywords: {schedule.keywords or 'Not specified'}, "
+                          f"location: {schedule.location or 'Not specified'}, "
+                          f"company: {schedule.company or 'Not specified'}, "
+                          f"job type: {schedule.job_type or 'Not specified'}")
+                log.flush()
                 
-                # Generate cover letter
-                resume_path = user.profile.resume.path
-                cover_letter = generate_cover_letter(
-                    resume_path=resume_path,
-                    job_description=job.description,
-                    applicant_name=user.get_full_name() or user.username,
-                    job_title=job.title,
-                    company_name=job.company
+                matching_jobs = find_matching_jobs(
+                    user=user,
+                    keywords=schedule.keywords,
+                    location=schedule.location,
+                    company=schedule.company,
+                    job_type=schedule.job_type,
+                    min_score=schedule.min_match_score,
+                    max_results=max(settings.AUTOMATED_APPLICATION_SEARCH_RESULTS, schedule.max_applications_per_run),
+                    persist=persist
                 )
                 
-                # Apply for job
-                client = LinkedInClient()
-                user_profile = {
-                    'id': user.id,
-                    'name': user.get_full_name() or user.username,
-                    'email': user.email,
-                    'resume_path': resume_path
-                }
-                
-                run.applications_attempted += 1
+                run.jobs_found = len(matching_jobs)
+                log.append(f"Found {run.jobs_found} matching jobs with score >= {schedule.min_match_score}")
                 
-                # Submit application
-                result = client.apply_for_job(job.job_id, user_profile, cover_letter)
-                run_job.processed_at = timezone.now()
+                # Limit to max applications per run
+                matching_jobs = matching_jobs[:schedule.max_applications_per_run]
+                log.append(f"Processing up to {len(matching_jobs)} jobs (max per run: {schedule.max_applications_per_run})")
                 
-                if result['success']:
-                    # Create application record
-                    application = JobApplication.objects.create(
-                        user=user,
-                        job=job,
-                        cover_letter=cover_letter,
-                        resume_used=user.profile.resume,
-                        fit_score=match_score,
-                        status='submitted',
-                        application_id=result['data'].get('application_id')
-                    )
-                    
-                    # Update run job
-                    run_job.status = 'applied'
-                    run_job.application = application
-                    run_job.save()
-                    
-                    # Update job match
-                    job_match.status = 'applied'
-                    job_match.save()
+                # Checkpoint the matched jobs, so a resumed run does not search again
+                with metrics.stage('prepare'), transaction.atomic():
+                    AutomatedApplicationRunJob.objects.bulk_create([
+                        AutomatedApplicationRunJob(
+                            run=run,
+                            job=match_data['job'],
+                            job_match=match_data['job_match'],
+                            status='pending',
+                            match_score=match_data['match_score'],
+                            idempotency_key=submission_key(user.id, match_data['job'].job_id)
+                        )
+                        for match_data in matching_jobs
+                    ])
+                    save_checkpoint(run, 'jobs_found', stage='matched')
+            
+            # Collect jobs still to process, skipping jobs already applied to
+            pending_jobs = []
+            with metrics.stage('prepare'):
+                run_jobs = list(run.jobs.filter(status='pending').select_related('job', 'job_match'))
+                applied_job_ids = set(JobApplication.objects.filter(
+                    user=user, job__in=[run_job.job for run_job in run_jobs]
+                ).values_list('job_id', flat=True))
+                skipped = []
+                for run_job in run_jobs:
+                    job = run_job.job
                     
-                    run.applications_successful += 1
-                    log.append(f"Successfully applied to '{job.title}' at '{job.company}'")
-                else:
-                    # Update run job
-                    run_job.status = 'failed'
-                    run_job.error_message = result['message']
-                    run_job.save()
+                    # Skip if already applied
+                    if job.id in applied_job_ids:
+                        run_job.status = 'skipped'
+                        run_job.error_message = "Already applied to this job"
+                        run_job.processed_at = timezone.now()
+                        skipped.append(run_job)
+                        log.append(f"Skipped job '{job.title}' at '{job.company}' - Already applied")
+                        continue
                     
-                    log.append(f"Failed to apply to '{job.title}' at '{job.company}': {result['message']}")
-                
-                # Add delay between applications to avoid rate limiting
-                time.sleep(2)
+                    pending_jobs.append({
+                        'job': job,
+                        'job_match': run_job.job_match,
+                        'match_score': run_job.match_score,
+                        'run_job': run_job,
+                        'metrics': {}
+                    })
+                AutomatedApplicationRunJob.objects.bulk_update(skipped, ['status', 'error_message', 'processed_at'])
             
-            # Update schedule statistics
-            schedule.last_run = run.start_time
-            schedule.total_applications += run.applications_attempted
-            schedule.successful_applications += run.applications_successful
+            resume_path = user.profile.resume.path
+            user_profile = {
+                'id': user.id,
+                'name': user.get_full_name() or user.username,
+                'email': user.email,
+                'resume_path': resume_path
+            }
             
-            # Calculate next run time
-            if schedule.frequency == 'daily':
-                schedule.next_run = timezone.now().replace(
-                    hour=schedule.time_of_day.hour,
-                    minute=schedule.time_of_day.minute,
-                    second=0,
-                    microsecond=0
-                ) + timedelta(days=1)
-            elif schedule.frequency == 'weekly':
-                # Find next day of week to run
-                today = timezone.now().weekday()  # 0 is Monday
-                days_of_week = sorted(schedule.days_of_week)
-                
-                next_day = None
-                for day in days_of_week:
-                    if day > today:
-                        next_day = day
-                        break
+            # Submissions go through the process-wide fair queue, which takes turns between users
+            # and waits for the shared rate limits; dry runs submit to their stand-in directly
+            submissions = get_submission_queue() if submitter is None else None
+            
+            # Workers time their own stage per job; the run sums them up when recording
+            def write_cover_letter(item):
+                job = item['job']
+                start = time.perf_counter()
+                try:
+                    item['cover_letter'] = generate_cover_letter(
+                        resume_path=resume_path,
+                        job_description=job.description,
+                        applicant_name=user_profile['name'],
+                        job_title=job.title,
+                        company_name=job.company
+                    )
+                finally:
+                    item['metrics']['letter'] = time.perf_counter() - start
+            
+            def submit_application(item):
+                # Jobs not recorded before an interruption are submitted again under the
+                # same key when the run resumes, and applied once upstream
+                start = time.perf_counter()
+                if submissions is None:
+                    try:
+                        with track_waits() as waits:
+                            item['result'] = submitter.apply_for_job(
+                                item['job'].job_id, user_profile, item['cover_letter'],
+                                idempotency_key=item['run_job'].idempotency_key
+                            )
+                    finally:
+                        item['metrics']['rate_limit_wait'] = sum(waits)
+                        item['metrics']['submit'] = time.perf_counter() - start - item['metrics']['rate_limit_wait']
+                    return
                 
-                if next_day is None and days_of_week:
-                    # Wrap around to next week
-                    next_day = days_of_week[0]
-                    days_ahead = 7 - today + next_day
-                else:
-                    days_ahead = next_day - today
+                submission = submissions.submit(
+                    user.id, item['job'].job_id, user_profile, item['cover_letter'],
+                    idempotency_key=item['run_job'].idempotency_key,
+                    priority=item['match_score'] or 0.0,
+                    max_wait=settings.AUTOMATED_APPLICATION_SUBMIT_DEADLINE
+                )
+                try:
+                    item['result'] = submission.result()
+                finally:
+                    item['metrics']['queue_wait'] = submission.queue_wait
+                    item['metrics']['rate_limit_wait'] = submission.rate_limit_wait
+                    item['metrics']['submit'] = max(
+                        0.0, time.perf_counter() - start - submission.queue_wait - submission.rate_limit_wait
+                    )
+            
+            # Write cover letters for upcoming jobs while earlier applications wait for
+            # the submission rate limit; results are recorded on this thread
+            stages = [
+                Stage('cover letter', write_cover_letter, settings.AUTOMATED_APPLICATION_LETTER_WORKERS),
+                Stage('submit', submit_application, settings.AUTOMATED_APPLICATION_SUBMIT_WORKERS),
+            ]
+            log.flush()
+            
+            # Outcomes are written in batches, a fixed number of statements each, once the batch
+            # is full or its first outcome has waited AUTOMATED_APPLICATION_RECORD_MAX_DELAY;
+            # jobs not recorded before an interruption are resubmitted under their key
+            pipeline_start = time.monotonic()
+            first_unrecorded = None
+            for item, error in run_pipeline(pending_jobs, stages, settings.AUTOMATED_APPLICATION_PIPELINE_QUEUE_SIZE):
+                # Stage times measured on the workers add up across overlapping jobs
+                for name, seconds in item['metrics'].items():
+                    metrics.add(name, seconds)
                 
-                if next_day is not None:
-                    schedule.next_run = timezone.now().replace(
-                        hour=schedule.time_of_day.hour,
-                        minute=schedule.time_of_day.minute,
-                        second=0,
-                        microsecond=0
-                    ) + timedelta(days=days_ahead)
+                with metrics.stage('record'):
+                    job = item['job']
+                    run_job = item['run_job']
+                    run_job.processed_at = timezone.now()
+                    run_job.cover_letter = item.get('cover_letter')
+                    run_job.metrics = {name: round(seconds, 4) for name, seconds in item['metrics'].items()}
+                    recorded.append(item)
+                    if first_unrecorded is None:
+                        first_unrecorded = time.monotonic()
+                    
+                    if error is not None:
+                        run_job.status = 'failed'
+                        run_job.error_message = str(error)
+                        log.error(f"Failed to apply to '{job.title}' at '{job.company}': {str(error)}")
+                    elif item['result']['success']:
+                        run_job.status = 'applied'
+                        log.append(f"Successfully applied to '{job.title}' at '{job.company}'")
+                    else:
+                        run_job.status = 'failed'
+                        run_job.error_message = item['result']['message']
+                        log.error(f"Failed to apply to '{job.title}' at '{job.company}': {item['result']['message']}")
+                    
+                    if (len(recorded) >= settings.AUTOMATED_APPLICATION_RECORD_BATCH_SIZE
+                            or time.monotonic() - first_unrecorded >= settings.AUTOMATED_APPLICATION_RECORD_MAX_DELAY):
+                        record_outcomes(run, user, recorded, persist)
+                        log.flush()
+                        recorded = []
+                        first_unrecorded = None
             
-            schedule.save()
+            if recorded:
+                with metrics.stage('record'):
+                    record_outcomes(run, user, recorded, persist)
+                    recorded = []
+            pipeline_time = time.monotonic() - pipeline_start
             
             # Complete run
             run.status = 'completed'
             run.end_time = timezone.now()
             log.append(f"Completed run at {run.end_time}. "
                       f"Applied to {run.applications_successful}/{run.applications_attempted} jobs.")
-            run.log = "\n".join(log)
-            run.save()
+            log.flush()
+            run.log = log.text()
+            run.metrics = metrics.stop()
             
-            return {
+            # Statistics are added once: a run is either completed with them or resumed without
+            with transaction.atomic():
+                # Update schedule statistics in place, so concurrent runs don't lose increments,
+                # and leave the scheduler lease renewed meanwhile alone
+                if persist:
+                    AutomatedApplicationSchedule.objects.filter(id=schedule.id).update(
+                        last_run=run.start_time,
+                        total_applications=F('total_applications') + run.applications_attempted,
+                        successful_applications=F('successful_applications') + run.applications_successful,
+                        next_run=compute_next_run(
+                            schedule.frequency, schedule.days_of_week, schedule.time_of_day, timezone.now(),
+                            schedule_offset(schedule.id, schedule.run_offset)
+                        ),
+                        updated_at=timezone.now()
+                    )
+                run.save(update_fields=['status', 'end_time', 'log', 'metrics'])
+            
+            result = {
                 'success': True,
                 'message': f"Successfully completed automated application run. "
                           f"Applied to {run.applications_successful}/{run.applications_attempted} jobs.",
                 'run_id': run.id
             }
+            if submitter is not None:
+                result['stats'] = throughput_stats(
+                    run, len(pending_jobs), sum(1 for item in pending_jobs if item.get('cover_letter')),
+                    pipeline_time, schedule.max_applications_per_run
+                )
+            return result
             
         except Exception as e:
             logger.exception(f"Error in automated application run: {str(e)}")
             
+            # Keep the outcomes of jobs already submitted, as a failed run is not resumed
+            if recorded:
+                try:
+                    record_outcomes(run, user, recorded, persist)
+                except Exception as record_error:
+                    logger.exception(f"Error recording outcomes of failed run: {str(record_error)}")
+            
             # Update run with error
             run.status = 'failed'
             run.end_time = timezone.now()
             run.error_message = str(e)
-            log.append(f"Error: {str(e)}")
-            run.log = "\n".join(log)
-            run.save()
+            log.error(f"Error: {str(e)}")
+            log.flush()
+            run.log = log.text()
+            run.metrics = metrics.stop()
+            run.save(update_fields=['status', 'end_time', 'error_message', 'log', 'metrics'])
             
             return {
                 'success': False,
                 'message': f"Error in automated application run: {str(e)}",
                 'run_id': run.id
             }
+        
+        finally:
+            metrics.stop()
+            if heartbeat is not None:
+                heartbeat.stop()
             
     except AutomatedApplicationSchedule.DoesNotExist:
         return {
@@ -252,96 +370,331 @@ def run_automated_application_schedule(schedule_id: int) -> Dict[str, Any]:
             'run_id': None
         }
 
-def calculate_next_run_times():
+def record_outcomes(run: AutomatedApplicationRun, user, items: List[Dict[str, Any]], persist: bool = True) -> None:
     """
-    Calculate next run times for all active schedules.
+    Write the outcomes of processed jobs of a run.
+    
+    Applications, run jobs, job matches and run counters are written with
+    one statement each, whatever the number of jobs. Counters are
+    incremented in the database, so the run's progress is checkpointed.
+    Jobs the user already has an application for, e.g. made by hand or by
+    an overlapping run, are marked failed instead of failing the batch.
+    
+    Args:
+        run: Run the jobs belong to; its counters are incremented
+        user: User the applications are made for
+        items: Pipeline items whose run job status is set to the outcome
+        persist: Whether to store applications and mark job matches applied;
+            dry runs only record their run jobs
     """
-    try:
-        # Get all active schedules
-        schedules = AutomatedApplicationSchedule.objects.filter(is_active=True)
+    attempted = sum(1 for item in items if 'result' in item)
+    
+    with transaction.atomic():
+        applied = [item for item in items if item['run_job'].status == 'applied']
+        if applied and persist:
+            existing = set(JobApplication.objects.filter(
+                user=user, job__in=[item['job'] for item in applied]
+            ).values_list('job_id', flat=True))
+            for item in applied:
+                if item['job'].id in existing:
+                    item['run_job'].status = 'failed'
+                    item['run_job'].error_message = "Already applied to this job"
+            applied = [item for item in applied if item['job'].id not in existing]
         
-        for schedule in schedules:
-            # Skip if next run is already set
-            if schedule.next_run and schedule.next_run > timezone.now():
-                continue
-            
-            # Calculate next run time
-            now = timezone.now()
-            
-            if schedule.frequency == 'daily':
-                # Set to today at specified time
-                next_run = now.replace(
-                    hour=schedule.time_of_day.hour,
-                    minute=schedule.time_of_day.minute,
-                    second=0,
-                    microsecond=0
+        if applied and persist:
+            # Rows added by another run since the check above are left alone rather than failing the batch
+            JobApplication.objects.bulk_create([
+                JobApplication(
+                    user=user,
+                    job=item['job'],
+                    cover_letter=item['cover_letter'],
+                    resume_used=user.profile.resume,
+                    fit_score=item['match_score'],
+                    status='submitted',
+                    application_id=item['result']['data'].get('application_id')
                 )
-                
-                # If that time has passed today, set to tomorrow
-                if next_run <= now:
-                    next_run += timedelta(days=1)
-            
-            elif schedule.frequency == 'weekly':
-                # Get days of week (0-6, where 0 is Monday)
-                days_of_week = sorted(schedule.days_of_week)
-                
-                if not days_of_week:
-                    # Default to Monday if no days specified
-                    days_of_week = [0]
-                
-                # Find next day to run
-                today = now.weekday()
-                next_day = None
-                
-                for day in days_of_week:
-                    if day > today:
-                        next_day = day
-                        break
-                
-                if next_day is None:
-                    # Wrap around to next week
-                    next_day = days_of_week[0]
-                    days_ahead = 7 - today + next_day
-                else:
-                    days_ahead = next_day - today
-                
-                # Set next run time
-                next_run = now.replace(
-                    hour=schedule.time_of_day.hour,
-                    minute=schedule.time_of_day.minute,
-                    second=0,
-                    microsecond=0
-                ) + timedelta(days=days_ahead)
-                
-                # If today is a run day but the time has passed, check if there's another run day this week
-                if today in days_of_week and schedule.time_of_day.hour <= now.hour and schedule.time_of_day.minute <= now.minute:
-                    for day in days_of_week:
-                        if day > today:
-                            next_day = day
-                            days_ahead = next_day - today
-                            next_run = now.replace(
-                                hour=schedule.time_of_day.hour,
-                                minute=schedule.time_of_day.minute,
-                                second=0,
-                                microsecond=0
-                            ) + timedelta(days=days_ahead)
-                            break
+                for item in applied
+            ], ignore_conflicts=True)
+            ids = dict(JobApplication.objects.filter(
+                user=user, job__in=[item['job'] for item in applied]
+            ).values_list('job_id', 'id'))
+            for item in applied:
+                item['run_job'].application_id = ids[item['job'].id]
             
-            else:  # custom
-                # For custom schedules, just set next run to tomorrow at the specified time
-                next_run = now.replace(
-                    hour=schedule.time_of_day.hour,
-                    minute=schedule.time_of_day.minute,
-                    second=0,
-                    microsecond=0
-                ) + timedelta(days=1)
+            JobMatch.objects.filter(
+                id__in=[item['job_match'].id for item in applied if item['job_match'] is not None]
+            ).update(status='applied', updated_at=timezone.now())
+        
+        AutomatedApplicationRunJob.objects.bulk_update(
+            [item['run_job'] for item in items],
+            ['status', 'application', 'error_message', 'processed_at', 'cover_letter', 'metrics']
+        )
+        AutomatedApplicationRun.objects.filter(id=run.id).update(
+            applications_attempted=F('applications_attempted') + attempted,
+            applications_successful=F('applications_successful') + len(applied),
+            checkpoint_at=timezone.now()
+        )
+    
+    run.applications_attempted += attempted
+    run.applications_successful += len(applied)
+
+def throughput_stats(run: AutomatedApplicationRun, jobs_processed: int, letters_written: int,
+                     pipeline_time: float, max_applications: int) -> Dict[str, Any]:
+    """
+    Compute the throughput of a completed run.
+    
+    Args:
+        run: Completed run with its metrics
+        jobs_processed: Number of jobs passed through the pipeline
+        letters_written: Number of cover letters generated
+        pipeline_time: Seconds from the first job entering the pipeline to the last one recorded
+        max_applications: Applications the schedule makes per run at most
+    
+    Returns:
+        Dictionary with job and letter rates, and the wall time projected
+        for a run processing `max_applications` jobs
+    """
+    jobs_per_second = jobs_processed / pipeline_time if pipeline_time > 0 else 0.0
+    setup_time = max(0.0, run.metrics['wall_time'] - pipeline_time)
+    return {
+        'jobs_found': run.jobs_found,
+        'jobs_processed': jobs_processed,
+        'letters_written': letters_written,
+        'wall_time': run.metrics['wall_time'],
+        'pipeline_time': pipeline_time,
+        'jobs_per_second': jobs_per_second,
+        'letters_per_second': letters_written / pipeline_time if pipeline_time > 0 else 0.0,
+        'projected_wall_time': setup_time + (max_applications / jobs_per_second if jobs_per_second else 0.0),
+        'stages': run.metrics['stages'],
+    }
+
+def submission_key(user_id: int, job_id: str) -> str:
+    """
+    Build the idempotency key of a user's application to a job.
+    
+    The key is the same for every attempt, so the upstream applies repeated
+    submissions of the same application once.
+    """
+    return hashlib.sha256(f"automated_application:{user_id}:{job_id}".encode('utf-8')).hexdigest()
+
+def save_checkpoint(run: AutomatedApplicationRun, *fields: str, stage: Optional[str] = None) -> None:
+    """
+    Save a run's progress.
+    
+    Args:
+        run: Run to checkpoint
+        fields: Names of further run fields to save with the checkpoint
+        stage: Optional checkpoint reached, e.g. 'matched'
+    """
+    if stage is not None:
+        run.checkpoint = stage
+    run.checkpoint_at = timezone.now()
+    run.save(update_fields=['checkpoint', 'checkpoint_at', *fields])
+
+def is_interrupted(run: AutomatedApplicationRun, now: Optional[datetime] = None) -> bool:
+    """
+    Check whether a running run has not been marked alive for
+    AUTOMATED_APPLICATION_RUN_STALE_SECONDS, i.e. its process died; see RunHeartbeat.
+    """
+    now = now or timezone.now()
+    last_progress = run.checkpoint_at or run.start_time
+    return run.status == 'running' and last_progress <= now - timedelta(seconds=settings.AUTOMATED_APPLICATION_RUN_STALE_SECONDS)
+
+class RunHeartbeat:
+    """
+    Background thread marking a run alive while its process works on it.
+    
+    Refreshes the run's checkpoint time every third of
+    AUTOMATED_APPLICATION_RUN_STALE_SECONDS, so is_interrupted() only holds
+    for runs whose process died, however long a stage takes.
+    """
+    def __init__(self, run: AutomatedApplicationRun, interval: Optional[float] = None):
+        self.run_id = run.id
+        self.interval = interval or settings.AUTOMATED_APPLICATION_RUN_STALE_SECONDS / 3
+        self._stopped = threading.Event()
+        self._thread = None
+    
+    def _run(self) -> None:
+        try:
+            while not self._stopped.wait(self.interval):
+                close_old_connections()
+                try:
+                    AutomatedApplicationRun.objects.filter(id=self.run_id, status='running').update(
+                        checkpoint_at=timezone.now()
+                    )
+                except Exception as e:
+                    logger.exception(f"Error refreshing heartbeat of run {self.run_id}: {str(e)}")
+        finally:
+            connection.close()
+    
+    def start(self) -> 'RunHeartbeat':
+        self._thread = threading.Thread(target=self._run, name=f"run-heartbeat-{self.run_id}", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+def recover_interrupted_runs() -> int:
+    """
+    Get interrupted runs resumed.
+    
+    Each schedule's latest interrupted run is resumed by the schedule's next
+    run, which is made due now; older ones and runs of inactive schedules
+    are marked failed.
+    
+    Returns:
+        Number of runs to be resumed
+    """
+    try:
+        now = timezone.now()
+        cutoff = now - timedelta(seconds=settings.AUTOMATED_APPLICATION_RUN_STALE_SECONDS)
+        runs = AutomatedApplicationRun.objects.filter(status='running').filter(
+            Q(checkpoint_at__lte=cutoff) | Q(checkpoint_at__isnull=True, start_time__lte=cutoff)
+        ).select_related('schedule').order_by('-start_time')
+        
+        resumable = set()
+        abandoned = []
+        for run in runs:
+            if run.schedule.is_active and run.schedule_id not in resumable:
+                resumable.add(run.schedule_id)
+            else:
+                abandoned.append(run.id)
+        
+        if abandoned:
+            AutomatedApplicationRun.objects.filter(id__in=abandoned).update(
+                status='failed',
+                end_time=now,
+                error_message="Interrupted and not resumed"
+            )
+        AutomatedApplicationSchedule.objects.filter(id__in=resumable).filter(
+            Q(next_run__gt=now) | Q(next_run__isnull=True)
+        ).update(next_run=now, updated_at=now)
+        
+        if resumable or abandoned:
+            logger.warning(f"Found {len(resumable) + len(abandoned)} interrupted runs; "
+                           f"{len(resumable)} will be resumed")
+        return len(resumable)
+    
+    except Exception as e:
+        logger.exception(f"Error recovering interrupted runs: {str(e)}")
+        return 0
+
+def compute_next_run(frequency: str, days_of_week: Optional[List[int]], time_of_day, now: datetime,
+                     offset: int = 0) -> datetime:
+    """
+    Compute when a schedule should run next.
+    
+    The result depends only on the arguments, so schedules with the same
+    frequency, days, time and offset share it.
+    
+    Args:
+        frequency: 'daily', 'weekly' or 'custom'
+        days_of_week: Days (0-6, where 0 is Monday) for weekly schedules; defaults to Monday
+        time_of_day: Time of day to run at
+        now: Current time
+        offset: Seconds after the time of day to run at, see schedule_offset()
+    
+    Returns:
+        The first run time after `now`
+    """
+    if offset:
+        # Shifting the clock back by the offset keeps a run that is still due today
+        shift = timedelta(seconds=offset)
+        return compute_next_run(frequency, days_of_week, time_of_day, now - shift) + shift
+    
+    at_time = now.replace(hour=time_of_day.hour, minute=time_of_day.minute, second=0, microsecond=0)
+    
+    if frequency == 'daily':
+        return at_time if at_time > now else at_time + timedelta(days=1)
+    
+    if frequency == 'weekly':
+        days = set(days_of_week or []) or {0}
+        today = now.weekday()
+        for days_ahead in range(8):
+            candidate = at_time + timedelta(days=days_ahead)
+            if (today + days_ahead) % 7 in days and candidate > now:
+                return candidate
+    
+    # Custom schedules run the next day at the specified time
+    return at_time + timedelta(days=1)
+
+def schedule_offset(schedule_id: int, run_offset: Optional[int] = None, window: Optional[int] = None) -> int:
+    """
+    Get how many seconds after its time of day a schedule runs.
+    
+    Schedules cluster on round hours, so each one is spread over the
+    AUTOMATED_APPLICATION_JITTER_WINDOW following its time of day. The offset
+    is derived from the schedule's ID, so it is the same on every run and in
+    every process, unless the load planner stored one in `run_offset`.
+    
+    Args:
+        schedule_id: ID of the schedule
+        run_offset: Offset stored on the schedule, if any
+        window: Seconds to spread over; defaults to AUTOMATED_APPLICATION_JITTER_WINDOW
+    
+    Returns:
+        Offset in seconds, less than the window
+    """
+    if window is None:
+        window = settings.AUTOMATED_APPLICATION_JITTER_WINDOW
+    if window <= 0:
+        return 0
+    if run_offset is not None:
+        return min(run_offset, window - 1)
+    digest = hashlib.sha256(f"schedule:{schedule_id}".encode()).digest()
+    return int.from_bytes(digest[:8], 'big') % window
+
+def calculate_next_run_times(batch_size: int = 1000) -> int:
+    """
+    Calculate next run times for active schedules that don't have one.
+    
+    Rows are streamed and written back with bulk_update in batches. The next
+    run before the offset is computed once per distinct frequency, days, time
+    and minute the offset shifts the clock back to, and the offset added.
+    
+    Args:
+        batch_size: Number of schedules read and updated at a time
+    
+    Returns:
+        Number of schedules updated
+    """
+    try:
+        now = timezone.now()
+        next_runs = {}
+        pending = []
+        updated = 0
+        
+        schedules = AutomatedApplicationSchedule.objects.filter(
+            is_active=True,
+            next_run__isnull=True
+        ).values_list('id', 'frequency', 'days_of_week', 'time_of_day', 'run_offset')
+        
+        for schedule_id, frequency, days_of_week, time_of_day, run_offset in schedules.iterator(chunk_size=batch_size):
+            shift = timedelta(seconds=schedule_offset(schedule_id, run_offset))
             
-            # Update schedule
-            schedule.next_run = next_run
-            schedule.save()
+            # Run times fall on whole minutes, so the next run only changes from one minute to the next
+            base_now = (now - shift).replace(second=0, microsecond=0)
+            key = (frequency, tuple(sorted(days_of_week or [])), time_of_day.hour, time_of_day.minute, base_now)
+            if key not in next_runs:
+                next_runs[key] = compute_next_run(frequency, days_of_week, time_of_day, base_now)
+            pending.append(AutomatedApplicationSchedule(id=schedule_id, next_run=next_runs[key] + shift, updated_at=now))
             
+            if len(pending) >= batch_size:
+                AutomatedApplicationSchedule.objects.bulk_update(pending, ['next_run', 'updated_at'])
+                updated += len(pending)
+                pending = []
+        
+        if pending:
+            AutomatedApplicationSchedule.objects.bulk_update(pending, ['next_run', 'updated_at'])
+            updated += len(pending)
+        
+        return updated
+    
     except Exception as e:
         logger.exception(f"Error calculating next run times: {str(e)}")
+        return 0
 
 def get_due_schedules():
     """
@@ -353,11 +706,13 @@ def get_due_schedules():
     try:
         now = timezone.now()
         
-        # Get active schedules with next_run in the past or null
+        # Get active schedules with next_run in the past or null, not leased by a scheduler
         due_schedules = AutomatedApplicationSchedule.objects.filter(
             is_active=True
         ).filter(
             Q(next_run__lte=now) | Q(next_run__isnull=True)
+        ).filter(
+            Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lte=now)
         )
         
         return [schedule.id for schedule in due_schedules]
@@ -365,3 +720,127 @@ def get_due_schedules():
     except Exception as e:
         logger.exception(f"Error getting due schedules: {str(e)}")
         return []
+
+def _user_lock_key(user_id: int) -> str:
+    return f"automated_application:user:{user_id}"
+
+def run_user_schedules(user_id: int, schedule_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Run a user's due schedules one after another.
+    
+    A cache lock keeps runs for the same user from overlapping, including
+    runs started by another scheduler process when the cache is shared.
+    
+    Args:
+        user_id: ID of the user owning the schedules
+        schedule_ids: IDs of the schedules to run
+    
+    Returns:
+        List of run results, each with the schedule ID and its duration in seconds
+    """
+    lock_key = _user_lock_key(user_id)
+    token = uuid.uuid4().hex
+    if not cache.add(lock_key, token, settings.AUTOMATED_APPLICATION_USER_LOCK_TIMEOUT):
+        return [{
+            'success': False,
+            'message': f"Another automated application run for user {user_id} is in progress",
+            'run_id': None,
+            'schedule_id': schedule_id,
+            'duration': 0.0
+        } for schedule_id in schedule_ids]
+    
+    results = []
+    try:
+        for schedule_id in schedule_ids:
+            start = time.perf_counter()
+            result = run_automated_application_schedule(schedule_id)
+            results.append({**result, 'schedule_id': schedule_id, 'duration': time.perf_counter() - start})
+    finally:
+        # A run outliving the lock timeout must not release a lock another process has since taken
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+    return results
+
+def _run_user_schedules_in_thread(user_id: int, schedule_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Run a user's schedules in a worker thread, closing its database connection afterwards.
+    """
+    try:
+        return run_user_schedules(user_id, schedule_ids)
+    finally:
+        connection.close()
+
+def run_due_schedules(schedule_ids: List[int], workers: int = 1,
+                      on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Run due schedules, several users at a time.
+    
+    Schedules are grouped by user. Each user's schedules run in order on one
+    worker, so a user never has two runs at once, while up to `workers` users
+    (capped by AUTOMATED_APPLICATION_MAX_WORKERS) are processed concurrently.
+    
+    Args:
+        schedule_ids: IDs of the schedules to run
+        workers: Number of worker threads
+        on_result: Optional callback receiving each schedule's result as it completes
+    
+    Returns:
+        Dictionary with the run results and a summary of wall time and per-schedule latency
+    """
+    start = time.perf_counter()
+    
+    by_user = OrderedDict()
+    owners = dict(AutomatedApplicationSchedule.objects.filter(id__in=schedule_ids).values_list('id', 'user_id'))
+    for schedule_id in schedule_ids:
+        # Unknown schedules are still run so they report that they do not exist
+        by_user.setdefault(owners.get(schedule_id, f"schedule:{schedule_id}"), []).append(schedule_id)
+    
+    workers = max(1, min(workers, settings.AUTOMATED_APPLICATION_MAX_WORKERS, len(by_user) or 1))
+    results = []
+    
+    def collect(user_results):
+        for result in user_results:
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    
+    if workers == 1:
+        for user_id, user_schedule_ids in by_user.items():
+            collect(run_user_schedules(user_id, user_schedule_ids))
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='automated-application') as executor:
+            futures = [
+                executor.submit(_run_user_schedules_in_thread, user_id, user_schedule_ids)
+                for user_id, user_schedule_ids in by_user.items()
+            ]
+            for future in as_completed(futures):
+                collect(future.result())
+    
+    return {
+        'results': results,
+        'summary': summarize_results(results, workers, time.perf_counter() - start)
+    }
+
+def summarize_results(results: List[Dict[str, Any]], workers: int, wall_time: float) -> Dict[str, Any]:
+    """
+    Summarize schedule run results with wall time and per-schedule latency.
+    
+    Args:
+        results: Run results with their 'duration' in seconds
+        workers: Number of workers the schedules ran on
+        wall_time: Total elapsed time in seconds
+    
+    Returns:
+        Dictionary with result counts and latency percentiles
+    """
+    durations = [result['duration'] for result in results]
+    return {
+        'schedules': len(results),
+        'succeeded': sum(1 for result in results if result['success']),
+        'failed': sum(1 for result in results if not result['success']),
+        'workers': workers,
+        'wall_time': wall_time,
+        'latency_p50': statistics.median(durations) if durations else 0.0,
+        'latency_p95': percentile(durations, 0.95) if durations else 0.0,
+        'latency_max': max(durations, default=0.0),
+    }
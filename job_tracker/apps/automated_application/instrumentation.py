@@ -0,0 +1,50 @@
+"""
+Aggregation of the metrics stored on automated application runs.
+"""
+import statistics
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Tuple
+
+from ..instrumentation import percentile
+
+def summarize_run_metrics(runs: Iterable[Tuple[datetime, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Aggregate run metrics into per-stage p50/p95 durations by day.
+    
+    Args:
+        runs: (start time, metrics) pairs of runs
+    
+    Returns:
+        Dictionary with overall and per-day statistics per stage, plus wall
+        time, query count and peak memory
+    """
+    def collect(samples: Dict[str, List[float]], metrics: Dict[str, Any]) -> None:
+        for name, seconds in metrics.get('stages', {}).items():
+            samples[name].append(seconds)
+        for name in ('wall_time', 'total_queries', 'peak_memory_kb'):
+            if metrics.get(name) is not None:
+                samples[name].append(metrics[name])
+    
+    def describe(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {
+                'count': len(values),
+                'p50': statistics.median(values),
+                'p95': percentile(values, 0.95),
+            }
+            for name, values in sorted(samples.items())
+        }
+    
+    overall = defaultdict(list)
+    by_day = defaultdict(lambda: defaultdict(list))
+    for start_time, metrics in runs:
+        if not metrics:
+            continue
+        collect(overall, metrics)
+        collect(by_day[start_time.date().isoformat()], metrics)
+    
+    return {
+        'overall': describe(overall),
+        'by_day': {day: describe(samples) for day, samples in sorted(by_day.items())},
+    }
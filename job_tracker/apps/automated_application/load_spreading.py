@@ -0,0 +1,164 @@
+"""
+Spreading of schedule runs over time.
+
+Schedules default to running at round hours, so runs arrive in spikes.
+Each schedule already runs at a deterministic offset within the jitter
+window after its time of day (see schedule_offset()), which spreads one
+cluster evenly. The planner goes further: it assigns offsets so that the
+projected number of runs per minute of the day is as flat as the window
+allows, also where clusters of neighbouring times overlap, and stores them
+on the schedules.
+"""
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import AutomatedApplicationSchedule
+from .automation import schedule_offset
+
+logger = logging.getLogger(__name__)
+
+MINUTES_PER_DAY = 24 * 60
+
+def _runs_per_day(frequency: str, days_of_week: Optional[List[int]]) -> float:
+    """
+    Get the average number of runs per day of a schedule over a week.
+    """
+    if frequency == 'weekly':
+        return len(set(days_of_week or []) or {0}) / 7
+    return 1.0
+
+def _minute_of_day(time_of_day, offset: int = 0) -> int:
+    return (time_of_day.hour * 60 + time_of_day.minute + offset // 60) % MINUTES_PER_DAY
+
+def _describe(load: List[float]) -> Dict[str, Any]:
+    peak = max(range(MINUTES_PER_DAY), key=lambda minute: load[minute])
+    return {
+        'peak_runs_per_minute': round(load[peak], 2),
+        'peak_minute': f"{peak // 60:02d}:{peak % 60:02d}",
+        'busy_minutes': sum(1 for runs in load if runs > 0),
+    }
+
+def plan_run_offsets(window: Optional[int] = None, apply: bool = False, batch_size: int = 1000) -> Dict[str, Any]:
+    """
+    Plan run offsets of active schedules that flatten the daily run profile.
+    
+    Schedules are placed one at a time, by time of day, in the least loaded
+    minute of their window; ties go to the minute of their default offset, so
+    a schedule keeps its offset unless moving it lowers the peak. The daily
+    profile weighs weekly schedules by the share of days they run on.
+    
+    Args:
+        window: Seconds to spread over; defaults to AUTOMATED_APPLICATION_JITTER_WINDOW
+        apply: Whether to store the planned offsets and move upcoming runs accordingly
+        batch_size: Number of schedules updated at a time
+    
+    Returns:
+        Dictionary with the peak of the daily profile without spreading, with
+        the current offsets and with the planned ones, and the number of
+        schedules whose offset changed
+    """
+    if window is None:
+        window = settings.AUTOMATED_APPLICATION_JITTER_WINDOW
+    window_minutes = max(1, window // 60)
+    
+    schedules = list(AutomatedApplicationSchedule.objects.filter(is_active=True).values_list(
+        'id', 'frequency', 'days_of_week', 'time_of_day', 'run_offset', 'next_run'
+    ))
+    
+    unspread = [0.0] * MINUTES_PER_DAY
+    current = [0.0] * MINUTES_PER_DAY
+    planned = [0.0] * MINUTES_PER_DAY
+    placements: List[Tuple[int, int, int, float]] = []
+    for schedule_id, frequency, days_of_week, time_of_day, run_offset, _ in schedules:
+        weight = _runs_per_day(frequency, days_of_week)
+        unspread[_minute_of_day(time_of_day)] += weight
+        current[_minute_of_day(time_of_day, schedule_offset(schedule_id, run_offset, window))] += weight
+        placements.append((_minute_of_day(time_of_day), schedule_offset(schedule_id, None, window), schedule_id, weight))
+    
+    offsets = {}
+    for base, default_offset, schedule_id, weight in sorted(placements):
+        preferred = default_offset // 60
+        slot = min(range(window_minutes), key=lambda slot: (
+            planned[(base + slot) % MINUTES_PER_DAY], abs(slot - preferred)
+        ))
+        planned[(base + slot) % MINUTES_PER_DAY] += weight
+        # Keep the seconds of the default offset, so runs within a minute are spread too
+        offsets[schedule_id] = min(slot * 60 + default_offset % 60, max(0, window - 1))
+    
+    changed = [
+        (schedule_id, time_of_day, run_offset, next_run)
+        for schedule_id, _, _, time_of_day, run_offset, next_run in schedules
+        if schedule_offset(schedule_id, run_offset, window) != offsets[schedule_id]
+    ]
+    if apply and window > 0:
+        _store_offsets(changed, offsets, window, batch_size)
+    
+    return {
+        'schedules': len(schedules),
+        'window': window,
+        'changed': len(changed),
+        'applied': apply and window > 0,
+        'unspread': _describe(unspread),
+        'current': _describe(current),
+        'planned': _describe(planned),
+    }
+
+def _store_offsets(changed, offsets: Dict[int, int], window: int, batch_size: int) -> None:
+    now = timezone.now()
+    pending = []
+    for schedule_id, time_of_day, run_offset, next_run in changed:
+        schedule = AutomatedApplicationSchedule(id=schedule_id, run_offset=offsets[schedule_id],
+                                                next_run=next_run, updated_at=now)
+        
+        # Move the upcoming run by the change in offset, so it stays the same occurrence;
+        # runs that are due, recovered or started by hand are left alone
+        if next_run is not None and next_run > now:
+            base = next_run - timedelta(seconds=schedule_offset(schedule_id, run_offset, window))
+            if (base.hour, base.minute, base.second) == (time_of_day.hour, time_of_day.minute, 0):
+                schedule.next_run = base + timedelta(seconds=offsets[schedule_id])
+        pending.append(schedule)
+        
+        if len(pending) >= batch_size:
+            AutomatedApplicationSchedule.objects.bulk_update(pending, ['run_offset', 'next_run', 'updated_at'])
+            pending = []
+    
+    if pending:
+        AutomatedApplicationSchedule.objects.bulk_update(pending, ['run_offset', 'next_run', 'updated_at'])
+
+def expected_runs_per_minute(hours: int = 24, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Count the runs of active schedules due in each minute of the coming hours.
+    
+    Args:
+        hours: Number of hours ahead to look
+        now: Current time
+    
+    Returns:
+        Dictionary with the runs per minute, for minutes with any, and the
+        busiest minute
+    """
+    now = now or timezone.now()
+    next_runs = AutomatedApplicationSchedule.objects.filter(
+        is_active=True,
+        next_run__gt=now,
+        next_run__lte=now + timedelta(hours=hours)
+    ).values_list('next_run', flat=True)
+    
+    per_minute = Counter(next_run.replace(second=0, microsecond=0) for next_run in next_runs.iterator())
+    peak = max(per_minute.items(), key=lambda entry: entry[1], default=(None, 0))
+    
+    return {
+        'hours': hours,
+        'runs': sum(per_minute.values()),
+        'peak_runs_per_minute': peak[1],
+        'peak_minute': peak[0].isoformat() if peak[0] else None,
+        'per_minute': [
+            {'minute': minute.isoformat(), 'runs': runs}
+            for minute, runs in sorted(per_minute.items())
+        ],
+    }
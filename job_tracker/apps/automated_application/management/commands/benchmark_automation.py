@@ -0,0 +1,118 @@
+"""
+Management command to benchmark job matching and automated application runs
+against recorded LinkedIn API responses.
+"""
+import time
+import logging
+import statistics
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from job_tracker.apps.automated_application.automation import run_automated_application_schedule
+from job_tracker.apps.job_matching.algorithm import find_matching_jobs
+from job_tracker.apps.linkedin_integration.api.cache import build_search_cache, set_search_cache
+from job_tracker.apps.linkedin_integration.api.cassette import RecordingTransport, ReplayTransport
+from job_tracker.apps.linkedin_integration.api.client import reset_linkedin_client
+from job_tracker.apps.linkedin_integration.api.fake_server import FakeLinkedInServer, LatencyModel
+from job_tracker.apps.linkedin_integration.api.ratelimit import LocalBackend, RateLimiter, set_rate_limiter
+from job_tracker.apps.linkedin_integration.api.transport import HttpTransport, build_transport, set_transport
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+class Command(BaseCommand):
+    help = 'Benchmark find_matching_jobs and scheduled application runs against a recorded cassette'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('cassette', help='Cassette file to record to or replay from (gzip JSON lines)')
+        parser.add_argument('--record', action='store_true',
+                            help='Record the cassette with one run against the configured transport')
+        parser.add_argument('--fake-server', action='store_true',
+                            help='Record against an in-process fake LinkedIn server instead')
+        parser.add_argument('--fake-latency-ms', type=float, default=100, help='Fake server response latency')
+        parser.add_argument('--user', help='Username to benchmark find_matching_jobs for')
+        parser.add_argument('--schedule', type=int, help='Schedule ID to benchmark run_automated_application_schedule for')
+        parser.add_argument('--max-results', type=int, default=None, help='Search results to consider per match')
+        parser.add_argument('--repeat', type=int, default=5, help='Number of timed iterations when replaying')
+        parser.add_argument('--latency', default='none',
+                            help="Replay latency: 'none', 'recorded' or a delay in seconds")
+    
+    def handle(self, *args, **options):
+        if not options['user'] and not options['schedule']:
+            raise CommandError('Pass --user and/or --schedule to choose what to benchmark')
+        
+        user = None
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['user']} does not exist")
+        
+        server = None
+        if options['record']:
+            if options['fake_server']:
+                server = FakeLinkedInServer(latency=LatencyModel(mean_ms=options['fake_latency_ms'])).start()
+                inner = HttpTransport(server.base_url)
+            else:
+                inner = build_transport()
+            transport = RecordingTransport(inner, options['cassette'])
+            repeat = 1
+        else:
+            transport = ReplayTransport(options['cassette'], latency=options['latency'])
+            repeat = options['repeat']
+            self.stdout.write(f"Replaying {len(transport)} recorded calls from {options['cassette']}")
+        
+        # Measure local compute only: no client-side rate limits and no search cache
+        previous_transport = set_transport(transport)
+        previous_limiter = set_rate_limiter(RateLimiter(LocalBackend(), {}, {}))
+        previous_cache = set_search_cache(build_search_cache({'TTL': 0}))
+        reset_linkedin_client()
+        
+        try:
+            if user is not None:
+                self._report('find_matching_jobs', self._time(repeat, lambda: find_matching_jobs(
+                    user, min_score=0, max_results=options['max_results']
+                )))
+            if options['schedule']:
+                self._report('run_automated_application_schedule', self._time(
+                    repeat, lambda: run_automated_application_schedule(options['schedule'])
+                ))
+        finally:
+            transport.close()
+            if server is not None:
+                server.stop()
+            set_transport(previous_transport)
+            set_rate_limiter(previous_limiter)
+            set_search_cache(previous_cache)
+            reset_linkedin_client()
+        
+        if options['record']:
+            self.stdout.write(self.style.SUCCESS(f"Recorded {transport.recorded} calls to {options['cassette']}"))
+        elif transport.misses:
+            self.stdout.write(self.style.WARNING(f'{transport.misses} requests had no recorded response'))
+    
+    def _time(self, repeat, func):
+        """
+        Time each call of `func`, rolling back its database writes afterwards.
+        """
+        durations = []
+        for _ in range(repeat):
+            with transaction.atomic():
+                start = time.perf_counter()
+                func()
+                durations.append(time.perf_counter() - start)
+                transaction.set_rollback(True)
+        return durations
+    
+    def _report(self, name, durations):
+        ordered = sorted(durations)
+        p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+        self.stdout.write(
+            f'{name}: {len(durations)} runs, '
+            f'min {ordered[0] * 1000:.1f} ms, '
+            f'median {statistics.median(ordered) * 1000:.1f} ms, '
+            f'mean {statistics.mean(ordered) * 1000:.1f} ms, '
+            f'p95 {p95 * 1000:.1f} ms'
+        )
@@ -0,0 +1,124 @@
+"""
+Management command to benchmark next-run computation and due-schedule lookups
+on a large number of schedules.
+"""
+import time
+import uuid
+import random
+import logging
+import statistics
+from datetime import time as time_of_day, timedelta
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from job_tracker.apps.automated_application.automation import calculate_next_run_times, get_due_schedules
+from job_tracker.apps.automated_application.models import AutomatedApplicationSchedule
+from job_tracker.apps.automated_application.work_queue import claim_due_schedules
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+class Command(BaseCommand):
+    help = 'Benchmark next-run computation and due-schedule lookups as the number of schedules grows'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='10000,100000,1000000',
+                            help='Comma-separated schedule counts to measure at')
+        parser.add_argument('--due', type=int, default=100, help='Schedules due at each size')
+        parser.add_argument('--missing-fraction', type=float, default=0.01,
+                            help='Fraction of new schedules without a next run')
+        parser.add_argument('--claim-size', type=int, default=20, help='Schedules claimed per lookup')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed lookups per size')
+        parser.add_argument('--batch-size', type=int, default=10000, help='Rows inserted per query')
+        parser.add_argument('--seed', type=int, default=0, help='Seed for the generated schedules')
+    
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options['sizes'].split(','))
+        rng = random.Random(options['seed'])
+        
+        # Everything is rolled back, so the benchmark leaves no schedules behind
+        with transaction.atomic():
+            user = User.objects.create(username=f'schedule-benchmark-{uuid.uuid4().hex[:8]}')
+            created = 0
+            for size in sizes:
+                self._create_schedules(user, size - created, options, rng)
+                created = size
+                
+                start = time.perf_counter()
+                computed = calculate_next_run_times(batch_size=options['batch_size'])
+                compute_time = time.perf_counter() - start
+                
+                self._mark_due(options['due'])
+                self._analyze()
+                
+                due_times = self._time(options['repeat'], get_due_schedules)
+                claim_times = self._time_claims(options['repeat'], options['claim_size'])
+                
+                self.stdout.write(
+                    f'{size} schedules: next runs for {computed} in {compute_time * 1000:.1f} ms; '
+                    f'due lookup median {statistics.median(due_times) * 1000:.2f} ms; '
+                    f'claim of {options["claim_size"]} median {statistics.median(claim_times) * 1000:.2f} ms'
+                )
+            
+            self.stdout.write('Due schedule query plan:')
+            self.stdout.write(AutomatedApplicationSchedule.objects.filter(
+                is_active=True, next_run__lte=timezone.now()
+            ).order_by('next_run').values('id')[:options['claim_size']].explain())
+            transaction.set_rollback(True)
+    
+    def _create_schedules(self, user, count, options, rng):
+        now = timezone.now()
+        batch = []
+        for index in range(count):
+            frequency = rng.choice(['daily', 'weekly', 'custom'])
+            missing = rng.random() < options['missing_fraction']
+            batch.append(AutomatedApplicationSchedule(
+                user=user,
+                name=f'Benchmark schedule {index}',
+                is_active=rng.random() < 0.9,
+                frequency=frequency,
+                days_of_week=sorted(rng.sample(range(7), rng.randint(1, 3))) if frequency == 'weekly' else [],
+                time_of_day=time_of_day(rng.randrange(24), rng.randrange(0, 60, 15)),
+                next_run=None if missing else now + timedelta(minutes=rng.randint(60, 7 * 24 * 60))
+            ))
+            if len(batch) >= options['batch_size']:
+                AutomatedApplicationSchedule.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            AutomatedApplicationSchedule.objects.bulk_create(batch)
+    
+    def _mark_due(self, count):
+        """
+        Make exactly `count` active schedules due.
+        """
+        now = timezone.now()
+        AutomatedApplicationSchedule.objects.filter(is_active=True, next_run__lte=now).update(
+            next_run=now + timedelta(days=1)
+        )
+        due_ids = list(AutomatedApplicationSchedule.objects.filter(is_active=True).values_list('id', flat=True)[:count])
+        AutomatedApplicationSchedule.objects.filter(id__in=due_ids).update(next_run=now - timedelta(minutes=1))
+    
+    def _analyze(self):
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE {AutomatedApplicationSchedule._meta.db_table}')
+    
+    def _time_claims(self, repeat, count):
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            claimed = claim_due_schedules('schedule-benchmark', count)
+            durations.append(time.perf_counter() - start)
+            AutomatedApplicationSchedule.objects.filter(id__in=claimed).update(lease_owner=None, lease_expires_at=None)
+        return durations
+    
+    def _time(self, repeat, func):
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - start)
+        return durations
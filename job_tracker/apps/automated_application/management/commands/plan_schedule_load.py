@@ -0,0 +1,43 @@
+"""
+Management command to report and smooth the expected load of automated
+application schedules.
+"""
+import logging
+from django.core.management.base import BaseCommand, CommandError
+
+from job_tracker.apps.automated_application.load_spreading import expected_runs_per_minute, plan_run_offsets
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Report expected schedule runs per minute and plan run offsets that flatten them'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24, help='Hours ahead to report runs per minute for')
+        parser.add_argument('--window', type=int, default=None,
+                            help='Seconds to spread schedules over; defaults to AUTOMATED_APPLICATION_JITTER_WINDOW')
+        parser.add_argument('--apply', action='store_true', help='Store the planned offsets and move upcoming runs')
+        parser.add_argument('--top', type=int, default=10, help='Busiest minutes to list')
+    
+    def handle(self, *args, **options):
+        if options['window'] is not None and options['window'] < 0:
+            raise CommandError('--window must not be negative')
+        
+        plan = plan_run_offsets(window=options['window'], apply=options['apply'])
+        self.stdout.write(f"{plan['schedules']} active schedules, spread over {plan['window']} seconds")
+        for name in ('unspread', 'current', 'planned'):
+            profile = plan[name]
+            self.stdout.write(
+                f"  {name}: peak {profile['peak_runs_per_minute']} runs/minute at {profile['peak_minute']}, "
+                f"{profile['busy_minutes']} busy minutes a day"
+            )
+        if plan['applied']:
+            self.stdout.write(self.style.SUCCESS(f"Stored new offsets for {plan['changed']} schedules"))
+        else:
+            self.stdout.write(f"{plan['changed']} schedules would get new offsets; pass --apply to store them")
+        
+        expected = expected_runs_per_minute(options['hours'])
+        self.stdout.write(f"{expected['runs']} runs due in the next {expected['hours']} hours; busiest minutes:")
+        busiest = sorted(expected['per_minute'], key=lambda entry: entry['runs'], reverse=True)[:options['top']]
+        for entry in busiest:
+            self.stdout.write(f"  {entry['minute']}: {entry['runs']} runs")
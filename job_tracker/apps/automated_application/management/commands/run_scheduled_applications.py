@@ -1,36 +1,158 @@
 """
 Management command to run scheduled automated applications.
 """
+import time
+import signal
 import logging
-from django.core.management.base import BaseCommand
+import threading
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 
-from job_tracker.apps.automated_application.automation import get_due_schedules, run_automated_application_schedule, calculate_next_run_times
+from job_tracker.apps.automated_application.automation import (
+    get_due_schedules, run_due_schedules, summarize_results, calculate_next_run_times, recover_interrupted_runs
+)
+from job_tracker.apps.automated_application.models import AutomatedApplicationSchedule
+from job_tracker.apps.automated_application.scheduler import run_scheduler
+from job_tracker.apps.automated_application.simulation import dry_run_schedule, project_wall_time
+from job_tracker.apps.automated_application.work_queue import LeaseHeartbeat, claim_due_schedules, worker_id
 
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
     help = 'Run scheduled automated applications'
     
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Number of users whose schedules run concurrently, taking turns in the '
+                                 'submission queue (defaults to AUTOMATED_APPLICATION_WORKERS)')
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='Schedules claimed from the queue at a time (defaults to twice --workers)')
+        parser.add_argument('--daemon', action='store_true',
+                            help='Keep running and start schedules as soon as they are due')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Search, score and write cover letters for due schedules without submitting '
+                                 'applications or saving anything, and report throughput')
+        parser.add_argument('--submit-latency', type=float, default=None,
+                            help='Seconds each simulated submission takes in a dry run')
+    
+    def _report(self, result):
+        if result['success']:
+            self.stdout.write(self.style.SUCCESS(
+                f'Schedule {result["schedule_id"]} ({result["duration"]:.1f}s): {result["message"]}'
+            ))
+        else:
+            self.stdout.write(self.style.ERROR(
+                f'Schedule {result["schedule_id"]} ({result["duration"]:.1f}s): {result["message"]}'
+            ))
+    
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Starting automated application scheduler'))
+        options['workers'] = options['workers'] or settings.AUTOMATED_APPLICATION_WORKERS
+        
+        if options['dry_run']:
+            if options['daemon']:
+                raise CommandError('--dry-run cannot be combined with --daemon')
+            return self._dry_run(options)
+        
+        if options['daemon']:
+            return self._run_daemon(options)
         
         # Calculate next run times for schedules that don't have one
         calculate_next_run_times()
         self.stdout.write('Calculated next run times for schedules')
         
-        # Get schedules that are due to run
+        # Make schedules with interrupted runs due, so their runs are resumed below
+        recovered = recover_interrupted_runs()
+        if recovered:
+            self.stdout.write(f'Resuming {recovered} interrupted runs')
+        
+        # Count schedules that are due to run and not leased by another scheduler
         due_schedules = get_due_schedules()
         self.stdout.write(f'Found {len(due_schedules)} schedules due to run')
         
-        # Run each due schedule
-        for schedule_id in due_schedules:
-            self.stdout.write(f'Running schedule {schedule_id}')
-            result = run_automated_application_schedule(schedule_id)
+        owner = worker_id()
+        batch_size = options['batch_size'] or max(1, options['workers']) * 2
+        results = []
+        attempted = set()
+        
+        with LeaseHeartbeat(owner) as heartbeat:
+            def report(result):
+                heartbeat.release(result['schedule_id'])
+                results.append(result)
+                self._report(result)
             
-            if result['success']:
-                self.stdout.write(self.style.SUCCESS(f'Schedule {schedule_id}: {result["message"]}'))
-            else:
-                self.stdout.write(self.style.ERROR(f'Schedule {schedule_id}: {result["message"]}'))
+            # Claim due schedules in batches until none are left; other schedulers skip claimed rows
+            start = time.perf_counter()
+            workers = 1
+            while True:
+                claimed = claim_due_schedules(owner, batch_size, exclude=attempted)
+                if not claimed:
+                    break
+                attempted.update(claimed)
+                heartbeat.track(claimed)
+                workers = run_due_schedules(claimed, workers=options['workers'], on_result=report)['summary']['workers']
+            wall_time = time.perf_counter() - start
         
+        summary = summarize_results(results, workers, wall_time)
+        self.stdout.write(
+            f'Ran {summary["schedules"]} schedules with {summary["workers"]} workers in {summary["wall_time"]:.1f}s '
+            f'({summary["succeeded"]} succeeded, {summary["failed"]} failed); per-schedule latency '
+            f'p50 {summary["latency_p50"]:.1f}s, p95 {summary["latency_p95"]:.1f}s, max {summary["latency_max"]:.1f}s'
+        )
         self.stdout.write(self.style.SUCCESS('Completed automated application scheduler'))
+    
+    def _dry_run(self, options):
+        # Due schedules run one at a time and are left due; nothing is claimed or saved
+        schedule_ids = get_due_schedules()
+        self.stdout.write(f'Dry run of {len(schedule_ids)} due schedules')
+        
+        stats = []
+        start = time.perf_counter()
+        for schedule_id in schedule_ids:
+            result = dry_run_schedule(schedule_id, submit_latency=options['submit_latency'])
+            if 'stats' not in result:
+                self.stdout.write(self.style.ERROR(f'Schedule {schedule_id}: {result["message"]}'))
+                continue
+            stat = result['stats']
+            stats.append(stat)
+            self.stdout.write(
+                f'Schedule {schedule_id}: {stat["jobs_found"]} jobs found, {stat["jobs_processed"]} processed, '
+                f'{stat["letters_written"]} letters in {stat["wall_time"]:.1f}s; '
+                f'{stat["jobs_per_second"]:.2f} jobs/s, {stat["letters_per_second"]:.2f} letters/s; '
+                f'projected {stat["projected_wall_time"]:.1f}s per full run'
+            )
+        wall_time = time.perf_counter() - start
+        
+        jobs = sum(stat['jobs_processed'] for stat in stats)
+        letters = sum(stat['letters_written'] for stat in stats)
+        active = AutomatedApplicationSchedule.objects.filter(is_active=True).count()
+        self.stdout.write(
+            f'Dry-ran {len(stats)} schedules in {wall_time:.1f}s: {jobs / wall_time if wall_time else 0:.2f} jobs/s, '
+            f'{letters / wall_time if wall_time else 0:.2f} letters/s overall'
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Projected wall time for all {active} active schedules with {options["workers"]} workers: '
+            f'{project_wall_time(stats, active, options["workers"]):.1f}s'
+        ))
+    
+    def _run_daemon(self, options):
+        stop = threading.Event()
+        
+        def shutdown(signum, frame):
+            self.stdout.write('Stopping automated application scheduler after the current runs')
+            stop.set()
+        
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+        
+        owner = worker_id()
+        self.stdout.write(f'Running as scheduler daemon {owner}')
+        run_scheduler(
+            owner,
+            workers=options['workers'],
+            batch_size=options['batch_size'] or max(1, options['workers']) * 2,
+            stop=stop,
+            on_result=self._report
+        )
+        self.stdout.write(self.style.SUCCESS('Stopped automated application scheduler'))
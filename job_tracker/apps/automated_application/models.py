@@ -27,6 +27,8 @@ class AutomatedApplicationSchedule(models.Model):
     days_of_week = models.JSONField(default=list, blank=True, 
                                   help_text="List of days (0-6, where 0 is Monday) for weekly schedules")
     time_of_day = models.TimeField(default=timezone.now)
+    run_offset = models.PositiveIntegerField(null=True, blank=True,
+                                             help_text="Seconds after the time of day to run at; set by the load planner")
     
     # Search criteria
     keywords = models.CharField(max_length=255, blank=True, null=True)
@@ -44,6 +46,10 @@ class AutomatedApplicationSchedule(models.Model):
     total_applications = models.IntegerField(default=0)
     successful_applications = models.IntegerField(default=0)
     
+    # Scheduler lease; a claimed schedule is not run by other scheduler processes until the lease expires
+    lease_owner = models.CharField(max_length=255, blank=True, null=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -52,6 +58,11 @@ class AutomatedApplicationSchedule(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['updated_at']),
+            # Due-schedule lookups only consider active schedules
+            models.Index(fields=['next_run'], condition=models.Q(is_active=True), name='schedule_active_next_run_idx'),
+        ]
 
 class AutomatedApplicationRun(models.Model):
     """
@@ -64,6 +75,11 @@ class AutomatedApplicationRun(models.Model):
         ('failed', 'Failed'),
     ]
     
+    CHECKPOINT_CHOICES = [
+        ('', 'Started'),
+        ('matched', 'Jobs matched'),
+    ]
+    
     schedule = models.ForeignKey(AutomatedApplicationSchedule, on_delete=models.CASCADE, related_name='runs')
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
@@ -76,6 +92,12 @@ class AutomatedApplicationRun(models.Model):
     
     error_message = models.TextField(blank=True, null=True)
     log = models.TextField(blank=True, null=True)
+    # Stage timings, query counts and peak memory, see job_tracker.apps.instrumentation.RunMetrics
+    metrics = models.JSONField(default=dict, blank=True)
+    
+    # Progress saved as the run goes, so an interrupted run can be resumed
+    checkpoint = models.CharField(max_length=20, choices=CHECKPOINT_CHOICES, blank=True, default='')
+    checkpoint_at = models.DateTimeField(null=True, blank=True)
     
     def __str__(self):
         return f"{self.schedule.name} - {self.start_time.strftime('%Y-%m-%d %H:%M')}"
@@ -104,9 +126,37 @@ class AutomatedApplicationRunJob(models.Model):
     
     processed_at = models.DateTimeField(null=True, blank=True)
     error_message = models.TextField(blank=True, null=True)
+    # Seconds spent on this job per stage
+    metrics = models.JSONField(default=dict, blank=True)
+    
+    cover_letter = models.TextField(blank=True, null=True)
+    # Sent with the submission; a resumed run resubmits unrecorded jobs under the same key
+    idempotency_key = models.CharField(max_length=64, blank=True, default='')
     
     def __str__(self):
         return f"{self.job.title} at {self.job.company} - {self.status}"
     
     class Meta:
         ordering = ['-match_score']
+
+class AutomatedApplicationRunEvent(models.Model):
+    """
+    Model to store log events of an automated application run as they happen.
+    """
+    LEVEL_CHOICES = [
+        ('info', 'Info'),
+        ('error', 'Error'),
+    ]
+    
+    run = models.ForeignKey(AutomatedApplicationRun, on_delete=models.CASCADE, related_name='events')
+    sequence = models.PositiveIntegerField()
+    level = models.CharField(max_length=10, choices=LEVEL_CHOICES, default='info')
+    message = models.TextField()
+    created_at = models.DateTimeField(default=timezone.now)
+    
+    def __str__(self):
+        return f"{self.run} #{self.sequence}: {self.message}"
+    
+    class Meta:
+        ordering = ['run', 'sequence']
+        unique_together = ['run', 'sequence']
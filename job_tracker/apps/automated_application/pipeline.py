@@ -0,0 +1,111 @@
+"""
+Staged thread pipeline for automated application runs.
+
+Each stage has its own worker threads and reads from a bounded queue filled
+by the previous stage. Stages overlap: cover letters for upcoming jobs are
+written while earlier applications wait for the submission rate limit, and
+a slow stage holds back the ones before it instead of letting work pile up.
+Workers run in a copy of the caller's context, so they share its analysis
+scope.
+"""
+import queue
+import logging
+import threading
+import contextvars
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+class Stage:
+    """
+    Pipeline stage applying `func` to each item on `workers` threads.
+    """
+    def __init__(self, name: str, func: Callable[[Any], None], workers: int = 1):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+
+def run_pipeline(items: Iterable[Any], stages: List[Stage],
+                 queue_size: int = 4) -> Iterator[Tuple[Any, Optional[Exception]]]:
+    """
+    Pass items through stages running concurrently.
+    
+    Stage functions update the item in place. An item whose stage raised
+    skips the remaining stages and is yielded with the error.
+    
+    Args:
+        items: Items to process
+        stages: Stages in order
+        queue_size: Capacity of the queue in front of each stage
+    
+    Yields:
+        (item, error) tuples in completion order; error is None on success
+    """
+    queues = [queue.Queue(maxsize=queue_size) for _ in stages] + [queue.Queue()]
+    remaining = [stage.workers for stage in stages]
+    cancelled = threading.Event()
+    lock = threading.Lock()
+    
+    def work(index: int) -> None:
+        stage = stages[index]
+        inbox, outbox = queues[index], queues[index + 1]
+        try:
+            while True:
+                entry = inbox.get()
+                if entry is _DONE:
+                    break
+                item, error = entry
+                if error is None and not cancelled.is_set():
+                    try:
+                        stage.func(item)
+                    except Exception as e:
+                        logger.exception(f"Error in {stage.name} stage: {str(e)}")
+                        error = e
+                outbox.put((item, error))
+        finally:
+            connection.close()
+            with lock:
+                remaining[index] -= 1
+                last = remaining[index] == 0
+            if last:
+                # Tell every worker of the next stage, or the caller, that no more items follow
+                for _ in range(stages[index + 1].workers if index + 1 < len(stages) else 1):
+                    outbox.put(_DONE)
+    
+    def feed() -> None:
+        try:
+            for item in items:
+                if cancelled.is_set():
+                    break
+                queues[0].put((item, None))
+        finally:
+            for _ in range(stages[0].workers):
+                queues[0].put(_DONE)
+    
+    threads = [threading.Thread(target=feed, name='pipeline-feed', daemon=True)]
+    for index, stage in enumerate(stages):
+        for number in range(stage.workers):
+            context = contextvars.copy_context()
+            threads.append(threading.Thread(
+                target=context.run, args=(work, index), name=f"pipeline-{stage.name}-{number}", daemon=True
+            ))
+    for thread in threads:
+        thread.start()
+    
+    try:
+        while True:
+            entry = queues[-1].get()
+            if entry is _DONE:
+                break
+            yield entry
+    finally:
+        # If the caller stopped early, let the remaining items drain without work
+        cancelled.set()
+        while entry is not _DONE:
+            entry = queues[-1].get()
+        for thread in threads:
+            thread.join()
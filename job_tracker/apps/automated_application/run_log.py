@@ -0,0 +1,106 @@
+"""
+Incremental log of an automated application run.
+
+Lines are stored as AutomatedApplicationRunEvent rows while the run is in
+progress, so its progress can be followed live and survives a crash. Lines
+are written right away when the log has been quiet for a while; bursts are
+buffered and written with one bulk insert per batch.
+"""
+import time
+import logging
+from typing import Dict, Any, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import AutomatedApplicationRun, AutomatedApplicationRunEvent
+
+logger = logging.getLogger(__name__)
+
+class RunLog:
+    """
+    Log of one run, used like the list of lines it replaces:
+        
+        log = RunLog(run)
+        log.append("Started")
+        log.flush()
+        run.log = log.text()
+    """
+    def __init__(self, run: AutomatedApplicationRun, batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None):
+        self.run = run
+        self.batch_size = batch_size or settings.AUTOMATED_APPLICATION_EVENT_BATCH_SIZE
+        self.flush_interval = settings.AUTOMATED_APPLICATION_EVENT_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.lines: List[str] = []
+        self.sequence = 0
+        self._pending: List[AutomatedApplicationRunEvent] = []
+        self._last_flush = None
+    
+    @classmethod
+    def resume(cls, run: AutomatedApplicationRun, **kwargs) -> 'RunLog':
+        """
+        Continue the log of an interrupted run from its stored events.
+        """
+        log = cls(run, **kwargs)
+        for sequence, message in run.events.order_by('sequence').values_list('sequence', 'message'):
+            log.lines.append(message)
+            log.sequence = sequence
+        return log
+    
+    def __len__(self) -> int:
+        return len(self.lines)
+    
+    def append(self, message: str, level: str = 'info') -> None:
+        """
+        Add a line, writing pending lines if the batch is full or due.
+        """
+        self.lines.append(message)
+        self.sequence += 1
+        self._pending.append(AutomatedApplicationRunEvent(
+            run=self.run,
+            sequence=self.sequence,
+            level=level,
+            message=message,
+            created_at=timezone.now()
+        ))
+        
+        if (len(self._pending) >= self.batch_size or self._last_flush is None
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+    
+    def error(self, message: str) -> None:
+        self.append(message, level='error')
+    
+    def flush(self) -> None:
+        """
+        Write pending lines in one query.
+        """
+        if not self._pending:
+            return
+        try:
+            AutomatedApplicationRunEvent.objects.bulk_create(self._pending)
+        except Exception as e:
+            # The run goes on; its lines are still saved to run.log when it ends
+            logger.exception(f"Error writing run events: {str(e)}")
+        self._pending = []
+        self._last_flush = time.monotonic()
+    
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+def get_run_events(run: AutomatedApplicationRun, after: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+    """
+    Get a run's events following a sequence number.
+    
+    Args:
+        run: Run to read events of
+        after: Sequence number of the last event already seen
+        limit: Maximum number of events to return
+    
+    Returns:
+        List of events in order
+    """
+    events = run.events.filter(sequence__gt=after).order_by('sequence').values(
+        'sequence', 'level', 'message', 'created_at'
+    )[:limit]
+    return [{**event, 'created_at': event['created_at'].isoformat()} for event in events]
@@ -0,0 +1,203 @@
+"""
+Long-running scheduler for automated application schedules.
+
+Active schedules are kept in a min-heap keyed by next run time, so the
+daemon sleeps until the earliest schedule is due instead of scanning the
+table every minute. Edits are picked up by polling for schedules whose
+updated_at moved, which only reads changed rows. Due schedules are still
+claimed through the lease queue, so daemons on several hosts, or a daemon
+next to cron runs, never run a schedule twice.
+"""
+import time
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connection
+from django.utils import timezone
+
+from .automation import calculate_next_run_times, recover_interrupted_runs, run_due_schedules
+from .models import AutomatedApplicationSchedule
+from .work_queue import LeaseHeartbeat, claim_due_schedules
+
+logger = logging.getLogger(__name__)
+
+class ScheduleHeap:
+    """
+    Min-heap of active schedules ordered by next run time.
+    
+    Heap entries are never updated in place. A changed schedule gets a new
+    entry and outdated entries are dropped when they reach the top.
+    """
+    def __init__(self, poll_overlap: float = 5):
+        self.poll_overlap = timedelta(seconds=poll_overlap)
+        self._heap: List[Tuple[datetime, int]] = []
+        self._next_run: Dict[int, datetime] = {}
+        # Next run times already handed out by pop_due, so polls reading them again are ignored
+        self._popped: Dict[int, datetime] = {}
+        self._watermark = None
+    
+    def __len__(self) -> int:
+        return len(self._next_run)
+    
+    def __contains__(self, schedule_id: int) -> bool:
+        return schedule_id in self._next_run
+    
+    def schedule(self, schedule_id: int, next_run: Optional[datetime]) -> None:
+        """
+        Set when a schedule is due; schedules without a next run are due now.
+        """
+        next_run = next_run or timezone.now()
+        if self._next_run.get(schedule_id) == next_run:
+            return
+        self._next_run[schedule_id] = next_run
+        heapq.heappush(self._heap, (next_run, schedule_id))
+    
+    def remove(self, schedule_id: int) -> None:
+        self._next_run.pop(schedule_id, None)
+        self._popped.pop(schedule_id, None)
+    
+    def load(self) -> None:
+        """
+        Load every active schedule.
+        """
+        self._heap, self._next_run, self._popped = [], {}, {}
+        self._watermark = timezone.now()
+        for schedule_id, next_run in AutomatedApplicationSchedule.objects.filter(
+            is_active=True
+        ).values_list('id', 'next_run'):
+            self._next_run[schedule_id] = next_run or self._watermark
+        self._heap = [(next_run, schedule_id) for schedule_id, next_run in self._next_run.items()]
+        heapq.heapify(self._heap)
+    
+    def refresh(self) -> int:
+        """
+        Apply schedules changed since the last load or refresh.
+        
+        Rows changed shortly before the previous poll are read again, so
+        transactions that committed late are not missed.
+        
+        Returns:
+            Number of changed schedules read
+        """
+        since = self._watermark - self.poll_overlap
+        self._watermark = timezone.now()
+        changed = AutomatedApplicationSchedule.objects.filter(updated_at__gte=since).values_list(
+            'id', 'is_active', 'next_run'
+        )
+        count = 0
+        for schedule_id, is_active, next_run in changed:
+            count += 1
+            if not is_active:
+                self.remove(schedule_id)
+            elif schedule_id in self._popped and next_run in (None, self._popped[schedule_id]):
+                # Already handed out and not rescheduled since; retries are scheduled by the caller
+                continue
+            else:
+                self.schedule(schedule_id, next_run)
+        return count
+    
+    def _discard_outdated(self) -> None:
+        while self._heap and self._next_run.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+    
+    def pop_due(self, now: Optional[datetime] = None) -> List[int]:
+        """
+        Remove and return the IDs of schedules due at `now`, earliest first.
+        """
+        now = now or timezone.now()
+        due = []
+        self._discard_outdated()
+        while self._heap and self._heap[0][0] <= now:
+            next_run, schedule_id = heapq.heappop(self._heap)
+            del self._next_run[schedule_id]
+            self._popped[schedule_id] = next_run
+            due.append(schedule_id)
+            self._discard_outdated()
+        return due
+    
+    def seconds_until_next(self, now: Optional[datetime] = None) -> Optional[float]:
+        """
+        Seconds until the earliest schedule is due, or None if there is none.
+        """
+        self._discard_outdated()
+        if not self._heap:
+            return None
+        return max(0.0, (self._heap[0][0] - (now or timezone.now())).total_seconds())
+
+def run_scheduler(owner: str, workers: int = 1, batch_size: int = 2, poll_interval: Optional[float] = None,
+                  retry_interval: Optional[float] = None, stop: Optional[threading.Event] = None,
+                  on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> None:
+    """
+    Run due schedules as they become due until `stop` is set.
+    
+    Args:
+        owner: Lease owner, see work_queue.worker_id()
+        workers: Number of users whose schedules run concurrently
+        batch_size: Schedules claimed from the queue at a time
+        poll_interval: Seconds between polls for edited schedules
+        retry_interval: Seconds before a schedule that was due but did not
+            get a new next run, e.g. because its run failed early or another
+            scheduler held it, is tried again
+        stop: Event ending the loop once set
+        on_result: Optional callback receiving each schedule's result
+    """
+    poll_interval = poll_interval or settings.AUTOMATED_APPLICATION_DAEMON_POLL_INTERVAL
+    retry_interval = retry_interval or settings.AUTOMATED_APPLICATION_DAEMON_RETRY_INTERVAL
+    stop = stop or threading.Event()
+    
+    calculate_next_run_times()
+    recover_interrupted_runs()
+    heap = ScheduleHeap(poll_overlap=poll_interval)
+    heap.load()
+    logger.info(f"Scheduler {owner} loaded {len(heap)} active schedules")
+    # Runs interrupted later, e.g. by another process dying, are found by periodic recovery passes
+    recover_at = time.monotonic() + settings.AUTOMATED_APPLICATION_RUN_STALE_SECONDS
+    
+    with LeaseHeartbeat(owner) as heartbeat:
+        def report(result):
+            heartbeat.release(result['schedule_id'])
+            if on_result is not None:
+                on_result(result)
+        
+        error_wait = 1.0
+        while not stop.is_set():
+            # Connections dropped or killed while idle are replaced instead of failing the loop
+            close_old_connections()
+            due = []
+            try:
+                if time.monotonic() >= recover_at:
+                    recover_interrupted_runs()
+                    recover_at = time.monotonic() + settings.AUTOMATED_APPLICATION_RUN_STALE_SECONDS
+                heap.refresh()
+                due = heap.pop_due()
+                if not due:
+                    wait = heap.seconds_until_next()
+                    stop.wait(poll_interval if wait is None else min(poll_interval, wait))
+                    error_wait = 1.0
+                    continue
+                
+                for offset in range(0, len(due), batch_size):
+                    if stop.is_set():
+                        break
+                    claimed = claim_due_schedules(owner, batch_size, schedule_ids=due[offset:offset + batch_size])
+                    if claimed:
+                        heartbeat.track(claimed)
+                        run_due_schedules(claimed, workers=workers, on_result=report)
+                
+                # Completed runs moved their next run; try the rest again later
+                heap.refresh()
+                error_wait = 1.0
+            except DatabaseError as e:
+                logger.exception(f"Database error in scheduler {owner}, retrying in {error_wait:.0f}s: {str(e)}")
+                connection.close()
+                stop.wait(error_wait)
+                error_wait = min(error_wait * 2, retry_interval)
+            
+            retry_at = timezone.now() + timedelta(seconds=retry_interval)
+            for schedule_id in due:
+                if schedule_id not in heap:
+                    heap.schedule(schedule_id, retry_at)
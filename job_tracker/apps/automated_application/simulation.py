@@ -0,0 +1,91 @@
+"""
+Dry runs of automated application schedules.
+
+A dry run searches, scores and writes cover letters for real, so it costs
+what a real run costs, but submits applications to a simulated sink and
+rolls back every database write it made. It leaves out the writes to
+rows real runs share, i.e. job details, matches, applications and
+schedule statistics, so real runs don't wait for it to roll back. Its
+throughput is reported to project how long runs take at scale.
+"""
+import time
+import logging
+import threading
+from typing import Dict, Any, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from .automation import run_automated_application_schedule
+
+logger = logging.getLogger(__name__)
+
+class SimulatedSubmitter:
+    """
+    Application sink standing in for the LinkedIn client in dry runs.
+    
+    Each submission succeeds after `latency` seconds without contacting
+    LinkedIn or using its rate limits.
+    """
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.submitted = 0
+        self._lock = threading.Lock()
+    
+    def apply_for_job(self, job_id: str, user_profile: Dict[str, Any], cover_letter: str,
+                      idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+        if self.latency > 0:
+            time.sleep(self.latency)
+        with self._lock:
+            self.submitted += 1
+        return {
+            'success': True,
+            'message': 'Application simulated',
+            'data': {
+                'application_id': None,
+                'status': 'simulated',
+                'job_id': job_id
+            }
+        }
+
+def dry_run_schedule(schedule_id: int, submit_latency: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Run a schedule without submitting applications or keeping any changes.
+    
+    Args:
+        schedule_id: ID of the schedule to run
+        submit_latency: Seconds each simulated submission takes; defaults to
+            AUTOMATED_APPLICATION_DRY_RUN_SUBMIT_LATENCY
+    
+    Returns:
+        Run result with throughput statistics under 'stats' if the run completed
+    """
+    if submit_latency is None:
+        submit_latency = settings.AUTOMATED_APPLICATION_DRY_RUN_SUBMIT_LATENCY
+    
+    # The run record and its jobs and events are rolled back; shared rows are not written at all
+    with transaction.atomic():
+        result = run_automated_application_schedule(schedule_id, submitter=SimulatedSubmitter(submit_latency))
+        transaction.set_rollback(True)
+    
+    if 'stats' in result:
+        result['message'] = (f"Dry run completed: {result['stats']['jobs_processed']} jobs processed and "
+                             f"{result['stats']['letters_written']} cover letters written; nothing was submitted.")
+    return {**result, 'run_id': None, 'dry_run': True}
+
+def project_wall_time(stats: List[Dict[str, Any]], schedules: int, workers: int = 1) -> float:
+    """
+    Project the wall time of running a number of schedules from dry runs.
+    
+    Args:
+        stats: Throughput statistics of dry runs
+        schedules: Number of schedules to run
+        workers: Number of schedules running concurrently
+    
+    Returns:
+        Projected seconds, assuming schedules cost what the dry-run ones did on average
+    """
+    if not stats:
+        return 0.0
+    mean = sum(stat['projected_wall_time'] for stat in stats) / len(stats)
+    return mean * schedules / max(1, workers)
@@ -0,0 +1,286 @@
+"""
+Process-wide queue of application submissions shared by all runs.
+
+Runs no longer submit on their own threads. They enqueue submissions here
+and wait for them, and a fixed pool of submitter threads drains the queue
+through the shared LinkedIn client and its rate limits. Users take turns by
+weighted fair queuing: each user's next submission gets a virtual finish
+tag one share after their previous one, and the lowest tag goes first, so a
+user with a large backlog cannot crowd out users with a few applications.
+A user's own submissions go in order of match score. A submission that has
+waited longer than its bound goes before all others, longest waiting first;
+the bound runs from when the submission was queued, so no run can jump
+ahead of others for longer than theirs would. Users only take turns while
+their runs are in progress at once, see the scheduler's --workers.
+"""
+import heapq
+import time
+import logging
+import itertools
+import threading
+from typing import Dict, Any, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from ..linkedin_integration.api.client import get_linkedin_client
+from ..linkedin_integration.api.ratelimit import track_waits
+
+logger = logging.getLogger(__name__)
+
+class Submission:
+    """
+    Application submission waiting in, or taken from, the queue.
+    
+    Call result() to wait for the client's response.
+    """
+    def __init__(self, user_id: int, job_id: str, user_profile: Dict[str, Any], cover_letter: str,
+                 idempotency_key: Optional[str] = None, priority: float = 0.0,
+                 max_wait: Optional[float] = None):
+        self.user_id = user_id
+        self.job_id = job_id
+        self.user_profile = user_profile
+        self.cover_letter = cover_letter
+        self.idempotency_key = idempotency_key
+        self.priority = priority
+        self.dispatched = False
+        self.queue_wait = 0.0
+        self.rate_limit_wait = 0.0
+        self._enqueued = time.perf_counter()
+        self.deadline = None if max_wait is None else self._enqueued + max_wait
+        self._result = None
+        self._error = None
+        self._done = threading.Event()
+    
+    def result(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for the submission and return the client's response.
+        
+        Raises:
+            TimeoutError: If the submission was not done within `timeout` seconds
+            Exception: Whatever the client raised
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Submission of job {self.job_id} not done after {timeout} seconds")
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+class _Flow:
+    """
+    Pending submissions of one user, highest priority first.
+    """
+    def __init__(self, weight: float):
+        self.weight = weight
+        self.items = []
+        self.pending = 0
+        self.finish = 0.0
+        self.tag = None
+
+class SubmissionQueue:
+    """
+    Weighted fair queue of submissions drained by `submitters` threads.
+    
+    Args:
+        submitters: Number of submitter threads
+        client: Client to submit with; defaults to the process-wide LinkedIn client
+    """
+    def __init__(self, submitters: int = 4, client: Optional[Any] = None):
+        self.submitters = max(1, submitters)
+        self.client = client
+        self.submitted = 0
+        self._flows: Dict[int, _Flow] = {}
+        self._order = []
+        self._deadlines = []
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+        self._in_progress = 0
+    
+    def start(self) -> 'SubmissionQueue':
+        """
+        Start the submitter threads, if not running yet.
+        """
+        with self._condition:
+            if not self._threads:
+                self._threads = [
+                    threading.Thread(target=self._work, name=f"submitter-{number}", daemon=True)
+                    for number in range(self.submitters)
+                ]
+                for thread in self._threads:
+                    thread.start()
+        return self
+    
+    def close(self) -> None:
+        """
+        Stop the submitter threads once the queued submissions are done.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join()
+    
+    def submit(self, user_id: int, job_id: str, user_profile: Dict[str, Any], cover_letter: str,
+               idempotency_key: Optional[str] = None, priority: float = 0.0,
+               max_wait: Optional[float] = None, weight: float = 1.0) -> Submission:
+        """
+        Queue an application submission.
+        
+        Args:
+            user_id: ID of the user applying
+            job_id: LinkedIn job ID
+            user_profile: User profile to apply with
+            cover_letter: Cover letter to apply with
+            idempotency_key: Key under which the application is submitted once upstream
+            priority: Order among the user's submissions, highest first, e.g. match score
+            max_wait: Seconds after which the submission goes ahead of other users' turns
+            weight: The user's share of submissions relative to other users
+        
+        Returns:
+            Submission to wait on
+        """
+        submission = Submission(user_id, job_id, user_profile, cover_letter,
+                                idempotency_key, priority, max_wait)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Submission queue is closed")
+            flow = self._flows.get(user_id)
+            if flow is None:
+                flow = self._flows[user_id] = _Flow(max(weight, 0.001))
+            
+            sequence = next(self._sequence)
+            heapq.heappush(flow.items, (-priority, sequence, submission))
+            flow.pending += 1
+            if flow.tag is None:
+                # A user starting a backlog takes their turn from now, not from when they were last served
+                flow.tag = max(self._virtual_time, flow.finish) + 1 / flow.weight
+                heapq.heappush(self._order, (flow.tag, sequence, user_id))
+            if submission.deadline is not None:
+                heapq.heappush(self._deadlines, (submission.deadline, sequence, submission))
+            self._condition.notify()
+        self.start()
+        return submission
+    
+    def _next(self) -> Optional[Submission]:
+        """
+        Take the next submission, waiting for one; None once closed and empty.
+        """
+        with self._condition:
+            while True:
+                submission = self._take()
+                if submission is not None:
+                    self._in_progress += 1
+                    return submission
+                if self._closed:
+                    return None
+                self._condition.wait()
+    
+    def _take(self) -> Optional[Submission]:
+        # Called with the condition held; heap entries of served submissions are dropped lazily
+        while self._deadlines and self._deadlines[0][2].dispatched:
+            heapq.heappop(self._deadlines)
+        if self._deadlines and self._deadlines[0][0] <= time.perf_counter():
+            submission = heapq.heappop(self._deadlines)[2]
+            flow = self._flows[submission.user_id]
+        else:
+            while self._order:
+                tag, _, user_id = heapq.heappop(self._order)
+                flow = self._flows[user_id]
+                if flow.tag == tag:
+                    break
+            else:
+                return None
+            while flow.items[0][2].dispatched:
+                heapq.heappop(flow.items)
+            submission = heapq.heappop(flow.items)[2]
+        
+        submission.dispatched = True
+        flow.pending -= 1
+        
+        # Charge the user one turn, whichever way the submission was taken
+        self._virtual_time = max(self._virtual_time, flow.tag - 1 / flow.weight)
+        flow.finish = flow.tag
+        if flow.pending:
+            flow.tag = flow.finish + 1 / flow.weight
+            heapq.heappush(self._order, (flow.tag, next(self._sequence), submission.user_id))
+        else:
+            flow.tag = None
+            flow.items = []
+            if not self._order:
+                # Nobody is waiting, so nobody's earlier turns need remembering
+                self._flows.clear()
+        return submission
+    
+    def _work(self) -> None:
+        while True:
+            submission = self._next()
+            if submission is None:
+                break
+            submission.queue_wait = time.perf_counter() - submission._enqueued
+            waits = []
+            try:
+                # Looked up per submission, so a client replaced meanwhile is used right away
+                client = self.client or get_linkedin_client()
+                
+                # Waits for the shared rate limits happen here, on the pool, in queue order
+                with track_waits() as waits:
+                    submission._result = client.apply_for_job(
+                        submission.job_id, submission.user_profile, submission.cover_letter,
+                        idempotency_key=submission.idempotency_key
+                    )
+            except Exception as e:
+                logger.exception(f"Error submitting application for job {submission.job_id}: {str(e)}")
+                submission._error = e
+            finally:
+                submission.rate_limit_wait = sum(waits)
+                with self._condition:
+                    self._in_progress -= 1
+                    self.submitted += 1
+                submission._done.set()
+                close_old_connections()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the number of queued and in-progress submissions.
+        """
+        with self._condition:
+            return {
+                'submitters': self.submitters,
+                'queued': sum(flow.pending for flow in self._flows.values()),
+                'users': sum(1 for flow in self._flows.values() if flow.pending),
+                'in_progress': self._in_progress,
+                'submitted': self.submitted,
+            }
+
+_queue = None
+_queue_lock = threading.Lock()
+
+def get_submission_queue() -> SubmissionQueue:
+    """
+    Get the process-wide submission queue, building it on first use.
+    """
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = SubmissionQueue(settings.AUTOMATED_APPLICATION_SUBMITTERS)
+    return _queue
+
+def set_submission_queue(submission_queue: Optional[SubmissionQueue]) -> Optional[SubmissionQueue]:
+    """
+    Replace the process-wide submission queue, e.g. to submit through a stand-in client.
+    
+    Args:
+        submission_queue: New queue, or None to rebuild from settings on next use
+    
+    Returns:
+        The previous queue, which is left running
+    """
+    global _queue
+    with _queue_lock:
+        previous, _queue = _queue, submission_queue
+    return previous
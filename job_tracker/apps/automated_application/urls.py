@@ -12,7 +12,11 @@ urlpatterns = [
     path('schedules/<int:schedule_id>/', views.schedule_details, name='schedule_details'),
     path('schedules/<int:schedule_id>/run/', views.run_schedule_now, name='run_schedule_now'),
     path('runs/<int:run_id>/', views.run_details, name='run_details'),
+    path('runs/<int:run_id>/events/', views.run_events_stream, name='run_events_stream'),
     path('dashboard/', views.dashboard, name='automation_dashboard'),
     path('api/schedules/', views.api_get_schedules, name='api_get_schedules'),
     path('api/run-schedule/', views.api_run_schedule, name='api_run_schedule'),
+    path('api/runs/<int:run_id>/events/', views.api_run_events, name='api_run_events'),
+    path('api/run-metrics/', views.api_run_metrics, name='api_run_metrics'),
+    path('api/schedule-load/', views.api_schedule_load, name='api_schedule_load'),
 ]
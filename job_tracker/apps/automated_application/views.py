@@ -3,19 +3,29 @@ Views for automated application system.
 """
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse, StreamingHttpResponse
+from django.conf import settings
 from django.contrib import messages
 from django.views.decorators.http import require_POST
 from django.utils import timezone
+from datetime import timedelta
 
 from .models import AutomatedApplicationSchedule, AutomatedApplicationRun, AutomatedApplicationRunJob
 from .automation import run_automated_application_schedule, calculate_next_run_times
+from .instrumentation import summarize_run_metrics
+from .run_log import get_run_events
+from .simulation import dry_run_schedule
+from .load_spreading import expected_runs_per_minute
 
 import logging
 import json
+import time
 
 logger = logging.getLogger(__name__)
 
+RUN_EVENTS_PAGE_SIZE = 500  # Run events read per query
+
 @login_required
 def schedules_list(request):
     """
@@ -205,6 +215,19 @@ def run_schedule_now(request, schedule_id):
         messages.error(request, "Please upload your resume first")
         return redirect('profile_edit')
     
+    # Dry runs write cover letters but submit nothing and save nothing
+    if request.POST.get('dry_run'):
+        result = dry_run_schedule(schedule.id)
+        if 'stats' in result:
+            stats = result['stats']
+            messages.info(request, f"Dry run: {stats['jobs_found']} jobs found, {stats['jobs_processed']} processed "
+                                   f"and {stats['letters_written']} cover letters written in {stats['wall_time']:.1f}s "
+                                   f"({stats['jobs_per_second']:.2f} jobs/s). A full run would take about "
+                                   f"{stats['projected_wall_time']:.0f}s.")
+        else:
+            messages.error(request, result['message'])
+        return redirect('schedule_details', schedule_id=schedule.id)
+    
     # Run schedule
     result = run_automated_application_schedule(schedule.id)
     
@@ -227,7 +250,8 @@ def run_details(request, run_id):
     
     return render(request, 'automated_application/run_details.html', {
         'run': run,
-        'jobs': jobs
+        'jobs': jobs,
+        'events': get_run_events(run)
     })
 
 @login_required
@@ -316,8 +340,11 @@ def api_run_schedule(request):
         except AutomatedApplicationSchedule.DoesNotExist:
             return JsonResponse({'error': 'Schedule not found'}, status=404)
         
-        # Run schedule
-        result = run_automated_application_schedule(schedule_id)
+        # Run schedule, or only measure it if asked for a dry run
+        if data.get('dry_run'):
+            result = dry_run_schedule(schedule_id)
+        else:
+            result = run_automated_application_schedule(schedule_id)
         
         return JsonResponse(result)
     except Exception as e:
@@ -326,3 +353,128 @@ def api_run_schedule(request):
             'success': False,
             'message': str(e)
         }, status=500)
+
+@staff_member_required
+def api_run_metrics(request):
+    """
+    API endpoint with p50/p95 stage timings of recent automated application runs.
+    """
+    try:
+        days = int(request.GET.get('days', 7))
+    except ValueError:
+        return JsonResponse({'error': 'days must be an integer'}, status=400)
+    
+    runs = AutomatedApplicationRun.objects.filter(
+        start_time__gte=timezone.now() - timedelta(days=days)
+    ).exclude(metrics={}).values_list('start_time', 'metrics')
+    
+    return JsonResponse({
+        'success': True,
+        'days': days,
+        'stages': summarize_run_metrics(runs.iterator())
+    })
+
+@staff_member_required
+def api_schedule_load(request):
+    """
+    API endpoint with the expected automated application runs per minute.
+    
+    Planning offsets walks every active schedule, so previews of the load
+    planner are left to the plan_schedule_load command.
+    """
+    try:
+        hours = int(request.GET.get('hours', 24))
+    except ValueError:
+        return JsonResponse({'error': 'hours must be an integer'}, status=400)
+    
+    return JsonResponse({
+        'success': True,
+        'expected': expected_runs_per_minute(hours)
+    })
+
+def _run_progress(run):
+    return {
+        'status': run.status,
+        'jobs_found': run.jobs_found,
+        'applications_attempted': run.applications_attempted,
+        'applications_successful': run.applications_successful,
+        'done': run.status in ('completed', 'failed'),
+    }
+
+@login_required
+def api_run_events(request, run_id):
+    """
+    API endpoint for polling a run's progress.
+    
+    Returns the run's status and up to a page of events after the `after`
+    sequence number; clients pass the last sequence number they received and
+    poll until 'done'.
+    """
+    run = get_object_or_404(AutomatedApplicationRun, id=run_id, schedule__user=request.user)
+    
+    try:
+        after = int(request.GET.get('after', 0))
+    except ValueError:
+        return JsonResponse({'error': 'after must be an integer'}, status=400)
+    
+    events = get_run_events(run, after, limit=RUN_EVENTS_PAGE_SIZE)
+    progress = _run_progress(run)
+    # A full page may be followed by more events; clients keep polling until done
+    more = len(events) == RUN_EVENTS_PAGE_SIZE
+    
+    return JsonResponse({
+        'success': True,
+        **progress,
+        'done': progress['done'] and not more,
+        'more': more,
+        'events': events
+    })
+
+@login_required
+def run_events_stream(request, run_id):
+    """
+    Server-sent event stream of a run's events until the run ends.
+    
+    Events are sent as 'log' events with their level in the data, followed
+    by an 'end' event with the run's final progress.
+    
+    Reconnecting clients resume after the Last-Event-ID they received. The
+    stream closes after AUTOMATED_APPLICATION_EVENT_STREAM_TIMEOUT seconds;
+    browsers reconnect automatically.
+    """
+    run = get_object_or_404(AutomatedApplicationRun, id=run_id, schedule__user=request.user)
+    
+    try:
+        after = int(request.headers.get('Last-Event-ID') or request.GET.get('after', 0))
+    except ValueError:
+        after = 0
+    
+    def stream():
+        nonlocal after
+        deadline = time.monotonic() + settings.AUTOMATED_APPLICATION_EVENT_STREAM_TIMEOUT
+        while True:
+            # Read the status first, so events written before the run ended are not missed
+            run.refresh_from_db(fields=['status', 'jobs_found', 'applications_attempted', 'applications_successful'])
+            progress = _run_progress(run)
+            while True:
+                events = get_run_events(run, after, limit=RUN_EVENTS_PAGE_SIZE)
+                for event in events:
+                    after = event['sequence']
+                    # Not named after the level: EventSource fires 'error' itself on connection failures
+                    yield f"id: {after}\nevent: log\ndata: {json.dumps(event)}\n\n"
+                if len(events) < RUN_EVENTS_PAGE_SIZE:
+                    break
+            
+            if progress['done']:
+                yield f"event: end\ndata: {json.dumps(progress)}\n\n"
+                return
+            if time.monotonic() >= deadline:
+                return
+            # Comment lines keep proxies from closing an idle connection
+            yield ": keep-alive\n\n"
+            time.sleep(1)
+    
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
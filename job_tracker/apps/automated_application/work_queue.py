@@ -0,0 +1,178 @@
+"""
+Database-backed work queue for scheduled application runs.
+
+Scheduler processes claim due schedules with SELECT ... FOR UPDATE SKIP
+LOCKED, so concurrent claims on several hosts never return the same row and
+never wait for each other. A claim is a lease: the owner and an expiry are
+stored on the schedule, and the owner renews the lease with heartbeats while
+the run is in progress. If a scheduler dies, its leases expire and the
+schedules are claimed again by another process.
+"""
+import os
+import uuid
+import socket
+import logging
+import threading
+from datetime import timedelta
+from typing import Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import AutomatedApplicationSchedule
+
+logger = logging.getLogger(__name__)
+
+def worker_id() -> str:
+    """
+    Build a lease owner name unique to this scheduler process.
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+def unleased(now=None) -> Q:
+    """
+    Filter for schedules without a lease or with an expired one.
+    """
+    now = now or timezone.now()
+    return Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lte=now)
+
+def claim_due_schedules(owner: str, limit: int, lease_seconds: Optional[int] = None,
+                        exclude: Iterable[int] = (), schedule_ids: Optional[Iterable[int]] = None) -> List[int]:
+    """
+    Lease up to `limit` due schedules to `owner`.
+    
+    Rows locked by another scheduler's claim are skipped rather than waited
+    for, and schedules whose lease expired are reclaimed.
+    
+    Args:
+        owner: Lease owner, see worker_id()
+        limit: Maximum number of schedules to claim
+        lease_seconds: Lease duration; defaults to AUTOMATED_APPLICATION_LEASE_SECONDS
+        exclude: IDs of schedules not to claim, e.g. ones already run by this process
+        schedule_ids: Optional IDs of the only schedules to consider
+    
+    Returns:
+        IDs of the claimed schedules, earliest due first
+    """
+    lease_seconds = lease_seconds or settings.AUTOMATED_APPLICATION_LEASE_SECONDS
+    now = timezone.now()
+    
+    with transaction.atomic():
+        candidates = AutomatedApplicationSchedule.objects.filter(
+            unleased(now),
+            is_active=True
+        ).exclude(id__in=list(exclude))
+        if schedule_ids is not None:
+            candidates = candidates.filter(id__in=list(schedule_ids))
+        if connection.features.has_select_for_update_skip_locked:
+            candidates = candidates.select_for_update(skip_locked=True)
+        
+        # Due schedules are a range scan of the active next_run index; schedules
+        # still waiting for their first next run are looked up separately
+        claimed = list(candidates.filter(next_run__lte=now).order_by('next_run').values_list(
+            'id', 'lease_owner'
+        )[:limit])
+        if len(claimed) < limit:
+            claimed += list(candidates.filter(next_run__isnull=True).order_by('id').values_list(
+                'id', 'lease_owner'
+            )[:limit - len(claimed)])
+        if not claimed:
+            return []
+        
+        schedule_ids = [schedule_id for schedule_id, previous_owner in claimed]
+        AutomatedApplicationSchedule.objects.filter(id__in=schedule_ids).update(
+            lease_owner=owner,
+            lease_expires_at=now + timedelta(seconds=lease_seconds)
+        )
+    
+    reclaimed = [schedule_id for schedule_id, previous_owner in claimed if previous_owner]
+    if reclaimed:
+        logger.warning(f"Reclaimed expired leases of schedules {reclaimed}")
+    return schedule_ids
+
+def renew_leases(owner: str, schedule_ids: Iterable[int], lease_seconds: Optional[int] = None) -> int:
+    """
+    Extend the leases `owner` holds on the given schedules.
+    
+    Returns:
+        Number of leases renewed; leases lost to another owner are not renewed
+    """
+    lease_seconds = lease_seconds or settings.AUTOMATED_APPLICATION_LEASE_SECONDS
+    return AutomatedApplicationSchedule.objects.filter(id__in=list(schedule_ids), lease_owner=owner).update(
+        lease_expires_at=timezone.now() + timedelta(seconds=lease_seconds)
+    )
+
+def release_lease(owner: str, schedule_id: int) -> bool:
+    """
+    Release the lease `owner` holds on a schedule.
+    
+    Returns:
+        True if the lease was still held by `owner`
+    """
+    return bool(AutomatedApplicationSchedule.objects.filter(id=schedule_id, lease_owner=owner).update(
+        lease_owner=None,
+        lease_expires_at=None
+    ))
+
+class LeaseHeartbeat:
+    """
+    Background thread renewing the leases held by a scheduler process.
+    
+    Use as a context manager and track schedules as they are claimed:
+        
+        with LeaseHeartbeat(owner) as heartbeat:
+            heartbeat.track(claim_due_schedules(owner, 10))
+    """
+    def __init__(self, owner: str, lease_seconds: Optional[int] = None):
+        self.owner = owner
+        self.lease_seconds = lease_seconds or settings.AUTOMATED_APPLICATION_LEASE_SECONDS
+        self.interval = self.lease_seconds / 3
+        self._held: Set[int] = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+    
+    def track(self, schedule_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._held.update(schedule_ids)
+    
+    def release(self, schedule_id: int) -> None:
+        """
+        Stop renewing a schedule's lease and release it.
+        """
+        with self._lock:
+            self._held.discard(schedule_id)
+        release_lease(self.owner, schedule_id)
+    
+    def _run(self) -> None:
+        try:
+            while not self._stopped.wait(self.interval):
+                with self._lock:
+                    held = list(self._held)
+                if not held:
+                    continue
+                close_old_connections()
+                try:
+                    renewed = renew_leases(self.owner, held, self.lease_seconds)
+                    if renewed < len(held):
+                        logger.warning(f"Lost {len(held) - renewed} schedule leases held by {self.owner}")
+                except Exception as e:
+                    logger.exception(f"Error renewing schedule leases: {str(e)}")
+        finally:
+            connection.close()
+    
+    def __enter__(self) -> 'LeaseHeartbeat':
+        self._thread = threading.Thread(target=self._run, name='schedule-lease-heartbeat', daemon=True)
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stopped.set()
+        self._thread.join()
+        with self._lock:
+            held, self._held = list(self._held), set()
+        for schedule_id in held:
+            release_lease(self.owner, schedule_id)
+        return False
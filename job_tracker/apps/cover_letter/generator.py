@@ -9,7 +9,8 @@ import json
 import string
 from datetime import datetime
 
-from ..resume_analysis.utils import extract_text_from_resume, extract_keywords_from_text, extract_job_requirements
+from ..resume_analysis.utils import extract_text_from_resume, extract_keywords_from_text, extract_job_requirements, get_resume_document, skill_ids, skill_names
+from ..resume_analysis.memo import memoize_in_scope
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +121,7 @@ def load_default_templates():
     """
     return DEFAULT_TEMPLATES
 
+@memoize_in_scope
 def extract_resume_info(resume_path: str) -> Dict[str, Any]:
     """
     Extract relevant information from a resume for cover letter generation.
@@ -137,8 +139,8 @@ def extract_resume_info(resume_path: str) -> Dict[str, Any]:
             logger.error(f"Failed to extract text from resume: {resume_path}")
             return {}
         
-        # Extract keywords from resume
-        keywords = extract_keywords_from_text(resume_text)
+        # Extract keywords from resume (tokenized document is shared with scoring)
+        keywords = extract_keywords_from_text(get_resume_document(resume_path))
         
         # Extract name (assuming it's at the beginning of the resume)
         name_match = re.search(r'^([A-Z][a-z]+(?: [A-Z][a-z]+)+)', resume_text)
@@ -151,12 +153,8 @@ def extract_resume_info(resume_path: str) -> Dict[str, Any]:
         phone_match = re.search(r'\b(\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b', resume_text)
         phone = phone_match.group(0) if phone_match else "123-456-7890"
         
-        # Extract experience
-        experience_years = 0
-        for exp in keywords['experience']:
-            year_match = re.search(r'(\d+)', exp)
-            if year_match:
-                experience_years = max(experience_years, int(year_match.group(1)))
+        # Years of experience are already parsed to an integer during extraction
+        experience_years = keywords['experience_years']
         
         # Extract most recent job title and company
         job_title = "Professional"
@@ -218,7 +216,7 @@ def generate_cover_letter(resume_path: str, job_description: str,
         # Get matching skills
         matching_skills = []
         if resume_info.get('skills') and job_requirements.get('required_skills'):
-            matching_skills = list(set(resume_info['skills']).intersection(set(job_requirements['required_skills'])))
+            matching_skills = skill_names(skill_ids(resume_info['skills']) & skill_ids(job_requirements['required_skills']))
         
         # Get template content
         template_content = DEFAULT_TEMPLATES[0]['content']  # Default to first template
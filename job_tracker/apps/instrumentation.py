@@ -0,0 +1,178 @@
+"""
+Per-stage timing, query and memory metrics for automated application runs.
+
+A RunMetrics collector is active for the duration of a run. Code anywhere
+in the run marks its stages with stage(), which is a no-op outside a run.
+Time spent in each stage and the queries it issued on the run's database
+connection are added up. Peak memory is taken from the process's maximum
+resident set size, or from tracemalloc when
+AUTOMATED_APPLICATION_TRACE_MEMORY is enabled. Both are process-wide, so
+peak memory is only recorded for runs that had the process to themselves;
+tracing, once started, stays on for the life of the process.
+
+The module sits outside the apps, so any of them can mark stages without
+importing the automated application app, which imports them.
+"""
+import time
+import logging
+import threading
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import connection
+
+try:
+    import resource
+except ImportError:  # resource is not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[Optional['RunMetrics']] = ContextVar('run_metrics', default=None)
+
+# Collectors measuring right now; memory figures are shared by all of them
+_active: List['RunMetrics'] = []
+_active_lock = threading.Lock()
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Get the nearest-rank percentile of a non-empty list of values.
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+class RunMetrics:
+    """
+    Collector of stage timings, query counts and peak memory for one run.
+    
+    Use as a context manager around the run, or call start() and stop():
+        
+        with RunMetrics() as metrics:
+            with metrics.stage('search'):
+                ...
+        run.metrics = metrics.as_dict()
+    """
+    def __init__(self, trace_memory: Optional[bool] = None):
+        if trace_memory is None:
+            trace_memory = settings.AUTOMATED_APPLICATION_TRACE_MEMORY
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, float] = defaultdict(float)
+        self.queries: Dict[str, int] = defaultdict(int)
+        self.wall_time = 0.0
+        self.peak_memory_kb = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started = None
+        self._alone = False
+        self._rss_at_start = None
+        self._token = None
+    
+    def _count_query(self, execute, sql, params, many, context):
+        with self._lock:
+            self.queries[getattr(self._local, 'stage', None) or 'other'] += 1
+        return execute(sql, params, many, context)
+    
+    def start(self) -> 'RunMetrics':
+        """
+        Start measuring on the current thread.
+        """
+        with _active_lock:
+            # Another run measuring at the same time makes both runs' peaks unattributable
+            for other in _active:
+                other._alone = False
+            self._alone = not _active
+            _active.append(self)
+            if self.trace_memory:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                if self._alone:
+                    tracemalloc.reset_peak()
+            else:
+                self._rss_at_start = _peak_rss_kb()
+        # Counts queries on this thread's connection only
+        connection.execute_wrappers.append(self._count_query)
+        self._token = _current.set(self)
+        self._started = time.perf_counter()
+        return self
+    
+    def stop(self) -> Dict[str, Any]:
+        """
+        Stop measuring, if still running, and return the collected metrics.
+        """
+        if self._token is not None:
+            self.wall_time = time.perf_counter() - self._started
+            _current.reset(self._token)
+            self._token = None
+            connection.execute_wrappers.remove(self._count_query)
+            with _active_lock:
+                _active.remove(self)
+                if not self._alone:
+                    self.peak_memory_kb = None
+                elif self.trace_memory:
+                    self.peak_memory_kb = tracemalloc.get_traced_memory()[1] // 1024
+                else:
+                    # The maximum RSS covers the process's lifetime; it only tells this
+                    # run's peak if it rose during the run
+                    peak = _peak_rss_kb()
+                    rose = peak is not None and self._rss_at_start is not None and peak > self._rss_at_start
+                    self.peak_memory_kb = peak if rose else None
+        return self.as_dict()
+    
+    def __enter__(self) -> 'RunMetrics':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+    
+    def add(self, name: str, seconds: float) -> None:
+        """
+        Add time spent in a stage, e.g. measured on a worker thread.
+        """
+        with self._lock:
+            self.stages[name] += seconds
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time a stage and attribute this thread's queries to it.
+        """
+        previous = getattr(self._local, 'stage', None)
+        self._local.stage = name
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+            self._local.stage = previous
+    
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'wall_time': round(self.wall_time, 4),
+                'stages': {name: round(seconds, 4) for name, seconds in self.stages.items()},
+                'queries': dict(self.queries),
+                'total_queries': sum(self.queries.values()),
+                'peak_memory_kb': self.peak_memory_kb,
+            }
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Time a stage of the run being measured, if any.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    with metrics.stage(name):
+        yield
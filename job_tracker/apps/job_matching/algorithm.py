@@ -8,15 +8,39 @@ from datetime import datetime, timedelta
 from django.utils import timezone
 from django.db.models import Q
 
-from ..resume_analysis.utils import calculate_job_fit_score, get_missing_skills, extract_text_from_resume, extract_keywords_from_text, extract_job_requirements
+from ..resume_analysis.memo import analysis_scope
+from ..resume_analysis.utils import calculate_job_fit_score, get_missing_skills, get_resume_document, extract_keywords_from_text, extract_job_requirements, skill_ids, skill_names
 from ..cover_letter.generator import generate_cover_letter
 from ..linkedin_integration.models import LinkedInJob, JobApplication
-from ..linkedin_integration.api.client import LinkedInClient
+from ..linkedin_integration.api.client import get_linkedin_client
+from ..linkedin_integration.hydration import hydrate_job_details
+from ..instrumentation import stage
 from .models import JobMatchingPreference, JobMatch, AutomatedApplicationLog
 
 logger = logging.getLogger(__name__)
 
-def find_matching_jobs(user, keywords=None, location=None, company=None, job_type=None, min_score=0.7):
+def _compare_skills(resume_keywords: Dict[str, Any], job_requirements: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """
+    Compare resume skills with a job's required and preferred skills.
+    
+    Args:
+        resume_keywords: Keywords extracted from the resume
+        job_requirements: Requirements extracted from the job description
+        
+    Returns:
+        Tuple of (matching skills, missing required skills)
+    """
+    resume_skill_ids = skill_ids(resume_keywords['skills'])
+    required_skill_ids = skill_ids(job_requirements['required_skills'])
+    preferred_skill_ids = skill_ids(job_requirements['preferred_skills'])
+    
+    matching_skills = skill_names(resume_skill_ids & (required_skill_ids | preferred_skill_ids))
+    missing_skills = skill_names(required_skill_ids - resume_skill_ids)
+    return matching_skills, missing_skills
+
+@analysis_scope('find matching jobs')
+def find_matching_jobs(user, keywords=None, location=None, company=None, job_type=None, min_score=0.7,
+                       max_results=None, persist=True):
     """
     Find jobs that match a user's resume based on keyword matching.
     
@@ -27,6 +51,10 @@ def find_matching_jobs(user, keywords=None, location=None, company=None, job_typ
         company: Optional company filter
         job_type: Optional job type filter
         min_score: Minimum match score threshold
+        max_results: Optional number of search results to consider; more than one
+            page is fetched concurrently. Defaults to a single page.
+        persist: Whether to store fetched job details and job matches; if not,
+            e.g. for dry runs, matches are returned with 'job_match' None
         
     Returns:
         List of matching jobs with scores
@@ -51,83 +79,94 @@ def find_matching_jobs(user, keywords=None, location=None, company=None, job_typ
             company = preferences.preferred_companies[0]
         
         # Search for jobs
-        client = LinkedInClient()
-        results = client.search_jobs(
-            keywords=keywords or "software developer",  # Default search if nothing specified
-            location=location,
-            company=company,
-            job_type=job_type
-        )
+        client = get_linkedin_client()
+        search_params = {
+            'keywords': keywords or "software developer",  # Default search if nothing specified
+            'location': location,
+            'company': company,
+            'job_type': job_type
+        }
+        with stage('search'):
+            if max_results:
+                results = client.search_jobs_paginated(max_results=max_results, **search_params)
+            else:
+                results = client.search_jobs(**search_params)
         
         if not results['success']:
             logger.error(f"Error searching jobs: {results['message']}")
             return []
         
-        # Process jobs and calculate match scores
-        matching_jobs = []
-        resume_path = user.profile.resume.path
-        
-        for job_data in results['data'].get('jobs', []):
-            # Skip excluded companies
-            if preferences.excluded_companies and job_data['company'] in preferences.excluded_companies:
-                continue
+        # Store jobs, skipping excluded companies and jobs already applied for
+        with stage('persist'):
+            jobs = []
+            for job_data in results['data'].get('jobs', []):
+                # Skip excluded companies
+                if preferences.excluded_companies and job_data['company'] in preferences.excluded_companies:
+                    continue
                 
-            # Skip if already applied
-            job, created = LinkedInJob.objects.get_or_create(
-                job_id=job_data['job_id'],
-                defaults={
-                    'title': job_data['title'],
-                    'company': job_data['company'],
-                    'location': job_data.get('location'),
-                    'description': job_data.get('description', ''),
-                    'url': job_data.get('url', '#'),
-                    'posted_date': job_data.get('posted_date'),
-                    'job_type': job_data.get('job_type'),
-                }
-            )
-            
-            # Skip if already applied
-            if JobApplication.objects.filter(user=user, job=job).exists():
-                continue
-            
-            # Calculate job fit score
-            fit_score = calculate_job_fit_score(
-                resume_path=resume_path,
-                job_description=job_data.get('description', '')
-            )
-            
-            # Only include if score meets minimum threshold
-            if fit_score >= min_score:
-                # Get matching and missing skills
-                resume_text = extract_text_from_resume(resume_path)
-                resume_keywords = extract_keywords_from_text(resume_text)
-                job_requirements = extract_job_requirements(job_data.get('description', ''))
-                
-                matching_skills = list(set(resume_keywords['skills']).intersection(
-                    set(job_requirements['required_skills'] + job_requirements['preferred_skills'])
-                ))
+                job, created = LinkedInJob.objects.get_or_create(
+                    job_id=job_data['job_id'],
+                    defaults={
+                        'title': job_data['title'],
+                        'company': job_data['company'],
+                        'location': job_data.get('location'),
+                        'description': job_data.get('description', ''),
+                        'url': job_data.get('url', '#'),
+                        'posted_date': job_data.get('posted_date'),
+                        'job_type': job_data.get('job_type'),
+                    }
+                )
                 
-                missing_skills = list(set(job_requirements['required_skills']) - set(resume_keywords['skills']))
+                # Skip if already applied
+                if JobApplication.objects.filter(user=user, job=job).exists():
+                    continue
+                jobs.append(job)
+        
+        # Match on full job descriptions, fetching details of new or stale jobs in batches
+        with stage('hydrate'):
+            hydrate_job_details(jobs, save=persist)
+        
+        # Calculate match scores
+        with stage('scoring'):
+            matching_jobs = []
+            resume_path = user.profile.resume.path
+            
+            for job in jobs:
+                # Calculate job fit score
+                fit_score = calculate_job_fit_score(
+                    resume_path=resume_path,
+                    job_description=job.description
+                )
                 
-                # Create or update job match
-                job_match, created = JobMatch.objects.update_or_create(
-                    user=user,
-                    job=job,
-                    defaults={
+                # Only include if score meets minimum threshold
+                if fit_score >= min_score:
+                    # Get matching and missing skills
+                    resume_keywords = extract_keywords_from_text(get_resume_document(resume_path))
+                    job_requirements = extract_job_requirements(job.description)
+                    
+                    matching_skills, missing_skills = _compare_skills(resume_keywords, job_requirements)
+                    
+                    # Create or update job match
+                    job_match = None
+                    if persist:
+                        job_match, created = JobMatch.objects.update_or_create(
+                            user=user,
+                            job=job,
+                            defaults={
+                                'match_score': fit_score,
+                                'matching_skills': matching_skills,
+                                'missing_skills': missing_skills,
+                                'auto_apply_eligible': fit_score >= preferences.auto_apply_threshold,
+                            }
+                        )
+                    
+                    matching_jobs.append({
+                        'job': job,
                         'match_score': fit_score,
                         'matching_skills': matching_skills,
                         'missing_skills': missing_skills,
-                        'auto_apply_eligible': fit_score >= preferences.auto_apply_threshold,
-                    }
-                )
-                
-                matching_jobs.append({
-                    'job': job,
-                    'match_score': fit_score,
-                    'matching_skills': matching_skills,
-                    'missing_skills': missing_skills,
-                    'job_match': job_match
-                })
+                        'job_match': job_match
+                    })
         
         # Sort by match score (highest first)
         matching_jobs.sort(key=lambda x: x['match_score'], reverse=True)
@@ -138,6 +177,51 @@ def find_matching_jobs(user, keywords=None, location=None, company=None, job_typ
         logger.exception(f"Error finding matching jobs: {str(e)}")
         return []
 
+@analysis_scope('rescore job matches')
+def rescore_job_matches(user) -> int:
+    """
+    Recompute scores of a user's open job matches, e.g. after a new resume upload.
+    
+    Args:
+        user: User object
+        
+    Returns:
+        Number of job matches rescored
+    """
+    if not hasattr(user, 'profile') or not user.profile.resume:
+        return 0
+    
+    preferences, created = JobMatchingPreference.objects.get_or_create(user=user)
+    resume_path = user.profile.resume.path
+    resume_keywords = extract_keywords_from_text(get_resume_document(resume_path))
+    
+    matches = JobMatch.objects.filter(
+        user=user,
+        status__in=['new', 'viewed', 'interested']
+    ).select_related('job')
+    
+    now = timezone.now()
+    rescored = []
+    for job_match in matches:
+        description = job_match.job.description
+        fit_score = calculate_job_fit_score(resume_path, description)
+        matching_skills, missing_skills = _compare_skills(resume_keywords, extract_job_requirements(description))
+        
+        job_match.match_score = fit_score
+        job_match.matching_skills = matching_skills
+        job_match.missing_skills = missing_skills
+        job_match.auto_apply_eligible = fit_score >= preferences.auto_apply_threshold
+        job_match.updated_at = now
+        rescored.append(job_match)
+    
+    JobMatch.objects.bulk_update(
+        rescored,
+        ['match_score', 'matching_skills', 'missing_skills', 'auto_apply_eligible', 'updated_at'],
+        batch_size=500
+    )
+    return len(rescored)
+
+@analysis_scope('auto apply')
 def auto_apply_to_jobs(user):
     """
     Automatically apply to jobs that meet the user's auto-apply criteria.
@@ -212,6 +296,7 @@ def auto_apply_to_jobs(user):
         # Apply to eligible jobs
         applied_count = 0
         applications = []
+        client = get_linkedin_client()
         
         for job_match in eligible_matches:
             try:
@@ -241,7 +326,6 @@ def auto_apply_to_jobs(user):
                 )
                 
                 # Submit application to LinkedIn
-                client = LinkedInClient()
                 user_profile = {
                     'id': user.id,
                     'name': user.get_full_name() or user.username,
@@ -354,8 +438,7 @@ def get_job_recommendations(user):
         if not recent_matches:
             # Extract keywords from resume
             resume_path = user.profile.resume.path
-            resume_text = extract_text_from_resume(resume_path)
-            resume_keywords = extract_keywords_from_text(resume_text)
+            resume_keywords = extract_keywords_from_text(get_resume_document(resume_path))
             
             # Use top skills as search keywords
             keywords = " ".join(resume_keywords['skills'][:5])
@@ -0,0 +1,323 @@
+"""
+Asyncio LinkedIn client for fetching many search result pages concurrently.
+
+Result pages, keyword/location combinations and job details are fetched at
+the same time, bounded by a semaphore, so a search for N pages waits roughly
+one page's latency instead of N. The HTTP transport is spoken natively through aiohttp;
+other transports are called in the default thread pool executor.
+
+Synchronous callers go through run_sync(), which runs coroutines on one
+long-lived event loop per process, so a client kept open on it reuses its
+HTTP connections across calls.
+"""
+import os
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Optional, Any, Awaitable, Callable
+
+from .client import LinkedInClient
+from .transport import Transport, HttpTransport, get_api_settings, get_transport, raise_for_upstream_status
+from .ratelimit import RateLimiter, get_rate_limiter
+from .cache import SearchCache, get_search_cache
+from .resilience import ResiliencePolicy, get_resilience_policy
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional; fall back to the sync transport in threads
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+def merge_job_results(results: List[Dict[str, Any]], max_results: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Merge job search results, keeping the first occurrence of each job_id.
+    
+    Args:
+        results: Job search result dictionaries in priority order
+        max_results: Optional maximum number of jobs to keep
+    
+    Returns:
+        Merged job search results
+    """
+    seen = set()
+    jobs = []
+    failures = [result['message'] for result in results if not result['success']]
+    
+    for result in results:
+        for job in result['data'].get('jobs', []):
+            if job['job_id'] in seen:
+                continue
+            seen.add(job['job_id'])
+            jobs.append(job)
+    
+    if max_results is not None:
+        jobs = jobs[:max_results]
+    
+    if failures and len(failures) == len(results):
+        return {
+            'success': False,
+            'message': failures[0],
+            'data': {'total': 0, 'jobs': []}
+        }
+    
+    message = 'Jobs found'
+    if failures:
+        message = f"Jobs found ({len(failures)} of {len(results)} requests failed)"
+    
+    return {
+        'success': True,
+        'message': message,
+        'data': {
+            'total': len(jobs),
+            'jobs': jobs
+        }
+    }
+
+class AsyncLinkedInClient:
+    """
+    Asyncio client for LinkedIn job search with bounded concurrency.
+    
+    Use as an async context manager so the underlying HTTP session is closed:
+        
+        async with AsyncLinkedInClient() as client:
+            results = await client.search_jobs_paginated('python developer', max_results=200)
+    """
+    def __init__(self, transport: Optional[Transport] = None, concurrency: Optional[int] = None,
+                 limiter: Optional[RateLimiter] = None, search_cache: Optional[SearchCache] = None,
+                 resilience: Optional[ResiliencePolicy] = None):
+        config = get_api_settings()
+        self.transport = transport or get_transport()
+        self.limiter = limiter or get_rate_limiter()
+        self.search_cache = search_cache or get_search_cache()
+        self.resilience = resilience or get_resilience_policy()
+        self.concurrency = concurrency or config['MAX_CONCURRENCY']
+        self.page_size = config['PAGE_SIZE']
+        self._semaphore = None
+        self._session = None
+    
+    async def __aenter__(self) -> 'AsyncLinkedInClient':
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        if aiohttp is not None and isinstance(self.transport, HttpTransport):
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency),
+                timeout=aiohttp.ClientTimeout(connect=self.transport.connect_timeout,
+                                              sock_read=self.transport.read_timeout),
+                headers={'Accept': 'application/json'}
+            )
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        return False
+    
+    async def call_api(self, endpoint: str, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Call an API endpoint, waiting for a free concurrency slot first.
+        
+        Args:
+            endpoint: API endpoint name
+            query: Query parameters
+        
+        Returns:
+            Decoded response dictionary
+        """
+        async with self._semaphore:
+            return await self._request(endpoint, query)
+    
+    async def _request(self, endpoint: str, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if self._session is not None:
+            url = f"{self.transport.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+            async with self._session.get(url, params=query or {}) as response:
+                raise_for_upstream_status(endpoint, response.status, response.headers.get('Retry-After'))
+                result = await response.json(content_type=None)
+                if response.status >= 400 and 'success' not in result:
+                    result = {'success': False, 'message': result.get('message', f"HTTP {response.status}")}
+                return result
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.transport.call_api, endpoint, query)
+    
+    async def search_jobs(self,
+                          keywords: str,
+                          location: Optional[str] = None,
+                          company: Optional[str] = None,
+                          job_type: Optional[str] = None,
+                          start: int = 0) -> Dict[str, Any]:
+        """
+        Fetch a single page of job search results.
+        
+        Returns:
+            Dictionary containing job search results
+        """
+        return await self._search_page(keywords, location, company, job_type, start)
+    
+    async def _search_page(self, keywords, location, company, job_type, start, known_total=None):
+        try:
+            params = LinkedInClient.build_search_params(keywords, location, company, job_type, start)
+            
+            async def attempt():
+                async with self._semaphore:
+                    # Skip pages that turned out to lie past the end while we waited
+                    if known_total is not None and known_total.get('total') is not None and start >= known_total['total']:
+                        return None
+                    await self.limiter.acquire_async('search')
+                    return await self._request('LinkedIn/search_people', query=params)
+            
+            async def fetch():
+                # Backoff between retries happens outside the concurrency slot
+                response = await self.resilience.call_async('search', attempt)
+                if response is None:
+                    return {'success': True, 'message': 'Jobs found', 'data': {'total': known_total['total'], 'jobs': []}}
+                return LinkedInClient.parse_search_response(response)
+            
+            key = self.search_cache.key(keywords, location, company, job_type, start)
+            results = await self.search_cache.get_or_fetch_async(key, fetch)
+            if known_total is not None and results['success']:
+                known_total.setdefault('total', results['data']['total'])
+            return results
+        except Exception as e:
+            logger.exception(f"Error searching LinkedIn jobs: {str(e)}")
+            return {
+                'success': False,
+                'message': f"Error searching jobs: {str(e)}",
+                'data': {'total': 0, 'jobs': []}
+            }
+    
+    async def search_jobs_paginated(self,
+                                    keywords: str,
+                                    location: Optional[str] = None,
+                                    company: Optional[str] = None,
+                                    job_type: Optional[str] = None,
+                                    max_results: int = 100) -> Dict[str, Any]:
+        """
+        Fetch enough result pages for `max_results` jobs at once.
+        
+        All pages are requested concurrently rather than one after another, so
+        the search costs about one round trip when concurrency allows. Once any
+        page reports the total, pages still waiting for a slot past the end of
+        the results are skipped without a request.
+        
+        Returns:
+            Dictionary containing merged job search results, deduplicated by job_id
+        """
+        pages = max(1, -(-max_results // self.page_size))
+        known_total = {}
+        results = await asyncio.gather(*[
+            self._search_page(keywords, location, company, job_type, page * self.page_size, known_total)
+            for page in range(pages)
+        ])
+        
+        merged = merge_job_results(results, max_results)
+        if merged['success'] and 'total' in known_total:
+            merged['data']['total_available'] = known_total['total']
+        return merged
+    
+    async def search_many(self, queries: List[Dict[str, Any]], max_results: int = 10) -> Dict[str, Any]:
+        """
+        Run several searches concurrently and merge their results.
+        
+        Args:
+            queries: List of search_jobs keyword arguments (keywords, location, company, job_type)
+            max_results: Maximum number of results per query
+        
+        Returns:
+            Dictionary containing merged job search results, deduplicated by job_id
+        """
+        results = await asyncio.gather(*[
+            self.search_jobs_paginated(max_results=max_results, **query)
+            for query in queries
+        ])
+        return merge_job_results(results)
+
+    async def get_job_details(self, job_id: str) -> Dict[str, Any]:
+        """
+        Fetch detailed information about a job posting.
+        
+        Args:
+            job_id: The LinkedIn job ID
+        
+        Returns:
+            Dictionary containing detailed job information
+        """
+        try:
+            async def attempt():
+                async with self._semaphore:
+                    await self.limiter.acquire_async('details')
+                    return await self._request('LinkedIn/get_job_details', query={'job_id': job_id})
+            
+            response = await self.resilience.call_async('details', attempt)
+            if not response.get('success'):
+                logger.error(f"LinkedIn API error: {response.get('message', 'Unknown error')}")
+                return {
+                    'success': False,
+                    'message': response.get('message', 'Failed to get job details'),
+                    'data': {}
+                }
+            return response
+        except Exception as e:
+            logger.exception(f"Error getting job details: {str(e)}")
+            return {
+                'success': False,
+                'message': f"Error getting job details: {str(e)}",
+                'data': {}
+            }
+    
+    async def get_job_details_many(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch details of several job postings concurrently.
+        
+        Args:
+            job_ids: LinkedIn job IDs
+        
+        Returns:
+            Dictionary mapping each job ID to its get_job_details result
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        results = await asyncio.gather(*[self.get_job_details(job_id) for job_id in job_ids])
+        return dict(zip(job_ids, results))
+
+_loop = None
+_loop_pid = None
+_loop_lock = threading.Lock()
+
+def get_shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide event loop run_sync() runs coroutines on, starting
+    its thread on first use and again in a forked child.
+    """
+    global _loop, _loop_pid
+    if _loop is None or _loop_pid != os.getpid():
+        with _loop_lock:
+            if _loop is None or _loop_pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='linkedin-async', daemon=True).start()
+                _loop, _loop_pid = loop, os.getpid()
+    return _loop
+
+def run_sync(coroutine_function: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run a coroutine function to completion from synchronous code.
+    
+    The coroutine runs on the shared event loop, whichever thread calls, so
+    sessions opened on that loop can be used again by later calls.
+    
+    Args:
+        coroutine_function: Function returning the coroutine to run
+    
+    Returns:
+        The coroutine's result
+    
+    Raises:
+        RuntimeError: If called from a coroutine on the shared loop, which would wait on itself
+    """
+    loop = get_shared_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError("run_sync() cannot be called from the shared event loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coroutine_function(), loop).result()
@@ -0,0 +1,472 @@
+"""
+TTL cache for LinkedIn job search results with single-flight coalescing.
+
+Many users and schedules run identical searches. Search results are cached
+under a normalized query key for a short TTL. Concurrent identical searches
+share one in-flight upstream call: within a process through an in-flight map
+that threads and coroutines wait on, and across processes through a lock key
+in the shared backend.
+
+Backends:
+
+- 'local': in-process LRU dictionary
+- 'django': a Django cache alias (e.g. Redis or Memcached) shared by all workers
+"""
+import copy
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Awaitable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .metrics import metrics, ratio
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_CACHE = {
+    'BACKEND': 'local',  # 'local' or 'django'
+    'CACHE_ALIAS': 'default',  # Django cache alias for the 'django' backend
+    'KEY_PREFIX': 'linkedin:search',
+    'TTL': 300,  # Seconds; 0 disables caching
+    'MAX_ENTRIES': 1024,  # For the 'local' backend
+    'LOCK_TIMEOUT': 30,  # Seconds to wait on another worker's in-flight search
+}
+
+def normalize_query_value(value: Optional[Any]) -> str:
+    """
+    Normalize a search parameter so equivalent queries share a cache key.
+    """
+    return ' '.join(str(value or '').lower().split())
+
+def search_cache_key(keywords: str, location: Optional[str] = None, company: Optional[str] = None,
+                     job_type: Optional[str] = None, start: int = 0, prefix: str = 'linkedin:search') -> str:
+    """
+    Build the cache key for a job search.
+    
+    Args:
+        keywords: Job keywords
+        location: Optional location filter
+        company: Optional company filter
+        job_type: Optional job type filter
+        start: Starting index for pagination
+        prefix: Cache key prefix
+    
+    Returns:
+        Cache key
+    """
+    query = '|'.join(normalize_query_value(value) for value in (keywords, location, company, job_type, start))
+    return f"{prefix}:{hashlib.sha1(query.encode('utf-8')).hexdigest()}"
+
+class LocalCacheBackend:
+    """
+    In-process LRU cache with per-entry expiry.
+    """
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Callers may modify results, so never hand out the cached object itself
+        return copy.deepcopy(value)
+    
+    def set(self, key: str, value: Any, timeout: float) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+class DjangoCacheBackend:
+    """
+    Cache backed by a Django cache alias shared between processes.
+    """
+    shared = True
+    
+    def __init__(self, alias: str = 'default'):
+        self.cache = caches[alias]
+    
+    def get(self, key: str) -> Optional[Any]:
+        return self.cache.get(key)
+    
+    def set(self, key: str, value: Any, timeout: float) -> None:
+        self.cache.set(key, value, timeout)
+    
+    def add(self, key: str, value: Any, timeout: float) -> bool:
+        return self.cache.add(key, value, timeout)
+    
+    def delete(self, key: str) -> None:
+        self.cache.delete(key)
+    
+    def clear(self) -> None:
+        self.cache.clear()
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+class _Flight:
+    """
+    An upstream call in progress that identical searches can wait on.
+    
+    Threads wait on the event; coroutines wait on a future of their own
+    event loop, so waiting does not hold an executor thread.
+    """
+    __slots__ = ('event', 'result', '_waiters', '_lock')
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._lock = threading.Lock()
+    
+    async def wait_async(self, timeout: float) -> None:
+        """
+        Wait for the call to land, for at most `timeout` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self.event.is_set():
+                return
+            self._waiters.append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+    
+    def land(self, result: Optional[Dict[str, Any]]) -> None:
+        """
+        Publish the result and wake every waiting thread and coroutine.
+        """
+        self.result = result
+        with self._lock:
+            self.event.set()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                # The waiter's event loop has been closed
+                pass
+
+class SearchCache:
+    """
+    TTL cache for job search results with single-flight coalescing.
+    """
+    def __init__(self, backend, ttl: float = 300, lock_timeout: float = 30, key_prefix: str = 'linkedin:search'):
+        self.backend = backend
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.key_prefix = key_prefix
+        self._inflight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+    
+    def key(self, *args, **kwargs) -> str:
+        """
+        Build the cache key for search_jobs arguments.
+        """
+        return search_cache_key(*args, prefix=self.key_prefix, **kwargs)
+    
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.backend.get(key)
+        except Exception as e:
+            metrics.incr('search_cache.errors')
+            logger.exception(f"Error reading search cache: {str(e)}")
+            return None
+    
+    def _store(self, key: str, result: Dict[str, Any]) -> None:
+        # Only successful searches are cached; failures should be retried
+        if not result.get('success'):
+            return
+        try:
+            self.backend.set(key, result, self.ttl)
+        except Exception as e:
+            metrics.incr('search_cache.errors')
+            logger.exception(f"Error writing search cache: {str(e)}")
+    
+    def _join(self, key: str) -> Tuple[_Flight, bool]:
+        """
+        Join the in-flight call for a key, or register a new one.
+        
+        Returns:
+            Tuple of (flight, whether the caller leads it)
+        """
+        with self._lock:
+            flight = self._inflight.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._inflight[key] = _Flight()
+            return flight, True
+    
+    def _land(self, key: str, flight: _Flight, result: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        flight.land(result)
+    
+    def _peer_lock(self, key: str) -> Optional[bool]:
+        """
+        Take the lock key of a query, so other processes wait for this one's search.
+        
+        Returns:
+            True if this process holds the lock, False if another process does,
+            or None if there is no other process to coordinate with
+        """
+        if not getattr(self.backend, 'shared', False):
+            return None
+        try:
+            return bool(self.backend.add(f"{key}:lock", 1, self.lock_timeout))
+        except Exception as e:
+            logger.exception(f"Error acquiring search cache lock: {str(e)}")
+            return None
+    
+    def _wait_for_peer(self, key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Wait for another process searching the same query, via a lock key.
+        
+        Returns:
+            Tuple of (the other process's result or None if this process should
+            search, whether this process holds the lock)
+        """
+        held = self._peer_lock(key)
+        if held is not False:
+            return None, bool(held)
+        
+        deadline = time.monotonic() + self.lock_timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            result = self._lookup(key)
+            if result is not None:
+                return result, False
+            delay = min(delay * 2, 0.5)
+        return None, False
+    
+    async def _wait_for_peer_async(self, key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Async version of _wait_for_peer. Sleeps between polls on the event loop,
+        so only the short backend calls use executor threads.
+        """
+        loop = asyncio.get_running_loop()
+        held = await loop.run_in_executor(None, self._peer_lock, key)
+        if held is not False:
+            return None, bool(held)
+        
+        deadline = time.monotonic() + self.lock_timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            result = await loop.run_in_executor(None, self._lookup, key)
+            if result is not None:
+                return result, False
+            delay = min(delay * 2, 0.5)
+        return None, False
+    
+    def _release_peer_lock(self, key: str) -> None:
+        try:
+            self.backend.delete(f"{key}:lock")
+        except Exception:
+            pass
+    
+    def get_or_fetch(self, key: str, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get cached search results, or fetch them once for all concurrent callers.
+        
+        Args:
+            key: Cache key from key()
+            fetch: Function performing the upstream search
+        
+        Returns:
+            Job search results
+        """
+        if not self.enabled:
+            return fetch()
+        
+        result = self._lookup(key)
+        if result is not None:
+            metrics.incr('search_cache.hits')
+            return result
+        
+        flight, leader = self._join(key)
+        if not leader:
+            metrics.incr('search_cache.coalesced')
+            flight.event.wait(self.lock_timeout)
+            if flight.result is not None:
+                return copy.deepcopy(flight.result)
+            # The leading call failed or timed out; search independently
+            return fetch()
+        
+        result = None
+        try:
+            result, locked = self._wait_for_peer(key)
+            if result is not None:
+                metrics.incr('search_cache.coalesced')
+                return result
+            
+            metrics.incr('search_cache.misses')
+            try:
+                result = fetch()
+                self._store(key, result)
+            finally:
+                if locked:
+                    self._release_peer_lock(key)
+            return result
+        finally:
+            self._land(key, flight, copy.deepcopy(result) if result is not None else None)
+    
+    async def get_or_fetch_async(self, key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Async version of get_or_fetch. Waiting never blocks the event loop.
+        
+        Args:
+            key: Cache key from key()
+            fetch: Coroutine function performing the upstream search
+        
+        Returns:
+            Job search results
+        """
+        if not self.enabled:
+            return await fetch()
+        
+        loop = asyncio.get_running_loop()
+        if isinstance(self.backend, LocalCacheBackend):
+            result = self._lookup(key)
+        else:
+            result = await loop.run_in_executor(None, self._lookup, key)
+        if result is not None:
+            metrics.incr('search_cache.hits')
+            return result
+        
+        flight, leader = self._join(key)
+        if not leader:
+            metrics.incr('search_cache.coalesced')
+            await flight.wait_async(self.lock_timeout)
+            if flight.result is not None:
+                return copy.deepcopy(flight.result)
+            return await fetch()
+        
+        result = None
+        try:
+            result, locked = await self._wait_for_peer_async(key)
+            if result is not None:
+                metrics.incr('search_cache.coalesced')
+                return result
+            
+            metrics.incr('search_cache.misses')
+            try:
+                result = await fetch()
+                if isinstance(self.backend, LocalCacheBackend):
+                    self._store(key, result)
+                else:
+                    await loop.run_in_executor(None, self._store, key, result)
+            finally:
+                if locked:
+                    await loop.run_in_executor(None, self._release_peer_lock, key)
+            return result
+        finally:
+            self._land(key, flight, copy.deepcopy(result) if result is not None else None)
+    
+    def clear(self) -> None:
+        """
+        Remove all cached search results.
+        """
+        self.backend.clear()
+
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+def get_search_cache_settings() -> Dict[str, Any]:
+    """
+    Get the LinkedIn search cache settings merged over their defaults.
+    """
+    return {**DEFAULT_SEARCH_CACHE, **getattr(settings, 'LINKEDIN_SEARCH_CACHE', {})}
+
+def build_search_cache(config: Optional[Dict[str, Any]] = None) -> SearchCache:
+    """
+    Build a search cache from LinkedIn search cache settings.
+    
+    Args:
+        config: Settings to use instead of settings.LINKEDIN_SEARCH_CACHE
+    
+    Returns:
+        New search cache
+    """
+    config = {**DEFAULT_SEARCH_CACHE, **config} if config is not None else get_search_cache_settings()
+    name = config['BACKEND']
+    
+    if name == 'local':
+        backend = LocalCacheBackend(config['MAX_ENTRIES'])
+    elif name == 'django':
+        backend = DjangoCacheBackend(config['CACHE_ALIAS'])
+    else:
+        raise ValueError(f"Unknown search cache backend: {name!r}")
+    
+    return SearchCache(backend, ttl=config['TTL'], lock_timeout=config['LOCK_TIMEOUT'],
+                       key_prefix=config['KEY_PREFIX'])
+
+def get_search_cache() -> SearchCache:
+    """
+    Get the process-wide search cache, building it on first use.
+    """
+    global _search_cache
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = build_search_cache()
+    return _search_cache
+
+def set_search_cache(search_cache: Optional[SearchCache]) -> Optional[SearchCache]:
+    """
+    Replace the process-wide search cache, e.g. to disable it in benchmarks.
+    
+    Args:
+        search_cache: New search cache, or None to rebuild from settings on next use
+    
+    Returns:
+        The previous search cache
+    """
+    global _search_cache
+    with _search_cache_lock:
+        previous, _search_cache = _search_cache, search_cache
+    return previous
+
+def _search_cache_rates() -> Dict[str, float]:
+    hits = metrics.get('search_cache.hits')
+    misses = metrics.get('search_cache.misses')
+    coalesced = metrics.get('search_cache.coalesced')
+    total = hits + misses + coalesced
+    return {
+        'hit_rate': ratio(hits, total),
+        'miss_rate': ratio(misses, total),
+        'coalesce_rate': ratio(coalesced, total),
+    }
+
+metrics.register_gauge('search_cache', _search_cache_rates)
@@ -0,0 +1,149 @@
+"""
+Record/replay transports for deterministic LinkedIn API benchmarks.
+
+RecordingTransport wraps another transport and writes every request with its
+response, or error, and latency to a gzip-compressed JSON-lines cassette.
+ReplayTransport serves a cassette back with no latency, the recorded latency
+or a fixed delay. Benchmarks then see identical upstream inputs on every run
+and measure only local compute.
+
+Requests are matched on method, endpoint and parameters. Cover letters are
+left out of application requests because they may vary between runs.
+Repeated identical requests are answered in recorded order, and the last
+response is reused once the recorded ones run out.
+"""
+import json
+import gzip
+import time
+import atexit
+import logging
+import threading
+from collections import defaultdict, deque
+from typing import Dict, Any, Optional, Union
+
+from .transport import Transport, TransportError, UpstreamError
+from .resilience import is_transient_error
+
+logger = logging.getLogger(__name__)
+
+# Request fields that do not identify a request when matching recordings
+_VOLATILE_FIELDS = ('cover_letter',)
+
+def request_key(method: str, endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+    """
+    Build the key used to match a request with its recording.
+    """
+    params = {key: value for key, value in (params or {}).items() if key not in _VOLATILE_FIELDS}
+    return json.dumps([method, endpoint, params], sort_keys=True, default=str)
+
+class RecordingTransport(Transport):
+    """
+    Transport that records requests and responses of another transport.
+    """
+    def __init__(self, inner: Transport, path: str):
+        self.inner = inner
+        self.path = path
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self._lock = threading.Lock()
+        self.recorded = 0
+        atexit.register(self.close)
+    
+    def _record(self, method: str, endpoint: str, params: Optional[Dict[str, Any]], func):
+        started = time.perf_counter()
+        entry = {'method': method, 'endpoint': endpoint, 'params': params or {}}
+        try:
+            response = func()
+        except UpstreamError as e:
+            entry['error'] = {'type': 'upstream', 'message': str(e), 'status': e.status, 'retry_after': e.retry_after}
+            raise
+        except Exception as e:
+            entry['error'] = {'type': 'transport', 'message': str(e), 'retryable': is_transient_error(e)}
+            raise
+        else:
+            entry['response'] = response
+            return response
+        finally:
+            entry['latency'] = round(time.perf_counter() - started, 6)
+            line = json.dumps(entry, default=str)
+            with self._lock:
+                if self._file is not None:
+                    self._file.write(line + '\n')
+                    self.recorded += 1
+    
+    def call_api(self, endpoint: str, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._record('GET', endpoint, query, lambda: self.inner.call_api(endpoint, query=query))
+    
+    def post_api(self, endpoint: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        return self._record('POST', endpoint, body, lambda: self.inner.post_api(endpoint, body))
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                logger.info(f"Recorded {self.recorded} LinkedIn API calls to {self.path}")
+        self.inner.close()
+
+class ReplayTransport(Transport):
+    """
+    Transport answering requests from a recorded cassette.
+    
+    Args:
+        path: Cassette file written by RecordingTransport
+        latency: 'none', 'recorded', or a fixed delay in seconds
+        strict: Raise TransportError for unrecorded requests instead of
+            returning an unsuccessful response
+    """
+    def __init__(self, path: str, latency: Union[str, float] = 'none', strict: bool = True):
+        self.path = path
+        self.latency = latency
+        self.strict = strict
+        self.misses = 0
+        self._entries = defaultdict(deque)
+        self._last = {}
+        self._lock = threading.Lock()
+        
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[request_key(entry['method'], entry['endpoint'], entry['params'])].append(entry)
+    
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+    
+    def _next(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entries = self._entries.get(key)
+            if entries:
+                self._last[key] = entries.popleft()
+            return self._last.get(key)
+    
+    def _replay(self, method: str, endpoint: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        entry = self._next(request_key(method, endpoint, params))
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            message = f"No recorded response for {method} {endpoint} {params or {}}"
+            if self.strict:
+                raise TransportError(message)
+            return {'success': False, 'message': message}
+        
+        if self.latency == 'recorded':
+            time.sleep(entry.get('latency', 0))
+        elif self.latency not in (None, 'none'):
+            time.sleep(float(self.latency))
+        
+        error = entry.get('error')
+        if error:
+            if error['type'] == 'upstream':
+                raise UpstreamError(error['message'], error['status'], error.get('retry_after'))
+            # Cassettes recorded before errors were marked replay them as retryable, as they were
+            raise TransportError(error['message'], retryable=error.get('retryable', True))
+        return entry['response']
+    
+    def call_api(self, endpoint: str, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._replay('GET', endpoint, query)
+    
+    def post_api(self, endpoint: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        return self._replay('POST', endpoint, body)
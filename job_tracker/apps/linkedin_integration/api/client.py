@@ -1,21 +1,88 @@
 """
 LinkedIn API Client for job search and application functionality.
 """
-import sys
 import logging
+import threading
 from typing import Dict, List, Optional, Any
 
-sys.path.append('/opt/.manus/.sandbox-runtime')
-from data_api import ApiClient
+from .transport import Transport, get_transport
+from .ratelimit import RateLimiter, get_rate_limiter
+from .cache import SearchCache, get_search_cache
+from .resilience import CircuitOpenError, ResiliencePolicy, get_resilience_policy
 
 logger = logging.getLogger(__name__)
 
 class LinkedInClient:
     """
     Client for interacting with LinkedIn API to search for jobs and people.
+    
+    The client holds no per-call state and is safe to share across threads.
+    Use get_linkedin_client() to get the process-wide instance. Every call
+    waits for the shared rate limiter before it is sent, transient failures
+    are retried under the resilience policy, and identical job searches are
+    answered from the shared search cache.
     """
-    def __init__(self):
-        self.client = ApiClient()
+    def __init__(self, transport: Optional[Transport] = None, limiter: Optional[RateLimiter] = None,
+                 search_cache: Optional[SearchCache] = None, resilience: Optional[ResiliencePolicy] = None):
+        self.client = transport or get_transport()
+        self._limiter = limiter
+        self._search_cache = search_cache
+        self._resilience = resilience
+        self._async_client = None
+    
+    @property
+    def limiter(self) -> RateLimiter:
+        return self._limiter or get_rate_limiter()
+    
+    @property
+    def search_cache(self) -> SearchCache:
+        return self._search_cache or get_search_cache()
+    
+    @property
+    def resilience(self) -> ResiliencePolicy:
+        return self._resilience or get_resilience_policy()
+    
+    def _call(self, endpoint: str, api_endpoint: str, query: Optional[Dict[str, Any]] = None,
+              body: Optional[Dict[str, Any]] = None, account: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Call the API under the rate limiter, retry policy and circuit breaker.
+        
+        Args:
+            endpoint: Rate limit and retry policy name, e.g. 'search'
+            api_endpoint: API endpoint name
+            query: Query parameters
+            body: Request data; if given, the data is posted to the endpoint
+            account: Optional account identifier for per-account rate limits
+            
+        Returns:
+            Decoded response dictionary
+        """
+        def attempt():
+            self.limiter.acquire(endpoint, account=account)
+            if body is not None:
+                return self.client.post_api(api_endpoint, body)
+            return self.client.call_api(api_endpoint, query=query)
+        
+        return self.resilience.call(endpoint, attempt)
+    
+    async def _shared_async_client(self):
+        """
+        Get the async client the sync wrappers run on, kept open on the shared
+        event loop so its HTTP session pools connections across calls.
+        
+        A new one is opened if the transport, limiter, cache or policy was replaced.
+        """
+        from .async_client import AsyncLinkedInClient
+        
+        parts = (self.client, self.limiter, self.search_cache, self.resilience)
+        current = self._async_client
+        if current is None or parts != (current.transport, current.limiter, current.search_cache, current.resilience):
+            self._async_client = await AsyncLinkedInClient(
+                self.client, limiter=parts[1], search_cache=parts[2], resilience=parts[3]
+            ).__aenter__()
+            if current is not None:
+                await current.__aexit__(None, None, None)
+        return self._async_client
         
     def search_jobs(self, 
                    keywords: str, 
@@ -38,54 +105,27 @@ class LinkedInClient:
         Returns:
             Dictionary containing job search results
         """
+        search_cache = self.search_cache
+        key = search_cache.key(keywords, location, company, job_type, start)
+        return search_cache.get_or_fetch(
+            key, lambda: self._fetch_jobs(keywords, location, company, job_type, start)
+        )
+    
+    def _fetch_jobs(self, keywords, location, company, job_type, start) -> Dict[str, Any]:
         try:
-            # This is a placeholder for the actual LinkedIn Jobs API
-            # In a real implementation, we would use the LinkedIn/search_jobs endpoint
-            # For now, we'll use the search_people endpoint as a demonstration
-            params = {
-                'keywords': keywords,
-                'start': str(start)
-            }
+            params = self.build_search_params(keywords, location, company, job_type, start)
             
-            if company:
-                params['company'] = company
-                
             # Call the LinkedIn API
-            response = self.client.call_api('LinkedIn/search_people', query=params)
-            
-            # Transform the response to a job-like format for demonstration
-            # In a real implementation, we would use the actual job search response format
-            if response.get('success'):
-                job_results = {
-                    'success': True,
-                    'message': 'Jobs found',
-                    'data': {
-                        'total': response['data']['total'],
-                        'jobs': []
-                    }
-                }
-                
-                # Transform people results to job-like format for demonstration
-                for person in response['data'].get('items', []):
-                    job_results['data']['jobs'].append({
-                        'title': f"Position at {person.get('headline', 'Unknown Company')}",
-                        'company': person.get('headline', '').split(' at ')[-1] if ' at ' in person.get('headline', '') else 'Unknown',
-                        'location': person.get('location', 'Remote'),
-                        'description': person.get('summary', 'No description available'),
-                        'url': person.get('profileURL', '#'),
-                        'posted_date': 'Recent',
-                        'job_id': f"job_{person.get('username', 'unknown')}"
-                    })
-                
-                return job_results
-            else:
-                logger.error(f"LinkedIn API error: {response.get('message', 'Unknown error')}")
-                return {
-                    'success': False,
-                    'message': response.get('message', 'Failed to search for jobs'),
-                    'data': {'total': 0, 'jobs': []}
-                }
-                
+            response = self._call('search', 'LinkedIn/search_people', params)
+            return self.parse_search_response(response)
+        
+        except CircuitOpenError as e:
+            logger.warning(f"Skipped LinkedIn job search: {str(e)}")
+            return {
+                'success': False,
+                'message': str(e),
+                'data': {'total': 0, 'jobs': []}
+            }
         except Exception as e:
             logger.exception(f"Error searching LinkedIn jobs: {str(e)}")
             return {
@@ -94,6 +134,130 @@ class LinkedInClient:
                 'data': {'total': 0, 'jobs': []}
             }
     
+    @staticmethod
+    def build_search_params(keywords: str,
+                            location: Optional[str] = None,
+                            company: Optional[str] = None,
+                            job_type: Optional[str] = None,
+                            start: int = 0) -> Dict[str, str]:
+        """
+        Build the query parameters for a job search request.
+        """
+        # This is a placeholder for the actual LinkedIn Jobs API
+        # In a real implementation, we would use the LinkedIn/search_jobs endpoint
+        # For now, we'll use the search_people endpoint as a demonstration
+        params = {
+            'keywords': keywords,
+            'start': str(start)
+        }
+        
+        if company:
+            params['company'] = company
+        
+        return params
+    
+    @staticmethod
+    def parse_search_response(response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Transform a raw search API response into job search results.
+        """
+        # Transform the response to a job-like format for demonstration
+        # In a real implementation, we would use the actual job search response format
+        if response.get('success'):
+            job_results = {
+                'success': True,
+                'message': 'Jobs found',
+                'data': {
+                    'total': response['data']['total'],
+                    'jobs': []
+                }
+            }
+            
+            # Transform people results to job-like format for demonstration
+            for person in response['data'].get('items', []):
+                job_results['data']['jobs'].append({
+                    'title': f"Position at {person.get('headline', 'Unknown Company')}",
+                    'company': person.get('headline', '').split(' at ')[-1] if ' at ' in person.get('headline', '') else 'Unknown',
+                    'location': person.get('location', 'Remote'),
+                    'description': person.get('summary', 'No description available'),
+                    'url': person.get('profileURL', '#'),
+                    'posted_date': 'Recent',
+                    'job_id': f"job_{person.get('username', 'unknown')}"
+                })
+            
+            return job_results
+        else:
+            logger.error(f"LinkedIn API error: {response.get('message', 'Unknown error')}")
+            return {
+                'success': False,
+                'message': response.get('message', 'Failed to search for jobs'),
+                'data': {'total': 0, 'jobs': []}
+            }
+    
+    def search_jobs_paginated(self,
+                              keywords: str,
+                              location: Optional[str] = None,
+                              company: Optional[str] = None,
+                              job_type: Optional[str] = None,
+                              max_results: int = 100) -> Dict[str, Any]:
+        """
+        Search for up to `max_results` jobs, fetching result pages concurrently.
+        
+        Synchronous wrapper around AsyncLinkedInClient.search_jobs_paginated.
+        
+        Returns:
+            Dictionary containing merged job search results, deduplicated by job_id
+        """
+        from .async_client import run_sync
+        
+        async def search():
+            client = await self._shared_async_client()
+            return await client.search_jobs_paginated(keywords, location, company, job_type,
+                                                      max_results=max_results)
+        
+        return run_sync(search)
+    
+    def search_many(self, queries: List[Dict[str, Any]], max_results: int = 10) -> Dict[str, Any]:
+        """
+        Run several job searches concurrently and merge their results.
+        
+        Synchronous wrapper around AsyncLinkedInClient.search_many.
+        
+        Args:
+            queries: List of search_jobs keyword arguments (keywords, location, company, job_type)
+            max_results: Maximum number of results per query
+        
+        Returns:
+            Dictionary containing merged job search results, deduplicated by job_id
+        """
+        from .async_client import run_sync
+        
+        async def search():
+            client = await self._shared_async_client()
+            return await client.search_many(queries, max_results=max_results)
+        
+        return run_sync(search)
+    
+    def get_job_details_many(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get details of several job postings, fetching them concurrently.
+        
+        Synchronous wrapper around AsyncLinkedInClient.get_job_details_many.
+        
+        Args:
+            job_ids: LinkedIn job IDs
+        
+        Returns:
+            Dictionary mapping each job ID to its get_job_details result
+        """
+        from .async_client import run_sync
+        
+        async def fetch():
+            client = await self._shared_async_client()
+            return await client.get_job_details_many(job_ids)
+        
+        return run_sync(fetch)
+    
     def get_job_details(self, job_id: str) -> Dict[str, Any]:
         """
         Get detailed information about a specific job posting.
@@ -104,37 +268,16 @@ class LinkedInClient:
         Returns:
             Dictionary containing detailed job information
         """
-        # This is a placeholder for the actual job details API
-        # In a real implementation, we would fetch the actual job details
         try:
-            # Simulate job details retrieval
-            return {
-                'success': True,
-                'message': 'Job details retrieved',
-                'data': {
-                    'job_id': job_id,
-                    'title': 'Software Engineer',
-                    'company': 'Tech Company',
-                    'location': 'Remote',
-                    'description': 'We are looking for a software engineer with experience in Python and Django...',
-                    'requirements': [
-                        'Python experience',
-                        'Django framework knowledge',
-                        'Database skills',
-                        'API development'
-                    ],
-                    'responsibilities': [
-                        'Develop web applications',
-                        'Maintain existing codebase',
-                        'Collaborate with team members',
-                        'Write clean, maintainable code'
-                    ],
-                    'posted_date': '2025-03-30',
-                    'application_url': 'https://linkedin.com/jobs/view/123456',
-                    'salary_range': '$100,000 - $130,000',
-                    'job_type': 'Full-time'
+            response = self._call('details', 'LinkedIn/get_job_details', {'job_id': job_id})
+            if not response.get('success'):
+                logger.error(f"LinkedIn API error: {response.get('message', 'Unknown error')}")
+                return {
+                    'success': False,
+                    'message': response.get('message', 'Failed to get job details'),
+                    'data': {}
                 }
-            }
+            return response
         except Exception as e:
             logger.exception(f"Error getting job details: {str(e)}")
             return {
@@ -144,7 +287,7 @@ class LinkedInClient:
             }
     
     def apply_for_job(self, job_id: str, user_profile: Dict[str, Any], 
-                     cover_letter: str) -> Dict[str, Any]:
+                     cover_letter: str, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Apply for a job on LinkedIn.
         
@@ -152,24 +295,30 @@ class LinkedInClient:
             job_id: The LinkedIn job ID
             user_profile: User profile information
             cover_letter: Generated cover letter for the application
+            idempotency_key: Optional key identifying the submission; retries
+                and resubmissions with the same key are applied once upstream
             
         Returns:
             Dictionary containing application status
         """
-        # This is a placeholder for the actual job application API
-        # In a real implementation, we would submit the application through LinkedIn
+        body = {
+            'job_id': job_id,
+            'user_profile': user_profile,
+            'cover_letter': cover_letter
+        }
+        if idempotency_key:
+            body['idempotency_key'] = idempotency_key
+        
         try:
-            # Simulate job application
-            return {
-                'success': True,
-                'message': 'Application submitted successfully',
-                'data': {
-                    'application_id': f"app_{job_id}_{user_profile.get('id', 'unknown')}",
-                    'status': 'submitted',
-                    'submission_date': '2025-04-03',
-                    'job_id': job_id
+            response = self._call('apply', 'LinkedIn/apply_for_job', body=body, account=user_profile.get('id'))
+            if not response.get('success'):
+                logger.error(f"LinkedIn API error: {response.get('message', 'Unknown error')}")
+                return {
+                    'success': False,
+                    'message': response.get('message', 'Failed to apply for job'),
+                    'data': {}
                 }
-            }
+            return response
         except Exception as e:
             logger.exception(f"Error applying for job: {str(e)}")
             return {
@@ -177,3 +326,28 @@ class LinkedInClient:
                 'message': f"Error applying for job: {str(e)}",
                 'data': {}
             }
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_linkedin_client() -> LinkedInClient:
+    """
+    Get the process-wide LinkedIn client.
+    
+    The client shares the pooled process-wide transport, so connections stay
+    warm across requests, threads and automation runs.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = LinkedInClient()
+    return _client
+
+def reset_linkedin_client() -> None:
+    """
+    Drop the process-wide client so it is rebuilt from the current transport.
+    """
+    global _client
+    with _client_lock:
+        _client = None
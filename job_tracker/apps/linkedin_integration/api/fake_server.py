@@ -0,0 +1,328 @@
+"""
+Local stand-in for the LinkedIn API, for load testing and benchmarks.
+
+FakeLinkedInServer serves synthetic job search, job detail and application
+endpoints in the format the HTTP transport expects. It can add latency drawn
+from a configurable distribution, inject server errors and answer with
+HTTP 429 once a request rate is exceeded. Point the client at it with:
+    
+    LINKEDIN_API = {'TRANSPORT': 'http', 'BASE_URL': server.base_url}
+
+Responses are deterministic for a given query, so repeated benchmark runs
+see the same jobs.
+"""
+import json
+import math
+import time
+import random
+import hashlib
+import logging
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+_COMPANIES = [
+    'Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries',
+    'Wayne Enterprises', 'Cyberdyne', 'Soylent', 'Vandelay Industries',
+]
+_TITLES = [
+    'Software Engineer', 'Senior Python Developer', 'Backend Engineer', 'Full Stack Developer',
+    'Data Engineer', 'DevOps Engineer', 'Machine Learning Engineer', 'Frontend Developer',
+]
+_LOCATIONS = ['Remote', 'New York, NY', 'San Francisco, CA', 'Austin, TX', 'London, UK', 'Berlin, Germany']
+_SKILLS = [
+    'Python', 'Django', 'Flask', 'JavaScript', 'TypeScript', 'React', 'Node.js', 'PostgreSQL',
+    'MySQL', 'MongoDB', 'Redis', 'Docker', 'Kubernetes', 'AWS', 'GCP', 'Terraform', 'Git',
+    'REST API', 'GraphQL', 'Machine Learning', 'TensorFlow', 'Pandas', 'Go', 'Java', 'SQL',
+]
+_DEGREES = ["Bachelor's degree in Computer Science", "Master's degree in Computer Science", 'BS in Engineering']
+
+class LatencyModel:
+    """
+    Random response latency.
+    
+    Distributions:
+        fixed: always `mean_ms`
+        uniform: between `mean_ms - jitter_ms` and `mean_ms + jitter_ms`
+        normal: mean `mean_ms`, standard deviation `jitter_ms`
+        lognormal: median `mean_ms` with a long tail controlled by `jitter_ms`
+        exponential: mean `mean_ms`
+    """
+    DISTRIBUTIONS = ('fixed', 'uniform', 'normal', 'lognormal', 'exponential')
+    
+    def __init__(self, distribution: str = 'fixed', mean_ms: float = 0, jitter_ms: float = 0,
+                 seed: Optional[int] = None):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution!r}")
+        self.distribution = distribution
+        self.mean_ms = mean_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def sample(self) -> float:
+        """
+        Draw a latency in seconds.
+        """
+        if self.mean_ms <= 0:
+            return 0.0
+        
+        with self._lock:
+            if self.distribution == 'fixed':
+                value = self.mean_ms
+            elif self.distribution == 'uniform':
+                value = self._random.uniform(self.mean_ms - self.jitter_ms, self.mean_ms + self.jitter_ms)
+            elif self.distribution == 'normal':
+                value = self._random.gauss(self.mean_ms, self.jitter_ms)
+            elif self.distribution == 'lognormal':
+                sigma = math.log1p(self.jitter_ms / self.mean_ms) if self.jitter_ms else 0.0
+                value = self._random.lognormvariate(math.log(self.mean_ms), sigma)
+            else:
+                value = self._random.expovariate(1.0 / self.mean_ms)
+        return max(value, 0.0) / 1000.0
+
+def _seeded(*parts: Any) -> random.Random:
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+def _slug(value: str) -> str:
+    return '-'.join(value.lower().split()) or 'any'
+
+def synthetic_description(rng: random.Random, title: str, company: str) -> str:
+    """
+    Build a job description with sections, skills and experience requirements.
+    """
+    required = rng.sample(_SKILLS, 5)
+    preferred = rng.sample([skill for skill in _SKILLS if skill not in required], 3)
+    years = rng.randint(1, 8)
+    return (
+        f"{company} is hiring a {title} to build and scale our platform.\n\n"
+        f"Requirements:\n"
+        f"- {years}+ years of experience in software development\n"
+        f"- Strong experience with {', '.join(required[:3])}\n"
+        f"- Working knowledge of {required[3]} and {required[4]}\n"
+        f"- {rng.choice(_DEGREES)} or equivalent experience\n\n"
+        f"Nice to have:\n"
+        f"- Experience with {', '.join(preferred)}\n\n"
+        f"Responsibilities:\n"
+        f"- Design, build and maintain services\n"
+        f"- Collaborate with product and design teams\n"
+        f"- Write clean, tested, maintainable code\n"
+    )
+
+class FakeLinkedInServer:
+    """
+    Threaded HTTP server imitating the LinkedIn API.
+    """
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: Optional[LatencyModel] = None,
+                 error_rate: float = 0.0, rate_limit: Optional[float] = None, total_results: int = 500,
+                 seed: int = 0):
+        self.latency = latency or LatencyModel()
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.total_results = total_results
+        self.seed = seed
+        self.stats = Counter()
+        # Applications by idempotency key, so retried submissions are not applied twice
+        self.applications: Dict[str, Dict[str, Any]] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # Burst of one second's worth of requests, but at least one request below one per second
+        self._bucket_tokens = max(1.0, rate_limit) if rate_limit else 0.0
+        self._bucket_updated = time.monotonic()
+        self._thread = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> 'FakeLinkedInServer':
+        """
+        Serve requests on a background thread.
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='fake-linkedin', daemon=True)
+        self._thread.start()
+        return self
+    
+    def serve_forever(self) -> None:
+        self.httpd.serve_forever()
+    
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def __enter__(self) -> 'FakeLinkedInServer':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+    
+    def _throttle(self) -> Optional[float]:
+        """
+        Apply the server-side rate limit.
+        
+        Returns:
+            Seconds the client should wait if the request is rejected, else None
+        """
+        if not self.rate_limit:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            self._bucket_tokens = min(max(1.0, self.rate_limit), self._bucket_tokens + (now - self._bucket_updated) * self.rate_limit)
+            self._bucket_updated = now
+            if self._bucket_tokens >= 1:
+                self._bucket_tokens -= 1
+                return None
+            return (1 - self._bucket_tokens) / self.rate_limit
+    
+    def _fail(self) -> bool:
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+    
+    def search(self, query: Dict[str, str]) -> Dict[str, Any]:
+        keywords = query.get('keywords', '')
+        company = query.get('company')
+        start = int(query.get('start', 0) or 0)
+        items: List[Dict[str, Any]] = []
+        for index in range(start, min(start + 10, self.total_results)):
+            rng = _seeded(self.seed, keywords, company, index)
+            title = rng.choice(_TITLES)
+            employer = company or rng.choice(_COMPANIES)
+            items.append({
+                'username': f"{_slug(keywords)}-{index}",
+                'headline': f"{title} at {employer}",
+                'location': rng.choice(_LOCATIONS),
+                'summary': synthetic_description(rng, title, employer),
+                'profileURL': f"https://www.linkedin.com/jobs/view/{_slug(keywords)}-{index}",
+            })
+        return {'success': True, 'message': 'OK', 'data': {'total': self.total_results, 'items': items}}
+    
+    def job_details(self, job_id: str) -> Dict[str, Any]:
+        rng = _seeded(self.seed, job_id)
+        title = rng.choice(_TITLES)
+        company = rng.choice(_COMPANIES)
+        skills = rng.sample(_SKILLS, 4)
+        low = rng.randrange(70, 160, 5) * 1000
+        return {
+            'success': True,
+            'message': 'Job details retrieved',
+            'data': {
+                'job_id': job_id,
+                'title': title,
+                'company': company,
+                'location': rng.choice(_LOCATIONS),
+                'description': synthetic_description(rng, title, company),
+                'requirements': [f"{skill} experience" for skill in skills],
+                'responsibilities': [
+                    'Design, build and maintain services',
+                    'Collaborate with product and design teams',
+                    'Write clean, tested, maintainable code',
+                ],
+                'posted_date': '2025-03-30',
+                'application_url': f"https://www.linkedin.com/jobs/view/{job_id}",
+                'salary_range': f"${low:,} - ${low + 30000:,}",
+                'job_type': 'Full-time',
+            }
+        }
+    
+    def apply(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = body.get('job_id')
+        user_id = (body.get('user_profile') or {}).get('id', 'unknown')
+        key = body.get('idempotency_key')
+        with self._lock:
+            if key and key in self.applications:
+                self.stats['apply_replayed'] += 1
+                return self.applications[key]
+            self.stats['apply_submitted'] += 1
+            response = {
+                'success': True,
+                'message': 'Application submitted successfully',
+                'data': {
+                    'application_id': f"app_{job_id}_{user_id}",
+                    'status': 'submitted',
+                    'submission_date': time.strftime('%Y-%m-%d'),
+                    'job_id': job_id,
+                }
+            }
+            if key:
+                self.applications[key] = response
+        return response
+    
+    def _handler_class(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            
+            def log_message(self, format, *args):
+                logger.debug(f"Fake LinkedIn: {format % args}")
+            
+            def _send(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def _handle(self, method: str):
+                parts = urlsplit(self.path)
+                endpoint = parts.path.strip('/')
+                query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+                body = {}
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                
+                if endpoint == '_stats':
+                    with server._lock:
+                        stats = dict(server.stats)
+                    return self._send(200, {'success': True, 'data': stats})
+                
+                with server._lock:
+                    server.stats[f"requests.{endpoint}"] += 1
+                
+                retry_after = server._throttle()
+                if retry_after is not None:
+                    with server._lock:
+                        server.stats['throttled'] += 1
+                    return self._send(429, {'success': False, 'message': 'Rate limit exceeded'},
+                                      {'Retry-After': f"{retry_after:.3f}"})
+                
+                time.sleep(server.latency.sample())
+                
+                if server._fail():
+                    with server._lock:
+                        server.stats['errors'] += 1
+                    return self._send(503, {'success': False, 'message': 'Injected failure'})
+                
+                if method == 'GET' and endpoint.endswith('search_people'):
+                    return self._send(200, server.search(query))
+                if method == 'GET' and endpoint.endswith('get_job_details'):
+                    return self._send(200, server.job_details(query.get('job_id', '')))
+                if method == 'POST' and endpoint.endswith('apply_for_job'):
+                    return self._send(200, server.apply(body))
+                return self._send(404, {'success': False, 'message': f"Unknown endpoint: {endpoint}"})
+            
+            def do_GET(self):
+                self._handle('GET')
+            
+            def do_POST(self):
+                self._handle('POST')
+        
+        return Handler
@@ -0,0 +1,66 @@
+"""
+In-process metrics for the LinkedIn API layer.
+
+Counters are incremented by the client, cache and rate limiter. Gauges are
+callables evaluated when a snapshot is taken. The snapshot is exposed to
+staff through the LinkedIn API metrics view.
+"""
+import threading
+from collections import Counter
+from typing import Callable, Dict, Any
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of counters and gauges.
+    """
+    def __init__(self):
+        self._counters = Counter()
+        self._gauges: Dict[str, Callable[[], Any]] = {}
+        self._lock = threading.Lock()
+    
+    def incr(self, name: str, value: int = 1) -> None:
+        """
+        Increment a counter.
+        """
+        with self._lock:
+            self._counters[name] += value
+    
+    def get(self, name: str) -> int:
+        """
+        Get the current value of a counter.
+        """
+        with self._lock:
+            return self._counters[name]
+    
+    def register_gauge(self, name: str, func: Callable[[], Any]) -> None:
+        """
+        Register a callable whose value is reported in snapshots.
+        """
+        with self._lock:
+            self._gauges[name] = func
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current value of every counter and gauge.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+        
+        values = {name: func() for name, func in gauges.items()}
+        return {'counters': counters, 'gauges': values}
+    
+    def reset(self) -> None:
+        """
+        Reset all counters to zero.
+        """
+        with self._lock:
+            self._counters.clear()
+
+def ratio(numerator: int, denominator: int) -> float:
+    """
+    Safely divide two counters.
+    """
+    return round(numerator / denominator, 4) if denominator else 0.0
+
+metrics = MetricsRegistry()
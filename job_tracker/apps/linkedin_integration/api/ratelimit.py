@@ -0,0 +1,265 @@
+"""
+Token-bucket rate limiting for LinkedIn API calls.
+
+Limits are defined per endpoint ('search', 'details', 'apply') and,
+optionally, per account, so one user cannot use up the shared upstream quota.
+Buckets use the generic cell rate algorithm (GCRA). This is a token bucket
+that stores a single timestamp per bucket: the theoretical arrival time (TAT)
+of the next request. Reserving a token never fails. It returns how long the
+caller must wait before the request conforms, so callers sleep exactly as long
+as needed instead of polling.
+
+Bucket state lives in a backend so every worker shares it:
+
+- 'local': in-process, for a single scheduler process or development
+- 'redis': atomic Lua script on a shared Redis server
+- 'database': a RateLimitBucket row locked with SELECT ... FOR UPDATE
+"""
+import time
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+try:
+    import redis
+except ImportError:  # redis is optional; only needed for the 'redis' backend
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMITS = {
+    'BACKEND': 'local',  # 'local', 'redis' or 'database'
+    'REDIS_URL': 'redis://localhost:6379/0',
+    'KEY_PREFIX': 'linkedin:ratelimit',
+    # Requests per second and burst size, shared by all accounts
+    'LIMITS': {
+        'search': {'rate': 5.0, 'burst': 10},
+        'details': {'rate': 5.0, 'burst': 10},
+        'apply': {'rate': 1.0, 'burst': 5},
+    },
+    # Requests per second and burst size for each account
+    'ACCOUNT_LIMITS': {
+        'apply': {'rate': 0.5, 'burst': 1},
+    },
+}
+
+# Waits recorded for the innermost track_waits() block of the current context
+_waits: ContextVar[Optional[List[float]]] = ContextVar('rate_limit_waits', default=None)
+
+@contextmanager
+def track_waits() -> Iterator[List[float]]:
+    """
+    Collect the rate limit waits of calls made in this block.
+    
+    Yields:
+        List receiving the seconds waited by each acquire
+    """
+    waits = []
+    token = _waits.set(waits)
+    try:
+        yield waits
+    finally:
+        _waits.reset(token)
+
+def _record_wait(wait: float) -> None:
+    waits = _waits.get()
+    if waits is not None:
+        waits.append(wait)
+
+class LocalBackend:
+    """
+    In-process bucket storage.
+    """
+    def __init__(self):
+        self._tats: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def reserve(self, key: str, interval: float, tolerance: float) -> float:
+        with self._lock:
+            now = time.time()
+            tat = max(self._tats.get(key, now), now)
+            self._tats[key] = tat + interval
+            return max(0.0, tat - tolerance - now)
+
+class RedisBackend:
+    """
+    Bucket storage in Redis, updated atomically by a Lua script.
+    """
+    SCRIPT = """
+    local now = redis.call('TIME')
+    now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+    local interval = tonumber(ARGV[1])
+    local tolerance = tonumber(ARGV[2])
+    local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+    if tat < now then tat = now end
+    local new_tat = tat + interval
+    redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now + tolerance) * 1000) + 1000)
+    local wait = tat - tolerance - now
+    if wait < 0 then wait = 0 end
+    return tostring(wait)
+    """
+    
+    def __init__(self, url: str):
+        if redis is None:
+            raise ImportError("The 'redis' rate limiter backend requires the redis package")
+        self.client = redis.Redis.from_url(url)
+        self.script = self.client.register_script(self.SCRIPT)
+    
+    def reserve(self, key: str, interval: float, tolerance: float) -> float:
+        return float(self.script(keys=[key], args=[interval, tolerance]))
+
+class DatabaseBackend:
+    """
+    Bucket storage in the RateLimitBucket table.
+    """
+    def reserve(self, key: str, interval: float, tolerance: float) -> float:
+        from ..models import RateLimitBucket
+        
+        with transaction.atomic():
+            bucket, created = RateLimitBucket.objects.select_for_update().get_or_create(key=key)
+            now = time.time()
+            tat = max(bucket.tat, now)
+            bucket.tat = tat + interval
+            bucket.save(update_fields=['tat', 'updated_at'])
+        return max(0.0, tat - tolerance - now)
+
+class RateLimiter:
+    """
+    Rate limiter applying per-endpoint and per-account token buckets.
+    """
+    def __init__(self, backend, limits: Dict[str, Dict[str, float]],
+                 account_limits: Optional[Dict[str, Dict[str, float]]] = None,
+                 key_prefix: str = 'linkedin:ratelimit'):
+        self.backend = backend
+        self.limits = limits
+        self.account_limits = account_limits or {}
+        self.key_prefix = key_prefix
+    
+    def _buckets(self, endpoint: str, account: Optional[Any]) -> List[Tuple[str, float, float]]:
+        buckets = []
+        limit = self.limits.get(endpoint)
+        if limit:
+            buckets.append((f"{self.key_prefix}:{endpoint}", limit))
+        limit = self.account_limits.get(endpoint)
+        if limit and account is not None:
+            buckets.append((f"{self.key_prefix}:{endpoint}:account:{account}", limit))
+        
+        return [
+            (key, 1.0 / limit['rate'], (max(limit.get('burst', 1), 1) - 1) / limit['rate'])
+            for key, limit in buckets
+        ]
+    
+    def reserve(self, endpoint: str, account: Optional[Any] = None) -> float:
+        """
+        Reserve a request slot without waiting.
+        
+        Args:
+            endpoint: Endpoint name, e.g. 'apply'
+            account: Optional account identifier for per-account limits
+        
+        Returns:
+            Seconds to wait before the request may be sent
+        """
+        wait = 0.0
+        for key, interval, tolerance in self._buckets(endpoint, account):
+            try:
+                wait = max(wait, self.backend.reserve(key, interval, tolerance))
+            except Exception as e:
+                # Never let limiter storage problems stop the request itself
+                logger.exception(f"Error reserving rate limit for {key}: {str(e)}")
+        return wait
+    
+    def acquire(self, endpoint: str, account: Optional[Any] = None) -> float:
+        """
+        Block until a request to the endpoint is allowed.
+        
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(endpoint, account)
+        _record_wait(wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    async def acquire_async(self, endpoint: str, account: Optional[Any] = None) -> float:
+        """
+        Wait without blocking the event loop until a request is allowed.
+        
+        Returns:
+            Seconds waited
+        """
+        if isinstance(self.backend, LocalBackend):
+            wait = self.reserve(endpoint, account)
+        else:
+            loop = asyncio.get_running_loop()
+            wait = await loop.run_in_executor(None, self.reserve, endpoint, account)
+        _record_wait(wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+def get_rate_limit_settings() -> Dict[str, Any]:
+    """
+    Get the LinkedIn rate limit settings merged over their defaults.
+    """
+    return {**DEFAULT_RATE_LIMITS, **getattr(settings, 'LINKEDIN_RATE_LIMITS', {})}
+
+def build_rate_limiter(config: Optional[Dict[str, Any]] = None) -> RateLimiter:
+    """
+    Build a rate limiter from LinkedIn rate limit settings.
+    
+    Args:
+        config: Settings to use instead of settings.LINKEDIN_RATE_LIMITS
+    
+    Returns:
+        New rate limiter
+    """
+    config = {**DEFAULT_RATE_LIMITS, **config} if config is not None else get_rate_limit_settings()
+    name = config['BACKEND']
+    
+    if name == 'local':
+        backend = LocalBackend()
+    elif name == 'redis':
+        backend = RedisBackend(config['REDIS_URL'])
+    elif name == 'database':
+        backend = DatabaseBackend()
+    else:
+        raise ValueError(f"Unknown rate limiter backend: {name!r}")
+    
+    return RateLimiter(backend, config['LIMITS'], config['ACCOUNT_LIMITS'], config['KEY_PREFIX'])
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide rate limiter, building it on first use.
+    """
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = build_rate_limiter()
+    return _limiter
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> Optional[RateLimiter]:
+    """
+    Replace the process-wide rate limiter, e.g. to disable limits in benchmarks.
+    
+    Args:
+        limiter: New rate limiter, or None to rebuild from settings on next use
+    
+    Returns:
+        The previous rate limiter
+    """
+    global _limiter
+    with _limiter_lock:
+        previous, _limiter = _limiter, limiter
+    return previous
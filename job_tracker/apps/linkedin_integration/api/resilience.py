@@ -0,0 +1,302 @@
+"""
+Retry and circuit breaker policies for LinkedIn API calls.
+
+Idempotent calls (search, job details) are retried on transient failures
+with jittered exponential backoff, honouring Retry-After. Each endpoint also
+has a circuit breaker. After repeated failures it opens and rejects calls
+immediately, so an upstream outage costs workers nothing instead of a timeout
+per job. After a recovery timeout one trial call is let through
+('half-open'). Any answer from the endpoint closes the breaker again, and a
+transient failure reopens it.
+"""
+import time
+import socket
+import logging
+import threading
+import http.client
+from typing import Dict, Any, Awaitable, Callable, Optional
+
+from django.conf import settings
+from tenacity import (
+    AsyncRetrying, Retrying, retry_if_exception, stop_after_attempt, wait_random_exponential,
+)
+
+from .metrics import metrics
+from .transport import TransportError, UpstreamError
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESILIENCE = {
+    # Attempts per call, including the first; non-idempotent endpoints are not retried
+    'ATTEMPTS': {
+        'search': 4,
+        'details': 4,
+        'apply': 1,
+    },
+    'BACKOFF_INITIAL': 0.5,  # Seconds
+    'BACKOFF_MAX': 10,  # Seconds
+    'BREAKER_FAILURE_THRESHOLD': 5,  # Consecutive failures that open the breaker
+    'BREAKER_RECOVERY_TIMEOUT': 30,  # Seconds before a trial call is allowed
+}
+
+class CircuitOpenError(TransportError):
+    """
+    Raised when a call is rejected because the endpoint's circuit is open.
+    """
+    pass
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for one endpoint.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """
+        Check whether a call may be made now.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.time() - self.opened_at >= self.recovery_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit for LinkedIn {self.name} closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+    
+    def release_trial(self) -> None:
+        """
+        Let another trial call through after one that ended without a verdict.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit for LinkedIn {self.name} opened after {self.failures} failures")
+                    metrics.incr(f"circuit_breaker.{self.name}.opened")
+                self.state = self.OPEN
+                self.opened_at = time.time()
+                self._trial_in_flight = False
+    
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'opened_at': self.opened_at,
+            }
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Check whether an error is worth retrying.
+    
+    Connection failures, timeouts and overloaded or failing upstream responses
+    are; transport errors only if marked retryable.
+    """
+    if isinstance(error, TransportError):
+        return error.retryable and not isinstance(error, CircuitOpenError)
+    if isinstance(error, (ConnectionError, socket.timeout, TimeoutError, http.client.HTTPException)):
+        return True
+    if aiohttp is not None and isinstance(error, aiohttp.ClientError):
+        return True
+    return False
+
+class ResiliencePolicy:
+    """
+    Applies retries with backoff and a circuit breaker per endpoint.
+    """
+    def __init__(self, attempts: Dict[str, int], backoff_initial: float = 0.5, backoff_max: float = 10,
+                 failure_threshold: int = 5, recovery_timeout: float = 30):
+        self.attempts = attempts
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker for an endpoint.
+        """
+        with self._lock:
+            if endpoint not in self._breakers:
+                self._breakers[endpoint] = CircuitBreaker(endpoint, self.failure_threshold, self.recovery_timeout)
+            return self._breakers[endpoint]
+    
+    def breaker_states(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.status() for breaker in breakers}
+    
+    def _wait(self, retry_state) -> float:
+        jittered = wait_random_exponential(multiplier=self.backoff_initial, max=self.backoff_max)(retry_state)
+        error = retry_state.outcome.exception()
+        if isinstance(error, UpstreamError) and error.retry_after:
+            return max(error.retry_after, jittered)
+        return jittered
+    
+    def _retry_options(self, endpoint: str) -> Dict[str, Any]:
+        def before_sleep(retry_state):
+            metrics.incr(f"retries.{endpoint}")
+            logger.warning(f"Retrying LinkedIn {endpoint} after error: {retry_state.outcome.exception()}")
+        
+        return {
+            'stop': stop_after_attempt(max(self.attempts.get(endpoint, 1), 1)),
+            'wait': self._wait,
+            'retry': retry_if_exception(is_transient_error),
+            'before_sleep': before_sleep,
+            'reraise': True,
+        }
+    
+    def _before_call(self, endpoint: str, breaker: CircuitBreaker) -> None:
+        if not breaker.allow():
+            metrics.incr(f"circuit_breaker.{endpoint}.rejected")
+            raise CircuitOpenError(f"LinkedIn {endpoint} is temporarily unavailable")
+    
+    def _after_error(self, breaker: CircuitBreaker, error: BaseException) -> None:
+        if not isinstance(error, Exception):
+            # Cancelled calls say nothing about the endpoint
+            breaker.release_trial()
+        elif is_transient_error(error):
+            breaker.record_failure()
+        else:
+            # The endpoint answered; the error is about this call, not the endpoint
+            breaker.record_success()
+    
+    def call(self, endpoint: str, func: Callable[[], Any]) -> Any:
+        """
+        Call a function under the endpoint's retry policy and circuit breaker.
+        
+        Args:
+            endpoint: Endpoint name, e.g. 'search'
+            func: Function performing one attempt
+        
+        Returns:
+            The function's result
+        
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+        """
+        breaker = self.breaker(endpoint)
+        for attempt in Retrying(**self._retry_options(endpoint)):
+            with attempt:
+                self._before_call(endpoint, breaker)
+                try:
+                    result = func()
+                except BaseException as e:
+                    self._after_error(breaker, e)
+                    raise
+                breaker.record_success()
+        return result
+    
+    async def call_async(self, endpoint: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async version of call. Backoff waits do not block the event loop.
+        
+        Args:
+            endpoint: Endpoint name, e.g. 'search'
+            func: Coroutine function performing one attempt
+        
+        Returns:
+            The coroutine's result
+        """
+        breaker = self.breaker(endpoint)
+        async for attempt in AsyncRetrying(**self._retry_options(endpoint)):
+            with attempt:
+                self._before_call(endpoint, breaker)
+                try:
+                    result = await func()
+                except BaseException as e:
+                    self._after_error(breaker, e)
+                    raise
+                breaker.record_success()
+        return result
+
+_policy = None
+_policy_lock = threading.Lock()
+
+def get_resilience_settings() -> Dict[str, Any]:
+    """
+    Get the LinkedIn resilience settings merged over their defaults.
+    """
+    return {**DEFAULT_RESILIENCE, **getattr(settings, 'LINKEDIN_API_RESILIENCE', {})}
+
+def build_resilience_policy(config: Optional[Dict[str, Any]] = None) -> ResiliencePolicy:
+    """
+    Build a resilience policy from LinkedIn resilience settings.
+    
+    Args:
+        config: Settings to use instead of settings.LINKEDIN_API_RESILIENCE
+    
+    Returns:
+        New resilience policy
+    """
+    config = {**DEFAULT_RESILIENCE, **config} if config is not None else get_resilience_settings()
+    return ResiliencePolicy(
+        attempts=config['ATTEMPTS'],
+        backoff_initial=config['BACKOFF_INITIAL'],
+        backoff_max=config['BACKOFF_MAX'],
+        failure_threshold=config['BREAKER_FAILURE_THRESHOLD'],
+        recovery_timeout=config['BREAKER_RECOVERY_TIMEOUT']
+    )
+
+def get_resilience_policy() -> ResiliencePolicy:
+    """
+    Get the process-wide resilience policy, building it on first use.
+    """
+    global _policy
+    if _policy is None:
+        with _policy_lock:
+            if _policy is None:
+                _policy = build_resilience_policy()
+    return _policy
+
+def set_resilience_policy(policy: Optional[ResiliencePolicy]) -> Optional[ResiliencePolicy]:
+    """
+    Replace the process-wide resilience policy.
+    
+    Args:
+        policy: New policy, or None to rebuild from settings on next use
+    
+    Returns:
+        The previous policy
+    """
+    global _policy
+    with _policy_lock:
+        previous, _policy = _policy, policy
+    return previous
+
+metrics.register_gauge('circuit_breakers', lambda: get_resilience_policy().breaker_states())
@@ -0,0 +1,427 @@
+"""
+Transports used by LinkedInClient to reach the LinkedIn data API.
+
+A transport performs a single API call and returns the decoded response
+dictionary. Transports are built once per process by get_transport() and
+shared by every client, so connections are reused across requests, threads
+and automation runs instead of being set up again for each call.
+"""
+import sys
+import json
+import queue
+import logging
+import threading
+import http.client
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+from urllib.parse import urlencode, urlsplit
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LINKEDIN_API = {
+    'TRANSPORT': 'data_api',  # 'data_api', 'http', 'record' or 'replay'
+    'BASE_URL': '',  # Required for the 'http' transport
+    'CASSETTE': '',  # Cassette file for the 'record' and 'replay' transports
+    'RECORD_TRANSPORT': 'data_api',  # Transport whose calls the 'record' transport captures
+    'REPLAY_LATENCY': 'none',  # 'none', 'recorded' or a delay in seconds
+    'POOL_SIZE': 10,  # Maximum number of pooled connections
+    'POOL_TIMEOUT': 30,  # Seconds to wait for a free connection
+    'CONNECT_TIMEOUT': 5,  # Seconds
+    'READ_TIMEOUT': 30,  # Seconds
+    'MAX_CONCURRENCY': 8,  # Concurrent requests per async search
+    'PAGE_SIZE': 10,  # Results per search page returned upstream
+}
+
+class TransportError(Exception):
+    """
+    Raised when a transport cannot complete a call.
+    
+    Args:
+        message: Error message
+        retryable: Whether the same call may succeed if tried again; errors in
+            the call itself, e.g. an unsupported endpoint, are not
+    """
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+class UpstreamError(TransportError):
+    """
+    Raised when the upstream API is overloaded or failing (HTTP 429 or 5xx).
+    """
+    def __init__(self, message: str, status: int, retry_after: Optional[float] = None):
+        super().__init__(message, retryable=True)
+        self.status = status
+        self.retry_after = retry_after
+
+def raise_for_upstream_status(endpoint: str, status: int, retry_after: Optional[str] = None) -> None:
+    """
+    Raise UpstreamError for responses that signal an overloaded or failing upstream.
+    
+    Args:
+        endpoint: API endpoint name
+        status: HTTP status code
+        retry_after: Value of the Retry-After header, if any
+    """
+    if status == 429 or status >= 500:
+        try:
+            delay = float(retry_after) if retry_after else None
+        except ValueError:
+            delay = None
+        raise UpstreamError(f"{endpoint} returned HTTP {status}", status, delay)
+
+class Transport:
+    """
+    Base class for LinkedIn API transports.
+    """
+    # Whether get_job_details answers with the posting's real details
+    provides_job_details = True
+    
+    def call_api(self, endpoint: str, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Call an API endpoint.
+        
+        Args:
+            endpoint: API endpoint name, e.g. 'LinkedIn/search_people'
+            query: Query parameters
+        
+        Returns:
+            Decoded response dictionary
+        """
+        raise NotImplementedError
+    
+    def post_api(self, endpoint: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send data to an API endpoint, e.g. to submit an application.
+        
+        Args:
+            endpoint: API endpoint name, e.g. 'LinkedIn/apply_for_job'
+            body: Request data
+        
+        Returns:
+            Decoded response dictionary
+        """
+        raise NotImplementedError
+    
+    def close(self) -> None:
+        """
+        Release any pooled connections.
+        """
+        pass
+
+class _Pool:
+    """
+    Bounded, thread-safe pool of reusable connection objects.
+    
+    Connections are created lazily up to `size` and handed out most recently
+    used first, so a burst of calls keeps reusing the same warm connections.
+    """
+    def __init__(self, factory, size: int, timeout: float):
+        self.factory = factory
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        
+        if create:
+            try:
+                return self.factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TransportError(f"No connection available after {self.timeout} seconds")
+    
+    def discard(self) -> None:
+        """
+        Forget a connection that was closed because it failed.
+        """
+        with self._lock:
+            self._created -= 1
+    
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection for the duration of a `with` block.
+        
+        A connection is returned to the pool unless the block raises, in which
+        case it is dropped and a fresh one is created on demand.
+        """
+        conn = self._acquire()
+        try:
+            yield conn
+        except Exception:
+            self.discard()
+            close = getattr(conn, 'close', None)
+            if close:
+                try:
+                    close()
+                except Exception:
+                    pass
+            raise
+        else:
+            self._idle.put(conn)
+    
+    def close(self) -> None:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self.discard()
+            close = getattr(conn, 'close', None)
+            if close:
+                close()
+
+class DataApiTransport(Transport):
+    """
+    Transport backed by pooled sandbox `data_api.ApiClient` instances.
+    
+    The sandbox API has no job details or application endpoints, so those are
+    answered with placeholder responses here. Placeholder details are marked
+    as such and never stored.
+    """
+    provides_job_details = False
+    
+    def __init__(self, pool_size: int = 10, pool_timeout: float = 30):
+        sys.path.append('/opt/.manus/.sandbox-runtime')
+        from data_api import ApiClient
+        
+        self.pool = _Pool(ApiClient, pool_size, pool_timeout)
+    
+    def call_api(self, endpoint: str, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if endpoint == 'LinkedIn/get_job_details':
+            return self._job_details((query or {}).get('job_id'))
+        
+        with self.pool.connection() as client:
+            return client.call_api(endpoint, query=query or {})
+    
+    def post_api(self, endpoint: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        if endpoint == 'LinkedIn/apply_for_job':
+            return self._apply_for_job(body['job_id'], body.get('user_profile', {}))
+        raise TransportError(f"Unsupported endpoint: {endpoint}")
+    
+    def _job_details(self, job_id: str) -> Dict[str, Any]:
+        # This is a placeholder for the actual job details API
+        # In a real implementation, we would fetch the actual job details
+        return {
+            'success': True,
+            'message': 'Job details retrieved',
+            'placeholder': True,
+            'data': {
+                'job_id': job_id,
+                'title': 'Software Engineer',
+                'company': 'Tech Company',
+                'location': 'Remote',
+                'description': 'We are looking for a software engineer with experience in Python and Django...',
+                'requirements': [
+                    'Python experience',
+                    'Django framework knowledge',
+                    'Database skills',
+                    'API development'
+                ],
+                'responsibilities': [
+                    'Develop web applications',
+                    'Maintain existing codebase',
+                    'Collaborate with team members',
+                    'Write clean, maintainable code'
+                ],
+                'posted_date': '2025-03-30',
+                'application_url': 'https://linkedin.com/jobs/view/123456',
+                'salary_range': '$100,000 - $130,000',
+                'job_type': 'Full-time'
+            }
+        }
+    
+    def _apply_for_job(self, job_id: str, user_profile: Dict[str, Any]) -> Dict[str, Any]:
+        # This is a placeholder for the actual job application API
+        # In a real implementation, we would submit the application through LinkedIn
+        return {
+            'success': True,
+            'message': 'Application submitted successfully',
+            'data': {
+                'application_id': f"app_{job_id}_{user_profile.get('id', 'unknown')}",
+                'status': 'submitted',
+                'submission_date': '2025-04-03',
+                'job_id': job_id
+            }
+        }
+    
+    def close(self) -> None:
+        self.pool.close()
+
+class HttpTransport(Transport):
+    """
+    Transport speaking JSON over HTTP(S) with keep-alive connection pooling.
+    
+    `GET {base_url}/{endpoint}?{query}` and `POST {base_url}/{endpoint}` with
+    a JSON body are expected to return the same response dictionary as
+    `data_api.ApiClient.call_api`.
+    """
+    def __init__(self, base_url: str, pool_size: int = 10, pool_timeout: float = 30,
+                 connect_timeout: float = 5, read_timeout: float = 30):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"Invalid LinkedIn API base URL: {base_url!r}")
+        
+        self.base_url = base_url
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path.rstrip('/')
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool = _Pool(self._connect, pool_size, pool_timeout)
+    
+    def _connect(self) -> http.client.HTTPConnection:
+        conn = self.connection_class(self.host, self.port, timeout=self.connect_timeout)
+        conn.connect()
+        # Switch to the read timeout once the connection is established
+        conn.sock.settimeout(self.read_timeout)
+        conn.timeout = self.read_timeout
+        return conn
+    
+    def request(self, method: str, endpoint: str, query: Optional[Dict[str, Any]] = None,
+                body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Send a request and decode the JSON response.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint name
+            query: Query parameters
+            body: JSON request body
+        
+        Returns:
+            Decoded response dictionary
+        """
+        url = f"{self.path}/{endpoint.lstrip('/')}"
+        if query:
+            url = f"{url}?{urlencode(query)}"
+        headers = {'Accept': 'application/json', 'Connection': 'keep-alive'}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        
+        # Resending is only safe if the server may already have acted on the first attempt
+        # without harm: reads, and writes it deduplicates by idempotency key
+        replayable = method in ('GET', 'HEAD') or bool(body and body.get('idempotency_key'))
+        
+        for attempt in range(2 if replayable else 1):
+            try:
+                with self.pool.connection() as conn:
+                    conn.request(method, url, body=payload, headers=headers)
+                    response = conn.getresponse()
+                    data = response.read()
+                    if response.will_close:
+                        # The server will not keep the connection alive; reconnect on next use
+                        conn.close()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # A pooled keep-alive connection went stale; try once more on a fresh one
+                if attempt or not replayable:
+                    raise
+        
+        raise_for_upstream_status(endpoint, response.status, response.getheader('Retry-After'))
+        try:
+            result = json.loads(data) if data else {}
+        except ValueError:
+            raise TransportError(f"Invalid JSON from {endpoint} (HTTP {response.status})")
+        
+        if response.status >= 400 and 'success' not in result:
+            result = {'success': False, 'message': result.get('message', f"HTTP {response.status}")}
+        return result
+    
+    def call_api(self, endpoint: str, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self.request('GET', endpoint, query=query)
+    
+    def post_api(self, endpoint: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        return self.request('POST', endpoint, body=body)
+    
+    def close(self) -> None:
+        self.pool.close()
+
+_transport = None
+_transport_lock = threading.Lock()
+
+def get_api_settings() -> Dict[str, Any]:
+    """
+    Get the LinkedIn API settings merged over their defaults.
+    """
+    return {**DEFAULT_LINKEDIN_API, **getattr(settings, 'LINKEDIN_API', {})}
+
+def build_transport(config: Optional[Dict[str, Any]] = None) -> Transport:
+    """
+    Build a transport from LinkedIn API settings.
+    
+    Args:
+        config: Settings to use instead of settings.LINKEDIN_API
+    
+    Returns:
+        New transport instance
+    """
+    config = {**DEFAULT_LINKEDIN_API, **config} if config is not None else get_api_settings()
+    name = config['TRANSPORT']
+    
+    if name == 'data_api':
+        return DataApiTransport(pool_size=config['POOL_SIZE'], pool_timeout=config['POOL_TIMEOUT'])
+    if name == 'http':
+        return HttpTransport(config['BASE_URL'], pool_size=config['POOL_SIZE'],
+                             pool_timeout=config['POOL_TIMEOUT'],
+                             connect_timeout=config['CONNECT_TIMEOUT'],
+                             read_timeout=config['READ_TIMEOUT'])
+    if name == 'record':
+        from .cassette import RecordingTransport
+        return RecordingTransport(build_transport({**config, 'TRANSPORT': config['RECORD_TRANSPORT']}),
+                                  config['CASSETTE'])
+    if name == 'replay':
+        from .cassette import ReplayTransport
+        return ReplayTransport(config['CASSETTE'], latency=config['REPLAY_LATENCY'])
+    raise ValueError(f"Unknown LinkedIn API transport: {name!r}")
+
+def get_transport() -> Transport:
+    """
+    Get the process-wide transport, building it on first use.
+    """
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = build_transport()
+    return _transport
+
+def set_transport(transport: Optional[Transport]) -> Optional[Transport]:
+    """
+    Replace the process-wide transport, e.g. for benchmarks.
+    
+    Args:
+        transport: New transport, or None to rebuild from settings on next use
+    
+    Returns:
+        The previous transport
+    """
+    global _transport
+    with _transport_lock:
+        previous, _transport = _transport, transport
+    return previous
@@ -0,0 +1,171 @@
+"""
+Job detail hydration for LinkedIn job postings.
+
+Search results only carry a summary of each posting. Hydration fetches the
+full details of jobs that have none yet, or whose details are older than the
+freshness window, in concurrent batches and stores them on LinkedInJob.
+
+Each posting's details are hashed. When a refresh returns the same content,
+only the fetch time is updated. Extracted job keywords are kept, so unchanged
+postings are not analyzed again.
+"""
+import json
+import hashlib
+import logging
+from datetime import timedelta
+from typing import Dict, Any, Iterable, List, Optional
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .api.client import get_linkedin_client
+from .models import LinkedInJob
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_DETAILS = {
+    'MAX_AGE': 24 * 60 * 60,  # Seconds before fetched details are refreshed
+    'BATCH_SIZE': 50,  # Jobs fetched concurrently per batch
+}
+
+# Detail fields stored on LinkedInJob; their content decides whether a posting changed
+_DETAIL_FIELDS = ('location', 'description', 'requirements', 'responsibilities', 'salary_range', 'job_type')
+
+def get_job_details_settings() -> Dict[str, Any]:
+    """
+    Get the LinkedIn job details settings merged over their defaults.
+    """
+    return {**DEFAULT_JOB_DETAILS, **getattr(settings, 'LINKEDIN_JOB_DETAILS', {})}
+
+def _as_text(value: Any) -> Optional[str]:
+    if isinstance(value, (list, tuple)):
+        return '\n'.join(str(item) for item in value)
+    return value
+
+def detail_fields(details: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a job details API response to LinkedInJob field values.
+    
+    Args:
+        details: The 'data' of a get_job_details response
+    
+    Returns:
+        Dictionary of LinkedInJob field values present in the details; empty
+        ones are kept, so fields cleared upstream are cleared here too
+    """
+    fields = {}
+    for name in _DETAIL_FIELDS:
+        if name not in details:
+            continue
+        value = _as_text(details[name])
+        if value is None and not LinkedInJob._meta.get_field(name).null:
+            value = ''
+        fields[name] = value
+    return fields
+
+def details_hash(fields: Dict[str, Any]) -> str:
+    """
+    Hash job detail field values.
+    
+    Empty values are left out, so hashes stored before they were kept still match.
+    """
+    content = json.dumps({name: value for name, value in fields.items() if value}, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def needs_details(max_age: Optional[int] = None) -> Q:
+    """
+    Filter for jobs without details or with details older than `max_age` seconds.
+    """
+    if max_age is None:
+        max_age = get_job_details_settings()['MAX_AGE']
+    cutoff = timezone.now() - timedelta(seconds=max_age)
+    return Q(details_fetched_at__isnull=True) | Q(details_fetched_at__lt=cutoff)
+
+def hydrate_job_details(jobs: Optional[Iterable[LinkedInJob]] = None, max_age: Optional[int] = None,
+                        force: bool = False, save: bool = True) -> Dict[str, int]:
+    """
+    Fetch and store details of jobs that have none or have stale ones.
+    
+    Args:
+        jobs: Jobs to hydrate; defaults to every job needing details
+        max_age: Freshness window in seconds; defaults to LINKEDIN_JOB_DETAILS['MAX_AGE']
+        force: Refresh details even if they are still fresh
+        save: Whether to store the details; if not, only the given job objects are updated
+    
+    Returns:
+        Counts of 'changed', 'unchanged', 'failed' and 'skipped' jobs; jobs are
+        skipped when the transport only has placeholder details
+    """
+    from ..resume_analysis.models import JobKeywords
+    
+    config = get_job_details_settings()
+    if max_age is None:
+        max_age = config['MAX_AGE']
+    
+    if jobs is None:
+        pending = list(LinkedInJob.objects.all() if force else LinkedInJob.objects.filter(needs_details(max_age)))
+    else:
+        cutoff = timezone.now() - timedelta(seconds=max_age)
+        pending = [
+            job for job in jobs
+            if force or job.details_fetched_at is None or job.details_fetched_at < cutoff
+        ]
+    
+    counts = {'changed': 0, 'unchanged': 0, 'failed': 0, 'skipped': 0}
+    if not pending:
+        return counts
+    
+    client = get_linkedin_client()
+    if not client.client.provides_job_details:
+        # Placeholder details would replace every job's real summary with the same text
+        counts['skipped'] = len(pending)
+        return counts
+    
+    batch_size = max(1, config['BATCH_SIZE'])
+    for offset in range(0, len(pending), batch_size):
+        batch = pending[offset:offset + batch_size]
+        results = client.get_job_details_many([job.job_id for job in batch])
+        
+        now = timezone.now()
+        changed: List[LinkedInJob] = []
+        unchanged: List[LinkedInJob] = []
+        for job in batch:
+            result = results.get(job.job_id)
+            if not result or not result['success']:
+                counts['failed'] += 1
+                continue
+            if result.get('placeholder'):
+                counts['skipped'] += 1
+                continue
+            
+            fields = detail_fields(result.get('data', {}))
+            content_hash = details_hash(fields)
+            job.details_fetched_at = now
+            if content_hash == job.details_hash:
+                unchanged.append(job)
+                continue
+            
+            for name, value in fields.items():
+                setattr(job, name, value)
+            job.details_hash = content_hash
+            job.updated_at = now
+            changed.append(job)
+        
+        if unchanged and save:
+            LinkedInJob.objects.bulk_update(unchanged, ['details_fetched_at'])
+        if changed and save:
+            LinkedInJob.objects.bulk_update(
+                changed, list(_DETAIL_FIELDS) + ['details_fetched_at', 'details_hash', 'updated_at']
+            )
+            # Keywords extracted from the old details are out of date
+            JobKeywords.objects.filter(job__in=changed).delete()
+        
+        counts['changed'] += len(changed)
+        counts['unchanged'] += len(unchanged)
+    
+    logger.info(
+        f"Hydrated LinkedIn job details: {counts['changed']} changed, "
+        f"{counts['unchanged']} unchanged, {counts['failed']} failed, {counts['skipped']} skipped"
+    )
+    return counts
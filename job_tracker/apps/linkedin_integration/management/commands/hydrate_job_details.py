@@ -0,0 +1,24 @@
+"""
+Management command to fetch full details of LinkedIn jobs.
+"""
+import logging
+from django.core.management.base import BaseCommand
+
+from job_tracker.apps.linkedin_integration.hydration import hydrate_job_details
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Fetch details of LinkedIn jobs that have none or whose details are stale'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--max-age', type=int, default=None,
+                            help='Seconds before fetched details are refreshed (defaults to LINKEDIN_JOB_DETAILS)')
+        parser.add_argument('--force', action='store_true', help='Refresh details of every job')
+    
+    def handle(self, *args, **options):
+        counts = hydrate_job_details(max_age=options['max_age'], force=options['force'])
+        self.stdout.write(self.style.SUCCESS(
+            f"{counts['changed']} jobs updated, {counts['unchanged']} unchanged, {counts['failed']} failed, "
+            f"{counts['skipped']} skipped"
+        ))
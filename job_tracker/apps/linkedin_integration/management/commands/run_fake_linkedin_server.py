@@ -0,0 +1,53 @@
+"""
+Management command to run a local stand-in for the LinkedIn API.
+"""
+import logging
+from django.core.management.base import BaseCommand
+
+from job_tracker.apps.linkedin_integration.api.fake_server import FakeLinkedInServer, LatencyModel
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Run a fake LinkedIn API server with configurable latency, errors and rate limits'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+        parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+        parser.add_argument('--latency-ms', type=float, default=100, help='Mean or median response latency')
+        parser.add_argument('--latency-jitter-ms', type=float, default=0, help='Spread of the response latency')
+        parser.add_argument('--latency-distribution', default='fixed', choices=LatencyModel.DISTRIBUTIONS,
+                            help='Distribution of the response latency')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 503')
+        parser.add_argument('--rate-limit', type=float, default=None,
+                            help='Requests per second allowed before answering HTTP 429')
+        parser.add_argument('--total-results', type=int, default=500, help='Number of results each search reports')
+        parser.add_argument('--seed', type=int, default=0, help='Seed for the generated jobs, latencies and errors')
+    
+    def handle(self, *args, **options):
+        latency = LatencyModel(
+            options['latency_distribution'],
+            mean_ms=options['latency_ms'],
+            jitter_ms=options['latency_jitter_ms'],
+            seed=options['seed']
+        )
+        server = FakeLinkedInServer(
+            host=options['host'],
+            port=options['port'],
+            latency=latency,
+            error_rate=options['error_rate'],
+            rate_limit=options['rate_limit'],
+            total_results=options['total_results'],
+            seed=options['seed']
+        )
+        
+        self.stdout.write(self.style.SUCCESS(f'Fake LinkedIn API listening on {server.base_url}'))
+        self.stdout.write(f'Point the app at it with LINKEDIN_API_TRANSPORT=http LINKEDIN_API_BASE_URL={server.base_url}')
+        
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
+            self.stdout.write(f'Served requests: {dict(server.stats)}')
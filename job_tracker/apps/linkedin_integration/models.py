@@ -22,6 +22,8 @@ class LinkedInJob(models.Model):
     salary_range = models.CharField(max_length=255, blank=True, null=True)
     job_type = models.CharField(max_length=100, blank=True, null=True)
     keywords = models.JSONField(default=list, blank=True, null=True)
+    details_fetched_at = models.DateTimeField(null=True, blank=True)
+    details_hash = models.CharField(max_length=64, blank=True, default='', help_text="Hash of the fetched job details")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -34,6 +36,7 @@ class LinkedInJob(models.Model):
             models.Index(fields=['job_id']),
             models.Index(fields=['title']),
             models.Index(fields=['company']),
+            models.Index(fields=['details_fetched_at']),
         ]
 
 class JobApplication(models.Model):
@@ -91,3 +94,17 @@ class JobSearchQuery(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+
+class RateLimitBucket(models.Model):
+    """
+    Model to share LinkedIn API rate limit state between worker processes.
+    
+    Used by the 'database' rate limiter backend. Each bucket stores the
+    theoretical arrival time of the next request as a Unix timestamp.
+    """
+    key = models.CharField(max_length=255, unique=True)
+    tat = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.key} ({self.tat})"
@@ -10,4 +10,5 @@ urlpatterns = [
     path('job/<int:job_id>/apply/', views.apply_for_job, name='apply_for_job'),
     path('applications/', views.application_status, name='application_status'),
     path('auto-apply/', views.auto_apply_jobs, name='auto_apply_jobs'),
+    path('api/metrics/', views.api_metrics, name='linkedin_api_metrics'),
 ]
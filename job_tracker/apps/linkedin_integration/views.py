@@ -3,12 +3,15 @@ Views for LinkedIn job search and application functionality.
 """
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.contrib.admin.views.decorators import staff_member_required
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 from django.contrib import messages
 from django.utils import timezone
 
-from .api.client import LinkedInClient
+from .api.client import get_linkedin_client
+from .api.metrics import metrics
+from .hydration import hydrate_job_details
 from .models import LinkedInJob, JobApplication, JobSearchQuery
 from ..resume_analysis.utils import calculate_job_fit_score
 from ..cover_letter.generator import generate_cover_letter
@@ -40,7 +43,7 @@ def job_search(request):
         )
         
         # Perform job search
-        client = LinkedInClient()
+        client = get_linkedin_client()
         results = client.search_jobs(
             keywords=keywords,
             location=location,
@@ -52,18 +55,26 @@ def job_search(request):
             # Store jobs in database
             jobs_data = []
             for job_data in results['data'].get('jobs', []):
-                job, created = LinkedInJob.objects.update_or_create(
+                # Keep fetched job details; the search summary only seeds new jobs
+                summary = {
+                    'title': job_data['title'],
+                    'company': job_data['company'],
+                    'url': job_data.get('url', '#'),
+                    'posted_date': job_data.get('posted_date'),
+                }
+                job, created = LinkedInJob.objects.get_or_create(
                     job_id=job_data['job_id'],
                     defaults={
-                        'title': job_data['title'],
-                        'company': job_data['company'],
+                        **summary,
                         'location': job_data.get('location'),
                         'description': job_data.get('description', ''),
-                        'url': job_data.get('url', '#'),
-                        'posted_date': job_data.get('posted_date'),
                         'job_type': job_data.get('job_type'),
                     }
                 )
+                if not created:
+                    for name, value in summary.items():
+                        setattr(job, name, value)
+                    job.save(update_fields=list(summary) + ['updated_at'])
                 
                 # Calculate job fit score if user has a resume
                 fit_score = 0
@@ -109,9 +120,8 @@ def job_detail(request, job_id):
     """
     job = get_object_or_404(LinkedInJob, id=job_id)
     
-    # Get detailed job information if needed
-    client = LinkedInClient()
-    job_details = client.get_job_details(job.job_id)
+    # Fetch detailed job information unless stored details are still fresh
+    hydrate_job_details([job])
     
     # Calculate job fit score
     fit_score = 0
@@ -137,7 +147,12 @@ def job_detail(request, job_id):
     
     return render(request, 'linkedin_integration/job_detail.html', {
         'job': job,
-        'job_details': job_details.get('data', {}),
+        'job_details': {
+            'requirements': job.requirements.splitlines() if job.requirements else [],
+            'responsibilities': job.responsibilities.splitlines() if job.responsibilities else [],
+            'salary_range': job.salary_range,
+            'job_type': job.job_type,
+        },
         'fit_score': fit_score,
         'application': application,
         'cover_letter': cover_letter
@@ -185,7 +200,7 @@ def apply_for_job(request, job_id):
     )
     
     # Submit application to LinkedIn
-    client = LinkedInClient()
+    client = get_linkedin_client()
     user_profile = {
         'id': request.user.id,
         'name': request.user.get_full_name(),
@@ -237,7 +252,7 @@ def auto_apply_jobs(request):
         return redirect('job_search')
     
     # Search for jobs
-    client = LinkedInClient()
+    client = get_linkedin_client()
     results = client.search_jobs(
         keywords=recent_search.keywords,
         location=recent_search.location,
@@ -323,3 +338,13 @@ def auto_apply_jobs(request):
         messages.info(request, "No matching jobs found for auto-apply. Try broadening your search criteria.")
     
     return redirect('application_status')
+
+@staff_member_required
+def api_metrics(request):
+    """
+    API endpoint exposing LinkedIn API layer metrics for this process.
+    """
+    return JsonResponse({
+        'success': True,
+        'metrics': metrics.snapshot()
+    })
@@ -0,0 +1,19 @@
+"""
+App configuration for resume analysis.
+"""
+from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import post_save
+
+class ResumeAnalysisConfig(AppConfig):
+    name = 'job_tracker.apps.resume_analysis'
+    label = 'resume_analysis'
+    verbose_name = 'Resume Analysis'
+    
+    def ready(self):
+        from .signals import queue_analysis_on_profile_save
+        
+        # Analyze resumes in the background as soon as they are uploaded
+        if settings.RESUME_PROFILE_MODEL:
+            post_save.connect(queue_analysis_on_profile_save, sender=settings.RESUME_PROFILE_MODEL,
+                              dispatch_uid='resume_analysis_profile_saved')
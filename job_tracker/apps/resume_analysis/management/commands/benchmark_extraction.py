@@ -0,0 +1,94 @@
+"""
+Management command to benchmark document tokenization and keyword extraction on long documents.
+"""
+import re
+import time
+import random
+import logging
+from django.core.management.base import BaseCommand
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from job_tracker.apps.resume_analysis.utils import COMMON_TECH_SKILLS, tokenize_text
+
+logger = logging.getLogger(__name__)
+
+# The separate per-category patterns that the shared tokenizer replaced,
+# kept here as the benchmark baseline
+LEGACY_RESUME_PATTERNS = [
+    r'\b(bachelor|master|phd|doctorate|bs|ba|ms|ma|mba)\b',
+    r'\b(degree|diploma|certificate)\b',
+    r'\buniversity\s+of\s+\w+\b',
+    r'\b\w+\s+university\b',
+    r'\b\w+\s+college\b',
+    r'\b(\d+)\s+(year|yr)s?\b',
+    r'\b(senior|junior|lead|principal|staff)\b',
+    r'\b(manager|director|vp|chief|head)\b',
+    r'\b(english|spanish|french|german|chinese|japanese|russian|arabic|portuguese|italian)\b',
+]
+
+LEGACY_JOB_PATTERNS = [
+    r'(\d+)[\+]?\s+(year|yr)s?(\s+of\s+experience)?',
+    r'experience\s+of\s+(\d+)[\+]?\s+(year|yr)s?',
+    r'(\d+)[\+]?\s+(year|yr)s?(\s+experience)?',
+    r'(bachelor|master|phd|doctorate|bs|ba|ms|ma|mba)(\s+degree)?',
+    r'degree\s+in\s+(\w+(\s+\w+)*)',
+    r'(computer science|engineering|information technology|data science)',
+]
+
+SAMPLE_SENTENCES = [
+    "Senior software engineer with 7 years of experience building Django and React applications.",
+    "Led a team of 5 engineers at Acme Corp, deploying services to AWS with Docker and k8s.",
+    "Master of Science in Computer Science, George Mason University, 2016.",
+    "Requirements: 5+ years of Python, experience of 3 years with PostgreSQL, bachelor degree in engineering.",
+    "Nice to have: golang, Terraform and a certificate in cloud architecture.",
+    "Fluent in English and Spanish; worked as engineering manager and staff engineer.",
+    "Responsible for data pipelines using pandas, numpy and Apache Spark on Hadoop clusters.",
+]
+
+class Command(BaseCommand):
+    help = 'Benchmark the shared tokenizer against the legacy per-pattern scans'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--words', type=int, default=50000, help='Approximate document length in words')
+        parser.add_argument('--repeat', type=int, default=20, help='Number of timed iterations')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for the synthetic document')
+    
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        sentences = []
+        word_count = 0
+        while word_count < options['words']:
+            sentence = rng.choice(SAMPLE_SENTENCES)
+            sentences.append(sentence)
+            word_count += len(sentence.split())
+        document = "\n".join(sentences)
+        repeat = options['repeat']
+        
+        self.stdout.write(f'Benchmarking on a {len(document)} character document ({repeat} iterations)')
+        
+        legacy_patterns = [
+            re.compile(r'\b' + re.escape(skill) + r'\b')
+            for skill_list in COMMON_TECH_SKILLS.values() for skill in skill_list
+        ] + [re.compile(pattern) for pattern in LEGACY_RESUME_PATTERNS + LEGACY_JOB_PATTERNS]
+        legacy_analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+        
+        legacy_time = self._time(repeat, lambda: self._legacy_scan(document, legacy_patterns, legacy_analyzer))
+        combined_time = self._time(repeat, lambda: tokenize_text(document))
+        
+        self.stdout.write(f'Legacy per-pattern scans: {legacy_time * 1000:.2f} ms/document')
+        self.stdout.write(f'Shared tokenizer:         {combined_time * 1000:.2f} ms/document')
+        self.stdout.write(self.style.SUCCESS(f'Speedup: {legacy_time / combined_time:.2f}x'))
+    
+    def _time(self, repeat, func):
+        func()  # Warm up
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - start) / repeat
+    
+    def _legacy_scan(self, document, patterns, analyzer):
+        text = document.lower()
+        for pattern in patterns:
+            pattern.findall(text)
+        analyzer(document)
@@ -0,0 +1,97 @@
+"""
+Request- and task-scoped memoization for resume analysis.
+
+Inside an analysis scope, memoized analysis functions return the stored
+result for arguments they have already seen instead of recomputing it. All
+results are discarded when the outermost scope exits.
+"""
+import copy
+import functools
+import logging
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_scope: ContextVar[Optional['AnalysisScope']] = ContextVar('analysis_scope', default=None)
+
+class AnalysisScope(ContextDecorator):
+    """
+    Scope holding memoized analysis results.
+    
+    Usable as a context manager in views, tasks and management commands, or as
+    a decorator. Nested scopes share the outermost scope's results.
+    """
+    def __init__(self, name: str = 'analysis'):
+        self.name = name
+        self.results: Dict[Any, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self._token = None
+    
+    def _recreate_cm(self):
+        # Each call of a decorated function gets its own scope
+        return AnalysisScope(self.name)
+    
+    def __enter__(self) -> 'AnalysisScope':
+        if _current_scope.get() is None:
+            self._token = _current_scope.set(self)
+            return self
+        return _current_scope.get()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._token is not None:
+            _current_scope.reset(self._token)
+            self._token = None
+            logger.debug(f"Analysis scope '{self.name}' avoided {self.hits} recomputations "
+                         f"({self.misses} results computed)")
+            self.results.clear()
+        return False
+
+def analysis_scope(name: str = 'analysis') -> AnalysisScope:
+    """
+    Open a memoization scope for resume analysis.
+    
+    Args:
+        name: Name used in the debug log line when the scope closes
+    
+    Returns:
+        Scope usable with a `with` statement or as a decorator
+    """
+    return AnalysisScope(name)
+
+def get_current_scope() -> Optional[AnalysisScope]:
+    """
+    Get the active analysis scope, if any.
+    """
+    return _current_scope.get()
+
+def memoize_in_scope(func: Callable) -> Callable:
+    """
+    Memoize a function for the duration of the active analysis scope.
+    
+    Outside a scope, or for unhashable arguments, the function is called
+    directly. Each caller gets its own copy of the result, so changing it
+    does not change what later callers get.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        scope = _current_scope.get()
+        if scope is None:
+            return func(*args, **kwargs)
+        
+        key = (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+        try:
+            if key in scope.results:
+                scope.hits += 1
+                return copy.deepcopy(scope.results[key])
+        except TypeError:
+            return func(*args, **kwargs)
+        
+        result = func(*args, **kwargs)
+        scope.results[key] = result
+        scope.misses += 1
+        return copy.deepcopy(result)
+    
+    return wrapper
@@ -0,0 +1,16 @@
+"""
+Middleware for resume analysis.
+"""
+from .memo import analysis_scope
+
+class AnalysisScopeMiddleware:
+    """
+    Run each request inside an analysis scope so repeated resume and job
+    analysis within one request is computed only once.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        with analysis_scope(f"request {request.path}"):
+            return self.get_response(request)
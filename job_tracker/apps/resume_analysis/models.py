@@ -16,6 +16,10 @@ class ResumeKeywords(models.Model):
     education = models.JSONField(default=list)
     certifications = models.JSONField(default=list)
     languages = models.JSONField(default=list)
+    experience_years = models.IntegerField(default=0)
+    skill_mask = models.BigIntegerField(default=0, help_text="Bitmask of canonical skill ids found in the resume")
+    source_hash = models.CharField(max_length=64, blank=True, default='',
+                                   help_text="SHA-256 of the resume file the keywords were extracted from")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -42,3 +46,41 @@ class JobKeywords(models.Model):
     
     class Meta:
         verbose_name_plural = "Job Keywords"
+
+class ResumeAnalysisStatus(models.Model):
+    """
+    Model to track background analysis of a user's uploaded resume.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    
+    STAGE_CHOICES = [
+        ('queued', 'Queued'),
+        ('text', 'Extracting text'),
+        ('keywords', 'Extracting keywords'),
+        ('vectors', 'Building skill vectors'),
+        ('rescoring', 'Rescoring job matches'),
+        ('done', 'Done'),
+    ]
+    
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='resume_analysis_status')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    stage = models.CharField(max_length=20, choices=STAGE_CHOICES, default='queued')
+    progress = models.IntegerField(default=0, help_text="Progress percentage (0-100)")
+    resume_name = models.CharField(max_length=255, blank=True, default='')
+    matches_rescored = models.IntegerField(default=0)
+    error_message = models.TextField(blank=True, null=True)
+    queued_at = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"Resume analysis for {self.user.username} ({self.status})"
+    
+    class Meta:
+        verbose_name_plural = "Resume Analysis Statuses"
@@ -0,0 +1,192 @@
+"""
+Background pipeline that analyzes a resume as soon as it is uploaded.
+
+The pipeline extracts and tokenizes the resume text (warming the document
+cache), extracts keywords, builds the skill bitmask, updates ResumeKeywords
+and rescores the user's open job matches. Progress is recorded on
+ResumeAnalysisStatus so the UI can poll it.
+"""
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .memo import analysis_scope
+from .models import ResumeKeywords, ResumeAnalysisStatus
+from .utils import get_resume_document, extract_keywords_from_text, skill_ids, skill_mask
+
+try:
+    from celery import shared_task
+except ImportError:  # Celery is an optional dependency
+    shared_task = None
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def _file_hash(path: str) -> str:
+    """
+    Compute the SHA-256 of a file without loading it into memory at once.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _update_status(record: ResumeAnalysisStatus, **fields) -> None:
+    """
+    Update and save only the given fields of an analysis status record.
+    """
+    for field, value in fields.items():
+        setattr(record, field, value)
+    record.save(update_fields=list(fields) + ['updated_at'])
+
+def run_resume_analysis_pipeline(user_id: int) -> Dict[str, Any]:
+    """
+    Analyze a user's resume and refresh everything derived from it.
+    
+    Args:
+        user_id: ID of the user whose resume should be analyzed
+    
+    Returns:
+        Dictionary with the result of the pipeline
+    """
+    from ..job_matching.algorithm import rescore_job_matches
+    
+    try:
+        user = User.objects.get(id=user_id)
+    except User.DoesNotExist:
+        return {'success': False, 'message': f"User with ID {user_id} does not exist"}
+    
+    status, created = ResumeAnalysisStatus.objects.get_or_create(user=user)
+    
+    if not hasattr(user, 'profile') or not user.profile.resume:
+        _update_status(status, status='failed', error_message="No resume uploaded", completed_at=timezone.now())
+        return {'success': False, 'message': f"User {user.username} does not have a resume"}
+    
+    resume_path = user.profile.resume.path
+    _update_status(status, status='running', stage='text', progress=10, error_message=None,
+                   resume_name=user.profile.resume.name, started_at=timezone.now(), completed_at=None)
+    
+    try:
+        with analysis_scope('resume analysis pipeline'):
+            # Extract and tokenize text; this also warms the document cache
+            source_hash = _file_hash(resume_path)
+            document = get_resume_document(resume_path)
+            if document is None:
+                raise ValueError("Could not extract text from resume")
+            
+            # Nothing downstream changes if the same file was uploaded again
+            resume_keywords = ResumeKeywords.objects.filter(user=user).first()
+            if resume_keywords and resume_keywords.source_hash == source_hash:
+                _update_status(status, status='completed', stage='done', progress=100,
+                               matches_rescored=0, completed_at=timezone.now())
+                return {'success': True, 'message': "Resume unchanged", 'matches_rescored': 0}
+            
+            _update_status(status, stage='keywords', progress=35)
+            keywords = extract_keywords_from_text(document)
+            
+            _update_status(status, stage='vectors', progress=55)
+            ResumeKeywords.objects.update_or_create(
+                user=user,
+                defaults={
+                    'skills': keywords['skills'],
+                    'experience': keywords['experience'],
+                    'education': keywords['education'],
+                    'languages': keywords['languages'],
+                    'experience_years': keywords['experience_years'],
+                    'skill_mask': skill_mask(skill_ids(keywords['skills'])),
+                    'source_hash': source_hash,
+                }
+            )
+            
+            _update_status(status, stage='rescoring', progress=70)
+            matches_rescored = rescore_job_matches(user)
+        
+        _update_status(status, status='completed', stage='done', progress=100,
+                       matches_rescored=matches_rescored, completed_at=timezone.now())
+        return {'success': True, 'message': "Resume analysis completed", 'matches_rescored': matches_rescored}
+    
+    except Exception as e:
+        logger.exception(f"Error in resume analysis pipeline for user {user_id}: {str(e)}")
+        _update_status(status, status='failed', error_message=str(e), completed_at=timezone.now())
+        return {'success': False, 'message': f"Error analyzing resume: {str(e)}"}
+
+if shared_task is not None:
+    analyze_resume_task = shared_task(name='resume_analysis.analyze_resume')(run_resume_analysis_pipeline)
+else:
+    analyze_resume_task = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide executor used when Celery is not configured.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.RESUME_ANALYSIS_WORKERS,
+                                           thread_name_prefix='resume-analysis')
+        return _executor
+
+def _run_in_thread(user_id: int) -> None:
+    """
+    Run the pipeline in a worker thread, closing its database connection afterwards.
+    """
+    try:
+        run_resume_analysis_pipeline(user_id)
+    finally:
+        connection.close()
+
+def _dispatch(user_id: int) -> None:
+    """
+    Hand the pipeline to Celery if configured, otherwise to the local executor.
+    """
+    if settings.RESUME_ANALYSIS_BACKEND == 'celery' and analyze_resume_task is not None:
+        analyze_resume_task.delay(user_id)
+    else:
+        _get_executor().submit(_run_in_thread, user_id)
+
+def queue_resume_analysis(user, resume_name: Optional[str] = None) -> ResumeAnalysisStatus:
+    """
+    Queue background analysis of a user's resume.
+    
+    The pipeline is dispatched once the current transaction commits, so it
+    always sees the newly uploaded file.
+    
+    Args:
+        user: User object
+        resume_name: Name of the uploaded resume file, if known
+    
+    Returns:
+        The user's analysis status record
+    """
+    if resume_name is None and hasattr(user, 'profile') and user.profile.resume:
+        resume_name = user.profile.resume.name
+    
+    status, created = ResumeAnalysisStatus.objects.update_or_create(
+        user=user,
+        defaults={
+            'status': 'pending',
+            'stage': 'queued',
+            'progress': 0,
+            'resume_name': resume_name or '',
+            'matches_rescored': 0,
+            'error_message': None,
+            'queued_at': timezone.now(),
+            'started_at': None,
+            'completed_at': None,
+        }
+    )
+    
+    transaction.on_commit(lambda: _dispatch(user.id))
+    return status
@@ -0,0 +1,33 @@
+"""
+Signals that trigger background resume analysis when a resume is uploaded.
+"""
+from django.dispatch import Signal, receiver
+
+from .models import ResumeAnalysisStatus
+from .pipeline import queue_resume_analysis
+
+# Sent with a `user` argument, and optionally `resume_name`, by any code that stores
+# a new resume for a user; profile saves with a new resume file send it too
+resume_uploaded = Signal()
+
+@receiver(resume_uploaded)
+def queue_analysis_on_upload(sender, user, resume_name=None, **kwargs):
+    """
+    Queue background analysis whenever a resume upload is announced.
+    """
+    queue_resume_analysis(user, resume_name=resume_name)
+
+def queue_analysis_on_profile_save(sender, instance, created, **kwargs):
+    """
+    Announce a resume upload when a profile is saved with a new resume file.
+    
+    Connected to the model named by settings.RESUME_PROFILE_MODEL.
+    """
+    resume = getattr(instance, 'resume', None)
+    user = getattr(instance, 'user', None)
+    if not resume or user is None:
+        return
+    
+    last_resume_name = ResumeAnalysisStatus.objects.filter(user=user).values_list('resume_name', flat=True).first()
+    if created or last_resume_name != resume.name:
+        resume_uploaded.send(sender=sender, user=user, resume_name=resume.name)
@@ -9,4 +9,6 @@ urlpatterns = [
     path('job-match/<int:job_id>/', views.job_match_analysis, name='job_match_analysis'),
     path('batch-analyze/', views.batch_analyze_jobs, name='batch_analyze_jobs'),
     path('api/calculate-fit-score/', views.api_calculate_fit_score, name='api_calculate_fit_score'),
+    path('api/analysis-status/', views.api_analysis_status, name='api_analysis_status'),
+    path('api/queue-analysis/', views.api_queue_analysis, name='api_queue_analysis'),
 ]
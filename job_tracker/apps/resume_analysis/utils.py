@@ -3,16 +3,22 @@ Utility functions for resume analysis and keyword matching.
 """
 import os
 import re
+import hashlib
 import logging
 import PyPDF2
 import docx
 from collections import Counter
-from typing import Dict, List, Tuple, Set, Optional, Any
+from typing import Dict, Iterable, List, Tuple, Set, Optional, Any, Union
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, ENGLISH_STOP_WORDS
 from sklearn.metrics.pairwise import cosine_similarity
 
+from django.conf import settings
+from django.core.cache import cache
+
+from .memo import memoize_in_scope
+
 logger = logging.getLogger(__name__)
 
 # Common skills and keywords for different job categories
@@ -24,6 +30,240 @@ COMMON_TECH_SKILLS = {
     'data': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'hadoop', 'spark', 'tableau', 'power bi']
 }
 
+# Alternative spellings and abbreviations mapped to the canonical skill name
+SKILL_ALIASES = {
+    'golang': 'go',
+    'js': 'javascript',
+    'ecmascript': 'javascript',
+    'ts': 'typescript',
+    'cpp': 'c++',
+    'c sharp': 'c#',
+    'csharp': 'c#',
+    'html5': 'html',
+    'css3': 'css',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'angularjs': 'angular',
+    'angular.js': 'angular',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'node': 'node.js',
+    'nodejs': 'node.js',
+    'express.js': 'express',
+    'expressjs': 'express',
+    'spring boot': 'spring',
+    'postgres': 'postgresql',
+    'psql': 'postgresql',
+    'mongo': 'mongodb',
+    'elastic search': 'elasticsearch',
+    'amazon web services': 'aws',
+    'microsoft azure': 'azure',
+    'google cloud': 'gcp',
+    'google cloud platform': 'gcp',
+    'k8s': 'kubernetes',
+    'aws lambda': 'lambda',
+    'amazon ec2': 'ec2',
+    'amazon s3': 's3',
+    'sklearn': 'scikit-learn',
+    'scikit learn': 'scikit-learn',
+    'apache spark': 'spark',
+    'pyspark': 'spark',
+    'apache hadoop': 'hadoop',
+    'powerbi': 'power bi',
+}
+
+# Canonical skills in a stable order; a skill's position is its integer id
+CANONICAL_SKILLS = tuple(skill for skill_list in COMMON_TECH_SKILLS.values() for skill in skill_list)
+SKILL_IDS = {skill: skill_id for skill_id, skill in enumerate(CANONICAL_SKILLS)}
+
+# Skill bitmasks are stored in a signed 64-bit column
+assert len(CANONICAL_SKILLS) <= 63, "Too many canonical skills for a signed 64-bit skill mask"
+
+# Every surface form (canonical names and aliases) resolved to its skill id
+_SKILL_INDEX = dict(SKILL_IDS)
+_SKILL_INDEX.update({alias: SKILL_IDS[skill] for alias, skill in SKILL_ALIASES.items()})
+
+_SKILL_FORMS = '|'.join(
+    re.escape(form).replace(r'\ ', r'\s+')
+    for form in sorted(_SKILL_INDEX, key=len, reverse=True)
+)
+
+_DEGREES = r'bachelor|master|phd|doctorate|bs|ba|ms|ma|mba'
+
+# A word of a degree's field; the field ends before a preposition or an institution
+_FIELD_WORD = r'(?!(?:at|from|with|for|by|university|college)\b)(?!\w+\s+(?:university|college)\b)\w+'
+
+# Section headings that introduce required and preferred skills
+REQUIRED_SECTIONS = ['required skills', 'requirements', 'qualifications', 'what you need', 'must have', 'essential']
+PREFERRED_SECTIONS = ['preferred skills', 'nice to have', 'desirable', 'bonus points', 'plus']
+
+def _phrases(phrases: List[str]) -> str:
+    """
+    Build a regex alternation of phrases that tolerates any whitespace between words.
+    """
+    return '|'.join(re.escape(phrase).replace(r'\ ', r'\s+') for phrase in phrases)
+
+# Single tokenizer for resumes and job descriptions. Alternatives are tried in
+# order at each position: skills (longest surface form first, so "node.js"
+# wins over "node"), then multi-word keywords, then single keywords, and
+# finally any other word. Skills such as "c++" and "c#" end in non-word
+# characters, so they use explicit look-arounds instead of \b.
+_TOKEN_PATTERN = re.compile(r"""
+    (?<!\w)(?P<skill>""" + _SKILL_FORMS + r""")(?![\w+\#])
+  | \b(?:
+        (?:experience\s+of\s+)?(?P<years>\d+)\+?\s+(?:year|yr)s?
+      | degree\s+in\s+(?P<field>""" + _FIELD_WORD + r"""(?:[ \t]+""" + _FIELD_WORD + r"""){0,3})
+      | (?P<subject>computer\s+science|engineering|information\s+technology|data\s+science)
+      | (?P<institution>university\s+of\s+\w+|\w+\s+university(?!\s+of\b)|\w+\s+college)
+      | (?P<required>""" + _phrases(REQUIRED_SECTIONS) + r""")
+      | (?P<preferred>""" + _phrases(PREFERRED_SECTIONS) + r""")
+      | (?P<degree>""" + _DEGREES + r""")
+      | (?P<credential>degree|diploma|certificate)
+      | (?P<seniority>senior|junior|lead|principal|staff)
+      | (?P<role>manager|director|vp|chief|head)
+      | (?P<language>english|spanish|french|german|chinese|japanese|russian|arabic|portuguese|italian)
+      | (?P<word>\w+)
+    )\b
+""", re.VERBOSE)
+
+# Terms fed to TF-IDF follow scikit-learn's default token pattern
+_TERM_PATTERN = re.compile(r'\w\w+')
+
+class TokenizedText:
+    """
+    A document split into typed tokens by a single scan of its lowercased text.
+    
+    Each token is a (kind, value, start, end) tuple where kind is the name of
+    the matching group in _TOKEN_PATTERN, value is the skill id for skills,
+    the number of years for experience, and the normalized matched text
+    otherwise. Terms are the stop-word filtered words used for TF-IDF, with
+    skills contributing their canonical name. Documents are immutable, so
+    memoized ones are shared rather than copied.
+    """
+    __slots__ = ('tokens', 'terms')
+    
+    def __init__(self, tokens: Iterable[Tuple[str, Any, int, int]], terms: Iterable[str]):
+        self.tokens = tuple(tokens)
+        self.terms = tuple(terms)
+    
+    def __copy__(self) -> 'TokenizedText':
+        return self
+    
+    def __deepcopy__(self, memo) -> 'TokenizedText':
+        return self
+    
+    def __len__(self):
+        return len(self.tokens)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize to a JSON-compatible dictionary for caching.
+        """
+        return {'tokens': [list(token) for token in self.tokens], 'terms': list(self.terms)}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TokenizedText':
+        """
+        Rebuild a tokenized document from the output of to_dict().
+        """
+        return cls([tuple(token) for token in data['tokens']], data['terms'])
+
+@memoize_in_scope
+def tokenize_text(text: str) -> TokenizedText:
+    """
+    Tokenize text once for keyword extraction and TF-IDF scoring.
+    
+    Args:
+        text: Text content to tokenize
+        
+    Returns:
+        Tokenized document
+    """
+    tokens = []
+    terms = []
+    for match in _TOKEN_PATTERN.finditer(text.lower()):
+        kind = match.lastgroup
+        raw = match.group(kind)
+        if kind == 'word':
+            tokens.append((kind, raw, match.start(), match.end()))
+            if len(raw) > 1 and raw not in ENGLISH_STOP_WORDS:
+                terms.append(raw)
+            continue
+        
+        if kind == 'skill':
+            value = _SKILL_INDEX[' '.join(raw.split())]
+            terms.append(CANONICAL_SKILLS[value])
+        else:
+            value = int(raw) if kind == 'years' else ' '.join(raw.split())
+            terms.extend(term for term in _TERM_PATTERN.findall(match.group()) if term not in ENGLISH_STOP_WORDS)
+        tokens.append((kind, value, match.start(), match.end()))
+    
+    return TokenizedText(tokens, terms)
+
+def _as_document(text: Optional[Union[str, TokenizedText]]) -> TokenizedText:
+    """
+    Accept raw text, an already tokenized document, or None for a resume
+    without text (see get_resume_document()).
+    """
+    return text if isinstance(text, TokenizedText) else tokenize_text(text or '')
+
+def resolve_skill(name: str) -> Optional[str]:
+    """
+    Resolve a skill name or alias to its canonical skill name.
+    
+    Args:
+        name: Skill name as written (e.g. "k8s", "JS")
+    
+    Returns:
+        Canonical skill name, or None if the skill is unknown
+    """
+    skill_id = _SKILL_INDEX.get(' '.join(name.lower().split()))
+    return CANONICAL_SKILLS[skill_id] if skill_id is not None else None
+
+def skill_ids(skills: List[str]) -> Set[int]:
+    """
+    Convert skill names (canonical or alias) to a set of integer skill ids.
+    
+    Args:
+        skills: List of skill names
+    
+    Returns:
+        Set of skill ids; unknown names are ignored
+    """
+    ids = set()
+    for skill in skills:
+        skill_id = _SKILL_INDEX.get(' '.join(skill.lower().split()))
+        if skill_id is not None:
+            ids.add(skill_id)
+    return ids
+
+def skill_mask(ids: Set[int]) -> int:
+    """
+    Pack skill ids into an integer bitmask (bit n set for skill id n).
+    
+    Args:
+        ids: Set of skill ids
+        
+    Returns:
+        Bitmask of the skills
+    """
+    mask = 0
+    for skill_id in ids:
+        mask |= 1 << skill_id
+    return mask
+
+def skill_names(ids: Set[int]) -> List[str]:
+    """
+    Convert skill ids back to canonical skill names.
+    
+    Args:
+        ids: Set of skill ids
+        
+    Returns:
+        List of canonical skill names in canonical order
+    """
+    return [CANONICAL_SKILLS[skill_id] for skill_id in sorted(ids)]
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
     Extract text content from a PDF file.
@@ -64,6 +304,7 @@ def extract_text_from_docx(docx_path: str) -> str:
         logger.exception(f"Error extracting text from DOCX: {str(e)}")
         return ""
 
+@memoize_in_scope
 def extract_text_from_resume(resume_path: str) -> str:
     """
     Extract text content from a resume file (PDF or DOCX).
@@ -84,205 +325,162 @@ def extract_text_from_resume(resume_path: str) -> str:
         logger.error(f"Unsupported file format: {file_ext}")
         return ""
 
-def extract_keywords_from_text(text: str) -> Dict[str, List[str]]:
+@memoize_in_scope
+def get_resume_document(resume_path: str) -> Optional[TokenizedText]:
+    """
+    Get the tokenized document for a resume file, using the cache when possible.
+    
+    The cache key includes the file's modification time and size, so a
+    re-uploaded resume is tokenized again.
+    
+    Args:
+        resume_path: Path to the resume file
+        
+    Returns:
+        Tokenized resume, or None if no text could be extracted
+    """
+    try:
+        stat = os.stat(resume_path)
+    except OSError:
+        logger.error(f"Resume file not found: {resume_path}")
+        return None
+    
+    path_hash = hashlib.md5(resume_path.encode('utf-8')).hexdigest()
+    cache_key = f"resume_document:{path_hash}:{stat.st_mtime_ns}:{stat.st_size}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return TokenizedText.from_dict(cached)
+    
+    resume_text = extract_text_from_resume(resume_path)
+    if not resume_text:
+        return None
+    
+    document = tokenize_text(resume_text)
+    cache.set(cache_key, document.to_dict(), settings.RESUME_DOCUMENT_CACHE_TIMEOUT)
+    return document
+
+@memoize_in_scope
+def extract_keywords_from_text(text: Optional[Union[str, TokenizedText]]) -> Dict[str, List[str]]:
     """
     Extract keywords from text content.
     
     Args:
-        text: Text content to extract keywords from
+        text: Text content, or an already tokenized document, to extract keywords from
         
     Returns:
         Dictionary of extracted keywords by category
     """
-    text = text.lower()
-    
-    # Extract skills
-    skills = []
-    for category, skill_list in COMMON_TECH_SKILLS.items():
-        for skill in skill_list:
-            # Match whole words only
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text):
-                skills.append(skill)
-    
-    # Extract education
-    education = []
-    education_patterns = [
-        r'\b(bachelor|master|phd|doctorate|bs|ba|ms|ma|mba)\b',
-        r'\b(degree|diploma|certificate)\b',
-        r'\buniversity\s+of\s+\w+\b',
-        r'\b\w+\s+university\b',
-        r'\b\w+\s+college\b'
-    ]
-    
-    for pattern in education_patterns:
-        matches = re.findall(pattern, text)
-        education.extend(matches)
-    
-    # Extract experience
-    experience = []
-    experience_patterns = [
-        r'\b(\d+)\s+(year|yr)s?\b',
-        r'\b(senior|junior|lead|principal|staff)\b',
-        r'\b(manager|director|vp|chief|head)\b'
-    ]
-    
-    for pattern in experience_patterns:
-        matches = re.findall(pattern, text)
-        if isinstance(matches[0], tuple) if matches else False:
-            experience.extend([' '.join(match) for match in matches])
-        else:
-            experience.extend(matches)
+    skills = set()
+    education = set()
+    experience = set()
+    languages = set()
+    experience_years = 0
     
-    # Extract languages
-    languages = []
-    language_patterns = [
-        r'\b(english|spanish|french|german|chinese|japanese|russian|arabic|portuguese|italian)\b'
-    ]
-    
-    for pattern in language_patterns:
-        matches = re.findall(pattern, text)
-        languages.extend(matches)
+    for kind, value, _, _ in _as_document(text).tokens:
+        if kind == 'skill':
+            skills.add(value)
+        elif kind == 'years':
+            experience_years = max(experience_years, value)
+            experience.add(f"{value} years")
+        elif kind in ('degree', 'credential', 'institution'):
+            education.add(value)
+        elif kind == 'field':
+            education.add('degree')
+        elif kind in ('seniority', 'role'):
+            experience.add(value)
+        elif kind == 'language':
+            languages.add(value)
     
     return {
-        'skills': list(set(skills)),
-        'education': list(set(education)),
-        'experience': list(set(experience)),
-        'languages': list(set(languages))
+        'skills': skill_names(skills),
+        'education': sorted(education),
+        'experience': sorted(experience),
+        'experience_years': experience_years,
+        'languages': sorted(languages)
     }
 
-def extract_job_requirements(job_description: str) -> Dict[str, List[str]]:
+def _section_spans(headings: List[Tuple[str, str, int]]) -> Dict[str, List[Tuple[int, float]]]:
+    """
+    Locate the text spans covered by section headings.
+    
+    A section starts at the first occurrence of its heading and ends where the
+    next occurrence of any other heading begins.
+    
+    Args:
+        headings: (kind, heading, start) tuples in text order
+        
+    Returns:
+        Dictionary mapping 'required' and 'preferred' to lists of (start, end) spans
+    """
+    spans = {'required': [], 'preferred': []}
+    seen = set()
+    for index, (kind, heading, start) in enumerate(headings):
+        if heading in seen:
+            continue
+        seen.add(heading)
+        end = next((other_start for _, other, other_start in headings[index + 1:] if other != heading), float('inf'))
+        spans[kind].append((start, end))
+    return spans
+
+@memoize_in_scope
+def extract_job_requirements(job_description: Optional[Union[str, TokenizedText]]) -> Dict[str, List[str]]:
     """
     Extract required and preferred skills from a job description.
     
     Args:
-        job_description: Job description text
+        job_description: Job description text, or an already tokenized document
         
     Returns:
         Dictionary of required and preferred skills
     """
-    job_description = job_description.lower()
-    
-    # Extract required skills
-    required_skills = []
-    required_sections = [
-        r'required skills',
-        r'requirements',
-        r'qualifications',
-        r'what you need',
-        r'must have',
-        r'essential'
-    ]
-    
-    # Extract preferred skills
-    preferred_skills = []
-    preferred_sections = [
-        r'preferred skills',
-        r'nice to have',
-        r'desirable',
-        r'bonus points',
-        r'plus'
-    ]
-    
-    # Find all skills in the job description
-    all_skills = []
-    for category, skill_list in COMMON_TECH_SKILLS.items():
-        for skill in skill_list:
-            # Match whole words only
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, job_description):
-                all_skills.append(skill)
-    
-    # Categorize skills as required or preferred
-    for skill in all_skills:
-        # Check if skill is in a required section
-        is_required = False
-        for section in required_sections:
-            if re.search(section, job_description):
-                section_pos = re.search(section, job_description).start()
-                next_section_pos = float('inf')
-                
-                # Find the next section after this one
-                for other_section in required_sections + preferred_sections:
-                    if other_section != section:
-                        match = re.search(other_section, job_description[section_pos+len(section):])
-                        if match:
-                            next_section_pos = min(next_section_pos, section_pos + len(section) + match.start())
-                
-                # Check if skill is in this section
-                section_text = job_description[section_pos:next_section_pos]
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, section_text):
-                    required_skills.append(skill)
-                    is_required = True
-                    break
-        
-        # If not required, check if it's preferred
-        if not is_required:
-            for section in preferred_sections:
-                if re.search(section, job_description):
-                    section_pos = re.search(section, job_description).start()
-                    next_section_pos = float('inf')
-                    
-                    # Find the next section after this one
-                    for other_section in required_sections + preferred_sections:
-                        if other_section != section:
-                            match = re.search(other_section, job_description[section_pos+len(section):])
-                            if match:
-                                next_section_pos = min(next_section_pos, section_pos + len(section) + match.start())
-                    
-                    # Check if skill is in this section
-                    section_text = job_description[section_pos:next_section_pos]
-                    pattern = r'\b' + re.escape(skill) + r'\b'
-                    if re.search(pattern, section_text):
-                        preferred_skills.append(skill)
-                        break
+    skill_mentions = []
+    headings = []
+    experience_years = set()
+    education_requirements = set()
+    
+    for kind, value, start, end in _as_document(job_description).tokens:
+        if kind == 'skill':
+            skill_mentions.append((start, end, value))
+        elif kind in ('required', 'preferred'):
+            headings.append((kind, value, start))
+        elif kind == 'years':
+            experience_years.add(value)
+        elif kind in ('degree', 'field', 'subject'):
+            education_requirements.add(value)
+    
+    spans = _section_spans(headings)
+    
+    # Categorize skills as required or preferred based on the section they appear in
+    required_ids = set()
+    preferred_ids = set()
+    for start, end, skill_id in skill_mentions:
+        if any(span_start <= start and end <= span_end for span_start, span_end in spans['required']):
+            required_ids.add(skill_id)
+        elif any(span_start <= start and end <= span_end for span_start, span_end in spans['preferred']):
+            preferred_ids.add(skill_id)
+    
+    # A skill mentioned in any required section is never also preferred
+    preferred_ids -= required_ids
     
     # If no skills were categorized, assume all skills are required
-    if not required_skills and not preferred_skills:
-        required_skills = all_skills
-    
-    # Extract experience requirements
-    experience_requirements = []
-    experience_patterns = [
-        r'(\d+)[\+]?\s+(year|yr)s?(\s+of\s+experience)?',
-        r'experience\s+of\s+(\d+)[\+]?\s+(year|yr)s?',
-        r'(\d+)[\+]?\s+(year|yr)s?(\s+experience)?'
-    ]
-    
-    for pattern in experience_patterns:
-        matches = re.findall(pattern, job_description)
-        if matches:
-            for match in matches:
-                if isinstance(match, tuple):
-                    experience_requirements.append(f"{match[0]}+ years")
-                else:
-                    experience_requirements.append(match)
-    
-    # Extract education requirements
-    education_requirements = []
-    education_patterns = [
-        r'(bachelor|master|phd|doctorate|bs|ba|ms|ma|mba)(\s+degree)?',
-        r'degree\s+in\s+(\w+(\s+\w+)*)',
-        r'(computer science|engineering|information technology|data science)'
-    ]
-    
-    for pattern in education_patterns:
-        matches = re.findall(pattern, job_description)
-        if matches:
-            for match in matches:
-                if isinstance(match, tuple):
-                    education_requirements.append(match[0])
-                else:
-                    education_requirements.append(match)
+    if not required_ids and not preferred_ids:
+        required_ids = {skill_id for _, _, skill_id in skill_mentions}
     
     return {
-        'required_skills': list(set(required_skills)),
-        'preferred_skills': list(set(preferred_skills)),
-        'experience_requirements': list(set(experience_requirements)),
-        'education_requirements': list(set(education_requirements))
+        'required_skills': skill_names(required_ids),
+        'preferred_skills': skill_names(preferred_ids),
+        'experience_requirements': [f"{years}+ years" for years in sorted(experience_years)],
+        'required_experience_years': sorted(experience_years),
+        'education_requirements': sorted(education_requirements)
     }
 
+def _document_terms(document: TokenizedText) -> Tuple[str, ...]:
+    """
+    TF-IDF analyzer that reuses the terms produced by tokenize_text().
+    """
+    return document.terms
+
+@memoize_in_scope
 def calculate_job_fit_score(resume_path: str, job_description: str) -> float:
     """
     Calculate a fit score between a resume and a job description based on keyword matching.
@@ -295,19 +493,20 @@ def calculate_job_fit_score(resume_path: str, job_description: str) -> float:
         Fit score between 0.0 and 1.0
     """
     try:
-        # Extract text from resume
-        resume_text = extract_text_from_resume(resume_path)
-        if not resume_text:
+        # Tokenize resume and job description once for every extractor
+        resume_document = get_resume_document(resume_path)
+        if not resume_document:
             logger.error(f"Failed to extract text from resume: {resume_path}")
             return 0.0
+        job_document = _as_document(job_description)
         
         # Extract keywords from resume and job description
-        resume_keywords = extract_keywords_from_text(resume_text)
+        resume_keywords = extract_keywords_from_text(resume_document)
         job_requirements = extract_job_requirements(job_description)
         
         # Calculate match score for required skills
-        required_skills = set(job_requirements['required_skills'])
-        resume_skills = set(resume_keywords['skills'])
+        required_skills = skill_ids(job_requirements['required_skills'])
+        resume_skills = skill_ids(resume_keywords['skills'])
         
         if not required_skills:
             required_match_score = 1.0  # No required skills specified
@@ -316,7 +515,7 @@ def calculate_job_fit_score(resume_path: str, job_description: str) -> float:
             required_match_score = len(required_matches) / len(required_skills)
         
         # Calculate match score for preferred skills
-        preferred_skills = set(job_requirements['preferred_skills'])
+        preferred_skills = skill_ids(job_requirements['preferred_skills'])
         if not preferred_skills:
             preferred_match_score = 1.0  # No preferred skills specified
         else:
@@ -327,8 +526,8 @@ def calculate_job_fit_score(resume_path: str, job_description: str) -> float:
         fit_score = (required_match_score * 0.7) + (preferred_match_score * 0.3)
         
         # Use TF-IDF and cosine similarity as an additional measure
-        tfidf_vectorizer = TfidfVectorizer(stop_words='english')
-        tfidf_matrix = tfidf_vectorizer.fit_transform([resume_text, job_description])
+        tfidf_vectorizer = TfidfVectorizer(analyzer=_document_terms)
+        tfidf_matrix = tfidf_vectorizer.fit_transform([resume_document, job_document])
         cosine_sim = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
         
         # Combine keyword matching score with cosine similarity
@@ -340,6 +539,7 @@ def calculate_job_fit_score(resume_path: str, job_description: str) -> float:
         logger.exception(f"Error calculating job fit score: {str(e)}")
         return 0.0
 
+@memoize_in_scope
 def get_missing_skills(resume_path: str, job_description: str) -> List[str]:
     """
     Identify skills mentioned in the job description that are missing from the resume.
@@ -352,21 +552,21 @@ def get_missing_skills(resume_path: str, job_description: str) -> List[str]:
         List of missing skills
     """
     try:
-        # Extract text from resume
-        resume_text = extract_text_from_resume(resume_path)
-        if not resume_text:
+        # Tokenize resume (cached) and extract keywords
+        resume_document = get_resume_document(resume_path)
+        if not resume_document:
             logger.error(f"Failed to extract text from resume: {resume_path}")
             return []
         
         # Extract keywords from resume and job description
-        resume_keywords = extract_keywords_from_text(resume_text)
+        resume_keywords = extract_keywords_from_text(resume_document)
         job_requirements = extract_job_requirements(job_description)
         
         # Identify missing required skills
-        required_skills = set(job_requirements['required_skills'])
-        resume_skills = set(resume_keywords['skills'])
+        required_skills = skill_ids(job_requirements['required_skills'])
+        resume_skills = skill_ids(resume_keywords['skills'])
         
-        missing_skills = list(required_skills - resume_skills)
+        missing_skills = skill_names(required_skills - resume_skills)
         
         return missing_skills
         
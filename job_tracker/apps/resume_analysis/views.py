@@ -6,8 +6,9 @@ from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
 from django.contrib import messages
 
-from .utils import extract_text_from_resume, extract_keywords_from_text, calculate_job_fit_score, get_missing_skills
-from .models import ResumeKeywords, JobKeywords
+from .utils import extract_text_from_resume, extract_keywords_from_text, extract_job_requirements, calculate_job_fit_score, get_missing_skills, get_resume_document, skill_ids, skill_mask
+from .models import ResumeKeywords, JobKeywords, ResumeAnalysisStatus
+from .pipeline import queue_resume_analysis
 from ..linkedin_integration.models import LinkedInJob
 
 import logging
@@ -43,7 +44,9 @@ def analyze_resume(request):
                 'experience': keywords['experience'],
                 'education': keywords['education'],
                 'certifications': [],  # Not extracted in current implementation
-                'languages': keywords['languages']
+                'languages': keywords['languages'],
+                'experience_years': keywords['experience_years'],
+                'skill_mask': skill_mask(skill_ids(keywords['skills']))
             }
         )
         
@@ -82,15 +85,13 @@ def job_match_analysis(request, job_id):
         missing_skills = get_missing_skills(resume_path, job.description)
         
         # Extract job requirements
-        from .utils import extract_job_requirements
         job_requirements = extract_job_requirements(job.description)
         
         # Get resume keywords
         resume_keywords = ResumeKeywords.objects.filter(user=request.user).first()
         if not resume_keywords:
             # Analyze resume if not already analyzed
-            resume_text = extract_text_from_resume(resume_path)
-            keywords = extract_keywords_from_text(resume_text)
+            keywords = extract_keywords_from_text(get_resume_document(resume_path))
             resume_keywords = ResumeKeywords.objects.create(
                 user=request.user,
                 skills=keywords['skills'],
@@ -192,3 +193,45 @@ def api_calculate_fit_score(request):
     except Exception as e:
         logger.exception(f"Error calculating fit score: {str(e)}")
         return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def api_analysis_status(request):
+    """
+    API endpoint for polling the progress of background resume analysis.
+    """
+    status = ResumeAnalysisStatus.objects.filter(user=request.user).first()
+    if not status:
+        return JsonResponse({'success': True, 'status': None})
+    
+    return JsonResponse({
+        'success': True,
+        'status': status.status,
+        'stage': status.stage,
+        'progress': status.progress,
+        'resume_name': status.resume_name,
+        'matches_rescored': status.matches_rescored,
+        'error_message': status.error_message,
+        'queued_at': status.queued_at.isoformat() if status.queued_at else None,
+        'started_at': status.started_at.isoformat() if status.started_at else None,
+        'completed_at': status.completed_at.isoformat() if status.completed_at else None
+    })
+
+@login_required
+def api_queue_analysis(request):
+    """
+    API endpoint for queueing background analysis of the user's resume.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    if not hasattr(request.user, 'profile') or not request.user.profile.resume:
+        return JsonResponse({'error': 'No resume found'}, status=400)
+    
+    status = queue_resume_analysis(request.user)
+    
+    return JsonResponse({
+        'success': True,
+        'status': status.status,
+        'stage': status.stage,
+        'progress': status.progress
+    }, status=202)
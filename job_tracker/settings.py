@@ -60,6 +60,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'job_tracker.apps.resume_analysis.middleware.AnalysisScopeMiddleware',
 ]
 
 ROOT_URLCONF = 'job_tracker.urls'
@@ -183,6 +184,89 @@ OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
 # File upload settings
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10 MB
 
+# Resume analysis settings
+RESUME_DOCUMENT_CACHE_TIMEOUT = int(os.environ.get('RESUME_DOCUMENT_CACHE_TIMEOUT', 24 * 60 * 60))  # Seconds
+RESUME_ANALYSIS_BACKEND = os.environ.get('RESUME_ANALYSIS_BACKEND', 'thread')  # 'thread' or 'celery'
+RESUME_ANALYSIS_WORKERS = int(os.environ.get('RESUME_ANALYSIS_WORKERS', 2))
+RESUME_PROFILE_MODEL = os.environ.get('RESUME_PROFILE_MODEL', '')  # e.g. 'accounts.Profile'
+
+# LinkedIn API settings
+LINKEDIN_API = {
+    'TRANSPORT': os.environ.get('LINKEDIN_API_TRANSPORT', 'data_api'),  # 'data_api', 'http', 'record' or 'replay'
+    'BASE_URL': os.environ.get('LINKEDIN_API_BASE_URL', ''),
+    'CASSETTE': os.environ.get('LINKEDIN_API_CASSETTE', ''),  # Cassette file for 'record' and 'replay'
+    'RECORD_TRANSPORT': os.environ.get('LINKEDIN_API_RECORD_TRANSPORT', 'data_api'),
+    'REPLAY_LATENCY': os.environ.get('LINKEDIN_API_REPLAY_LATENCY', 'none'),  # 'none', 'recorded' or seconds
+    'POOL_SIZE': int(os.environ.get('LINKEDIN_API_POOL_SIZE', 10)),
+    'POOL_TIMEOUT': float(os.environ.get('LINKEDIN_API_POOL_TIMEOUT', 30)),  # Seconds
+    'CONNECT_TIMEOUT': float(os.environ.get('LINKEDIN_API_CONNECT_TIMEOUT', 5)),  # Seconds
+    'READ_TIMEOUT': float(os.environ.get('LINKEDIN_API_READ_TIMEOUT', 30)),  # Seconds
+    'MAX_CONCURRENCY': int(os.environ.get('LINKEDIN_API_MAX_CONCURRENCY', 8)),
+    'PAGE_SIZE': 10,
+}
+
+# LinkedIn API rate limits, shared by all workers through the chosen backend
+LINKEDIN_RATE_LIMITS = {
+    'BACKEND': os.environ.get('LINKEDIN_RATE_LIMIT_BACKEND', 'local'),  # 'local', 'redis' or 'database'
+    'REDIS_URL': os.environ.get('LINKEDIN_RATE_LIMIT_REDIS_URL', 'redis://localhost:6379/0'),
+    'KEY_PREFIX': 'linkedin:ratelimit',
+    'LIMITS': {  # Requests per second and burst size across all accounts
+        'search': {'rate': 5.0, 'burst': 10},
+        'details': {'rate': 5.0, 'burst': 10},
+        'apply': {'rate': 1.0, 'burst': 5},
+    },
+    'ACCOUNT_LIMITS': {  # Requests per second and burst size per account
+        'apply': {'rate': 0.5, 'burst': 1},
+    },
+}
+
+# LinkedIn job search result cache; 'django' shares results through the CACHES alias
+LINKEDIN_SEARCH_CACHE = {
+    'BACKEND': os.environ.get('LINKEDIN_SEARCH_CACHE_BACKEND', 'local'),  # 'local' or 'django'
+    'CACHE_ALIAS': 'default',
+    'TTL': int(os.environ.get('LINKEDIN_SEARCH_CACHE_TTL', 300)),  # Seconds; 0 disables the cache
+    'MAX_ENTRIES': 1024,
+    'LOCK_TIMEOUT': 30,  # Seconds
+}
+
+# LinkedIn API retries and circuit breakers
+LINKEDIN_API_RESILIENCE = {
+    'ATTEMPTS': {'search': 4, 'details': 4, 'apply': 1},  # Only idempotent calls are retried
+    'BACKOFF_INITIAL': 0.5,  # Seconds
+    'BACKOFF_MAX': 10,  # Seconds
+    'BREAKER_FAILURE_THRESHOLD': int(os.environ.get('LINKEDIN_BREAKER_FAILURE_THRESHOLD', 5)),
+    'BREAKER_RECOVERY_TIMEOUT': int(os.environ.get('LINKEDIN_BREAKER_RECOVERY_TIMEOUT', 30)),  # Seconds
+}
+
+# LinkedIn job detail hydration
+LINKEDIN_JOB_DETAILS = {
+    'MAX_AGE': int(os.environ.get('LINKEDIN_JOB_DETAILS_MAX_AGE', 24 * 60 * 60)),  # Seconds before details are refreshed
+    'BATCH_SIZE': int(os.environ.get('LINKEDIN_JOB_DETAILS_BATCH_SIZE', 50)),  # Jobs fetched concurrently per batch
+}
+
+# Automated application settings
+AUTOMATED_APPLICATION_SEARCH_RESULTS = int(os.environ.get('AUTOMATED_APPLICATION_SEARCH_RESULTS', 50))
+AUTOMATED_APPLICATION_WORKERS = int(os.environ.get('AUTOMATED_APPLICATION_WORKERS', 4))  # Default --workers; users only take turns submitting while their runs overlap
+AUTOMATED_APPLICATION_MAX_WORKERS = int(os.environ.get('AUTOMATED_APPLICATION_MAX_WORKERS', 16))  # Cap on --workers
+AUTOMATED_APPLICATION_USER_LOCK_TIMEOUT = 60 * 60  # Seconds a user's run lock is held at most
+AUTOMATED_APPLICATION_LEASE_SECONDS = int(os.environ.get('AUTOMATED_APPLICATION_LEASE_SECONDS', 300))  # Renewed by heartbeats
+AUTOMATED_APPLICATION_DAEMON_POLL_INTERVAL = 10  # Seconds between daemon polls for edited schedules
+AUTOMATED_APPLICATION_DAEMON_RETRY_INTERVAL = 60  # Seconds before the daemon retries a schedule that did not run
+AUTOMATED_APPLICATION_LETTER_WORKERS = int(os.environ.get('AUTOMATED_APPLICATION_LETTER_WORKERS', 2))  # Per run
+AUTOMATED_APPLICATION_SUBMIT_WORKERS = int(os.environ.get('AUTOMATED_APPLICATION_SUBMIT_WORKERS', 4))  # Submissions a run has queued at once
+AUTOMATED_APPLICATION_SUBMITTERS = int(os.environ.get('AUTOMATED_APPLICATION_SUBMITTERS', 4))  # Threads submitting for all runs in the process
+AUTOMATED_APPLICATION_SUBMIT_DEADLINE = 10 * 60  # Seconds a queued submission waits before it goes ahead of other users' turns
+AUTOMATED_APPLICATION_PIPELINE_QUEUE_SIZE = 4  # Jobs waiting in front of each pipeline stage
+AUTOMATED_APPLICATION_TRACE_MEMORY = os.environ.get('AUTOMATED_APPLICATION_TRACE_MEMORY', 'False').lower() == 'true'  # Peak memory from tracemalloc instead of RSS
+AUTOMATED_APPLICATION_EVENT_BATCH_SIZE = 50  # Run log lines written per query at most
+AUTOMATED_APPLICATION_EVENT_FLUSH_INTERVAL = 2  # Seconds between writes of buffered run log lines
+AUTOMATED_APPLICATION_EVENT_STREAM_TIMEOUT = 300  # Seconds a run event stream stays open
+AUTOMATED_APPLICATION_RUN_STALE_SECONDS = int(os.environ.get('AUTOMATED_APPLICATION_RUN_STALE_SECONDS', 15 * 60))  # Runs without progress for this long are resumed
+AUTOMATED_APPLICATION_RECORD_BATCH_SIZE = 50  # Job outcomes written per batch at most
+AUTOMATED_APPLICATION_RECORD_MAX_DELAY = 60  # Seconds a job outcome waits to be written at most
+AUTOMATED_APPLICATION_DRY_RUN_SUBMIT_LATENCY = 0.0  # Seconds a simulated submission takes in dry runs
+AUTOMATED_APPLICATION_JITTER_WINDOW = int(os.environ.get('AUTOMATED_APPLICATION_JITTER_WINDOW', 30 * 60))  # Seconds after their time of day that schedules are spread over; 0 disables
+
 # Logging configuration
 LOGGING = {
     'version': 1,